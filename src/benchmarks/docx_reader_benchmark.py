@@ -0,0 +1,86 @@
+"""
+Compare python-docx paragraph access with the streaming DocxParagraphReader on large synthetic resumes.
+
+Usage (from src/):
+    python -m benchmarks.docx_reader_benchmark --roles 50 500 2000
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+from docx import Document
+from core.parsing.readers.base_reader import ResumeParagraph
+from core.parsing.readers.docx_reader import DocxParagraphReader
+
+
+def build_synthetic_resume(path_to_file: Path, roles: int, bullets_per_role: int = 6) -> None:
+    doc = Document()
+    for line in ["Jane Doe", "Seattle, WA", "555-0100 ∙ jane.doe@example.com ∙ linkedin.com/in/jane", "Authorized to work in the US"]:
+        doc.add_paragraph(line)
+    doc.add_heading("PROFESSIONAL SUMMARY", level=1)
+    doc.add_paragraph("Test automation engineer focused on reliable CI pipelines.")
+    doc.add_heading("PROFESSIONAL EXPERIENCE", level=1)
+    for role in range(roles):
+        doc.add_paragraph(f"QA Automation Engineer 01/{2000 + role % 25} - 12/{2001 + role % 25}")
+        doc.add_paragraph(f"Company {role} | Remote")
+        doc.add_paragraph(f"Company {role} builds developer tooling.")
+        for bullet in range(bullets_per_role):
+            doc.add_paragraph(f"Automated regression suite {bullet} with Python and Playwright for team {role}.", style="List Bullet")
+    doc.add_heading("EDUCATION", level=1)
+    doc.add_paragraph("State University, USA")
+    doc.save(str(path_to_file))
+
+
+def read_with_python_docx(path_to_file: Path) -> list[ResumeParagraph]:
+    doc = Document(str(path_to_file))
+    return [
+        ResumeParagraph(paragraph.style.name if paragraph.style else None, paragraph.text)
+        for paragraph in doc.paragraphs
+    ]
+
+
+def read_with_streaming_reader(path_to_file: Path) -> list[ResumeParagraph]:
+    return list(DocxParagraphReader(path_to_file).read_paragraphs())
+
+
+def measure(reader: Callable[[Path], list[ResumeParagraph]], path_to_file: Path, repeats: int) -> tuple[float, int, list[ResumeParagraph]]:
+    """Return best wall time in seconds, peak traced memory in bytes and the paragraphs read."""
+    best = float("inf")
+    paragraphs: list[ResumeParagraph] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        paragraphs = reader(path_to_file)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    reader(path_to_file)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, paragraphs
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--roles", type=int, nargs="+", default=[50, 500, 2000])
+    arg_parser.add_argument("--repeats", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print(f"{'roles':>8} {'paragraphs':>11} {'python-docx s':>14} {'streaming s':>12} {'speedup':>8} {'python-docx MiB':>16} {'streaming MiB':>14}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for roles in args.roles:
+            path_to_file = Path(tmp_dir) / f"resume_{roles}.docx"
+            build_synthetic_resume(path_to_file, roles)
+            docx_time, docx_peak, expected = measure(read_with_python_docx, path_to_file, args.repeats)
+            stream_time, stream_peak, actual = measure(read_with_streaming_reader, path_to_file, args.repeats)
+            if actual != expected:
+                raise AssertionError(f"Streaming reader output differs from python-docx for {roles} roles")
+            print(
+                f"{roles:>8} {len(expected):>11} {docx_time:>14.3f} {stream_time:>12.3f} {docx_time / stream_time:>7.1f}x "
+                f"{docx_peak / 2**20:>16.1f} {stream_peak / 2**20:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
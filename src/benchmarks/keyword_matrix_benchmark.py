@@ -0,0 +1,81 @@
+"""
+Compare per-pair keyword coverage loops with the batched KeywordCoverageMatrix on synthetic resumes and jobs.
+
+Usage (from the repository root, so that configs/settings.json resolves):
+    PYTHONPATH=src python -m benchmarks.keyword_matrix_benchmark --resumes 1000 --jobs 1000 --keywords 300
+"""
+import argparse
+import random
+import time
+import numpy as np
+from core.analysis.keyword_coverage_matrix import KeywordCoverageMatrix, KeywordVocabulary
+
+FILLER_WORDS = ["built", "owned", "improved", "reliable", "pipelines", "for", "the", "team", "across", "services", "with", "and", "daily"]
+
+
+def build_synthetic_texts(keywords: list[str], count: int, words_per_text: int, keyword_share: float, rng: random.Random) -> list[str]:
+    texts = []
+    for _ in range(count):
+        words = [rng.choice(keywords) if rng.random() < keyword_share else rng.choice(FILLER_WORDS) for _ in range(words_per_text)]
+        texts.append(" ".join(words))
+    return texts
+
+
+def loop_overall_coverage(resume_counts: list[dict[int, int]], job_counts: list[dict[int, int]]) -> np.ndarray:
+    """Reference implementation: one Python loop per (resume, job, keyword)."""
+    coverage = np.ones((len(resume_counts), len(job_counts)), dtype=np.float32)
+    for j, job in enumerate(job_counts):
+        required = sum(job.values())
+        if not required:
+            continue
+        for r, resume in enumerate(resume_counts):
+            coverage[r, j] = sum(min(resume.get(column, 0), quantity) for column, quantity in job.items()) / required
+    return coverage
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--resumes", type=int, default=1000)
+    arg_parser.add_argument("--jobs", type=int, default=1000)
+    arg_parser.add_argument("--keywords", type=int, default=300)
+    arg_parser.add_argument("--loop-sample", type=int, default=100, help="Resumes x jobs side of the grid timed with the reference loop")
+    arg_parser.add_argument("--seed", type=int, default=7)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(args.seed)
+    keywords = [f"skill{index}" if index % 3 else f"skill{index} testing" for index in range(args.keywords)]
+    vocabulary = KeywordVocabulary(keywords)
+
+    start = time.perf_counter()
+    resume_texts = build_synthetic_texts(keywords, args.resumes, 600, 0.15, rng)
+    job_texts = build_synthetic_texts(keywords, args.jobs, 300, 0.1, rng)
+    generate_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matrix = KeywordCoverageMatrix.from_texts(vocabulary, resume_texts, job_texts)
+    tokenize_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    coverage = matrix.overall_coverage()
+    batched_time = time.perf_counter() - start
+
+    sample = min(args.loop_sample, args.resumes, args.jobs)
+    resume_counts = [{int(column): int(row[column]) for column in np.flatnonzero(row)} for row in matrix.resume_counts[:sample]]
+    job_counts = [{int(column): int(row[column]) for column in np.flatnonzero(row)} for row in matrix.job_counts[:sample]]
+    start = time.perf_counter()
+    expected = loop_overall_coverage(resume_counts, job_counts)
+    loop_time = time.perf_counter() - start
+    if not np.allclose(coverage[:sample, :sample], expected, atol=1e-5):
+        raise AssertionError("Batched coverage differs from the reference loop")
+    loop_full_time = loop_time * (args.resumes * args.jobs) / (sample * sample)
+
+    print(f"grid: {args.resumes} resumes x {args.jobs} jobs x {len(vocabulary)} keywords")
+    print(f"synthetic texts:            {generate_time:>8.3f} s")
+    print(f"tokenize + count matrices:  {tokenize_time:>8.3f} s")
+    print(f"batched overall coverage:   {batched_time:>8.3f} s")
+    print(f"reference loop (projected): {loop_full_time:>8.3f} s  ({loop_time:.3f} s for {sample}x{sample})")
+    print(f"speedup:                    {loop_full_time / batched_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
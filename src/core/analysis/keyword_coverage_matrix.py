@@ -0,0 +1,117 @@
+import re
+from typing import Iterable, Optional, Sequence
+import numpy as np
+from core.jobscan.ats_estimator import AtsKeywordEstimator
+from core.jobscan.models.jobscan_match_report import JobscanMatchReport
+from core.parsing.models.job_to_target import JobDetails
+from core.parsing.models.resume import ResumeLite
+
+
+class KeywordVocabulary:
+    """Shared keyword columns; keywords are matched as lowercase token sequences (n-grams)."""
+    TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9]+)*")
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: list[str] = []
+        self.columns: dict[tuple[str, ...], int] = {}
+        for keyword in keywords:
+            tokens = self.tokenize(keyword)
+            if tokens and tokens not in self.columns:
+                self.columns[tokens] = len(self.keywords)
+                self.keywords.append(keyword)
+        self.ngram_lengths = sorted({len(tokens) for tokens in self.columns})
+
+    @classmethod
+    def from_match_reports(cls, match_reports: Iterable[JobscanMatchReport]) -> "KeywordVocabulary":
+        names: list[str] = []
+        for match_report in match_reports:
+            for skills in (match_report.hard_skills, match_report.soft_skills):
+                names.extend(skill.name for skills_for_type in skills.values() for skill in skills_for_type if skill.name)
+        return cls(names)
+
+    @classmethod
+    def tokenize(cls, text: str) -> tuple[str, ...]:
+        return tuple(cls.TOKEN_PATTERN.findall(text.lower()))
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def get_column(self, keyword: str) -> int:
+        column = self.columns.get(self.tokenize(keyword))
+        if column is None:
+            raise KeyError(f"'{keyword}' is not in the vocabulary")
+        return column
+
+    def count_terms(self, texts: Sequence[str], dtype: type = np.int32) -> np.ndarray:
+        """Tokenize every text once and return a (len(texts), len(vocabulary)) matrix of keyword occurrence counts."""
+        counts = np.zeros((len(texts), len(self.keywords)), dtype=dtype)
+        for row, text in enumerate(texts):
+            tokens = self.tokenize(text)
+            for n in self.ngram_lengths:
+                for start in range(len(tokens) - n + 1):
+                    column = self.columns.get(tokens[start:start + n])
+                    if column is not None:
+                        counts[row, column] += 1
+        return counts
+
+
+class KeywordCoverageMatrix:
+    """
+    Term counts of R resumes and J job descriptions over one keyword vocabulary, answering
+    "how well does resume r cover keyword k of job j" for every (r, j, k) in batched NumPy operations.
+    Coverage of one keyword is min(resume count, job count) / job count, and 1.0 when the job does not mention it.
+    """
+
+    def __init__(self, vocabulary: KeywordVocabulary, resume_counts: np.ndarray, job_counts: np.ndarray):
+        self.vocabulary = vocabulary
+        self.resume_counts = resume_counts
+        self.job_counts = job_counts
+
+    @classmethod
+    def from_texts(cls, vocabulary: KeywordVocabulary, resume_texts: Sequence[str], job_texts: Sequence[str]) -> "KeywordCoverageMatrix":
+        return cls(vocabulary, vocabulary.count_terms(resume_texts), vocabulary.count_terms(job_texts))
+
+    @classmethod
+    def from_models(cls, vocabulary: KeywordVocabulary, resumes: Sequence[ResumeLite], jobs: Sequence[JobDetails]) -> "KeywordCoverageMatrix":
+        return cls.from_texts(
+            vocabulary,
+            [AtsKeywordEstimator.get_resume_text(resume) for resume in resumes],
+            ["\n".join(job.description_details) for job in jobs]
+        )
+
+    def coverage(self, keywords: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        (R, J, K) coverage tensor for the given keywords (all by default).
+        Memory grows with R * J * K, so pass a keyword subset for large corpora.
+        """
+        columns = [self.vocabulary.get_column(keyword) for keyword in keywords] if keywords is not None else slice(None)
+        resume_counts = self.resume_counts[:, columns].astype(np.float32)
+        job_counts = self.job_counts[:, columns].astype(np.float32)
+        covered = np.minimum(resume_counts[:, None, :], job_counts[None, :, :])
+        return np.divide(covered, job_counts[None, :, :], out=np.ones_like(covered), where=job_counts[None, :, :] > 0)
+
+    def keyword_coverage(self, keyword: str) -> np.ndarray:
+        """(R, J) coverage of a single keyword."""
+        return self.coverage([keyword])[:, :, 0]
+
+    def covered_occurrences(self) -> np.ndarray:
+        """
+        (R, J) sum over keywords of min(resume count, job count).
+        Uses min(a, b) = sum over t >= 1 of [a >= t] * [b >= t], so the whole grid is a few matrix products
+        (one per distinct count level) instead of an R * J * K broadcast.
+        """
+        max_level = int(min(self.resume_counts.max(initial=0), self.job_counts.max(initial=0)))
+        covered = np.zeros((self.resume_counts.shape[0], self.job_counts.shape[0]), dtype=np.float32)
+        for level in range(1, max_level + 1):
+            covered += (self.resume_counts >= level).astype(np.float32) @ (self.job_counts >= level).astype(np.float32).T
+        return covered
+
+    def overall_coverage(self) -> np.ndarray:
+        """(R, J) share of each job's keyword occurrences covered by each resume; 1.0 for jobs without vocabulary keywords."""
+        required = self.job_counts.sum(axis=1).astype(np.float32)[None, :]
+        covered = self.covered_occurrences()
+        return np.divide(covered, required, out=np.ones_like(covered), where=required > 0)
+
+    def missing_occurrences(self) -> np.ndarray:
+        """(R, J) number of keyword occurrences each resume still lacks for each job."""
+        return self.job_counts.sum(axis=1).astype(np.float32)[None, :] - self.covered_occurrences()
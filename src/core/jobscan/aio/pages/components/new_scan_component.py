@@ -0,0 +1,57 @@
+from playwright.async_api import Locator, Page, expect
+from core.jobscan.pages.components.new_scan_component import NewScanComponent
+from core.utils.async_ui_helpers import AsyncPlaywrightHelper
+from core.services.config.models.settings import ResumeSettings
+from core.parsing.models.job_to_target import JobDetails
+
+
+class AsyncNewScanComponent:
+    def __init__(self, container: Locator, page: Page, playwright_helper: AsyncPlaywrightHelper, resume_settings: ResumeSettings) -> None:
+        self.container = container
+        self.page = page
+        self.playwright_helper = playwright_helper
+        self.resume_settings = resume_settings
+
+    @property
+    def resume_text_area(self) -> Locator:
+        return self.container.locator(NewScanComponent.RESUME_TEXT_AREA_SELECTOR)
+
+    @property
+    def resume_drag_and_drop_button(self) -> Locator:
+        return self.container.locator(NewScanComponent.RESUME_DRAG_AND_DROP_BUTTON_SELECTOR)
+
+    @property
+    def job_description_text_area(self) -> Locator:
+        return self.container.locator(NewScanComponent.JOB_DESCRIPTION_TEXT_AREA_SELECTOR)
+
+    @property
+    def scan_button(self) -> Locator:
+        return self.container.locator(NewScanComponent.SCAN_BUTTON_SELECTOR)
+
+    @property
+    def loading_overlay(self) -> Locator:
+        return self.container.locator(NewScanComponent.LOADING_OVERLAY_SELECTOR)
+
+    async def upload_resume(self, path_to_resume: str) -> None:
+        await self.playwright_helper.human_like_mouse_move_and_click(self.page, self.resume_text_area)
+        async with self.page.expect_file_chooser() as fch:
+            await self.playwright_helper.delayed_hover_and_click(self.resume_drag_and_drop_button)
+        file_chooser = await fch.value
+        await file_chooser.set_files(path_to_resume)
+
+    async def scan(self, path_to_resume: str, job_details: JobDetails) -> None:
+        await self.upload_resume(path_to_resume)
+        await self.playwright_helper.human_like_fill_data(self.page, self.job_description_text_area, str(job_details))
+        await expect(self.scan_button).to_be_enabled(timeout=2000)
+        previous_url = self.page.url
+        await self.playwright_helper.human_like_mouse_move_and_click(self.page, self.scan_button)
+        await self.wait_for_scan_to_start(previous_url)
+        await self.loading_overlay.wait_for(state="hidden", timeout=self.playwright_helper.page_ready_timeout_ms)
+
+    async def wait_for_scan_to_start(self, previous_url: str) -> None:
+        """See NewScanComponent.wait_for_scan_to_start."""
+        await self.page.wait_for_function(
+            NewScanComponent.SCAN_STARTED_PREDICATE,
+            arg=previous_url,
+            timeout=self.playwright_helper.page_ready_timeout_ms
+        )
@@ -0,0 +1,30 @@
+from playwright.async_api import Page, Locator, expect
+from core.jobscan.models.jobscan_match_report import SkillType, Skill
+from core.jobscan.pages.components.skills_analyzer_component import SkillsAnalyzerComponent
+from core.utils.async_ui_helpers import AsyncPlaywrightHelper
+from core.utils.normalization_helpers import SkillWhitelistIndex
+
+
+class AsyncSkillsAnalyzerComponent:
+    def __init__(self, page: Page, playwright_helper: AsyncPlaywrightHelper, container: Locator, skill_type: SkillType) -> None:
+        self.page = page
+        self.playwright_helper = playwright_helper
+        self.container = container
+        self.skill_type = skill_type
+
+    @property
+    def show_more_button(self) -> Locator:
+        return self.container.locator(SkillsAnalyzerComponent.SHOW_MORE_BUTTON_SELECTOR)
+
+    @property
+    def name_columns(self) -> Locator:
+        return self.container.locator(SkillsAnalyzerComponent.NAME_COLUMN_SELECTOR)
+
+    async def process_skills(self, whitelisted_skills: SkillWhitelistIndex) -> list[Skill]:
+        if await self.playwright_helper.exists(self.show_more_button):
+            rows_before = await self.name_columns.count()
+            await self.playwright_helper.human_like_mouse_move_and_click(self.page, self.show_more_button, passive=True)
+            await expect(self.name_columns).not_to_have_count(rows_before, timeout=self.playwright_helper.page_ready_timeout_ms)
+
+        rows = await self.container.evaluate(SkillsAnalyzerComponent.TABLE_ROWS_SCRIPT)
+        return SkillsAnalyzerComponent.build_skills(rows, self.skill_type, whitelisted_skills)
@@ -0,0 +1,25 @@
+from playwright.async_api import Page
+from core.utils.async_ui_helpers import AsyncPlaywrightHelper
+from core.jobscan.pages.dashboard_page import DashboardPage
+from core.jobscan.aio.pages.match_report_page import AsyncMatchReportPage
+from core.jobscan.aio.pages.components.new_scan_component import AsyncNewScanComponent
+from core.services.config.models.settings import JobscanSettings, ResumeSettings
+from core.parsing.models.job_to_target import JobDetails
+
+
+class AsyncDashboardPage:
+    def __init__(self, page: Page, playwright_helper: AsyncPlaywrightHelper, jobscan_settings: JobscanSettings, resume_settings: ResumeSettings):
+        self.page = page
+        self.jobscan_settings = jobscan_settings
+        self.playwright_helper = playwright_helper
+        self.resume_settings = resume_settings
+        self.new_scan_component = AsyncNewScanComponent(
+            container=self.page.locator(DashboardPage.NEW_SCAN_CONTAINER_SELECTOR),
+            page=self.page,
+            playwright_helper=self.playwright_helper,
+            resume_settings=self.resume_settings)
+
+    async def scan(self, path_to_resume: str, job_details: JobDetails) -> AsyncMatchReportPage:
+        await self.new_scan_component.scan(path_to_resume, job_details)
+        await self.page.wait_for_url(self.jobscan_settings.match_report_url_pattern, timeout=self.playwright_helper.page_ready_timeout_ms)
+        return AsyncMatchReportPage(page=self.page, playwright_helper=self.playwright_helper, jobscan_settings=self.jobscan_settings, resume_settings=self.resume_settings, job_details=job_details)
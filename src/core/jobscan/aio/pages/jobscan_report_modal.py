@@ -0,0 +1,28 @@
+from playwright.async_api import Page
+from core.jobscan.pages.jobscan_report_modal import JobscanReportModal
+from core.utils.async_ui_helpers import AsyncPlaywrightHelper
+
+
+class AsyncJobscanReportModal:
+    def __init__(self, page: Page, playwright_helper: AsyncPlaywrightHelper):
+        self.page = page
+        self.playwright_helper = playwright_helper
+        self.modal = self.page.locator(JobscanReportModal.MODAL_SELECTOR)
+        self.dismiss_button = self.modal.locator(JobscanReportModal.DISMISS_BUTTON_SELECTOR)
+
+    async def is_visible(self, timeout_ms: int = 5000) -> bool:
+        try:
+            return await self.modal.is_visible(timeout=timeout_ms)
+        except Exception:
+            return False
+
+    async def dismiss_if_present(self, timeout_ms: int = 5000) -> bool:
+        if not await self.is_visible(timeout_ms):
+            return False
+        try:
+            await self.playwright_helper.human_like_mouse_move_and_click(self.page, self.dismiss_button, passive=True)
+        except Exception:
+            await self.page.keyboard.press("Escape")
+
+        await self.modal.wait_for(state="hidden", timeout=2000)
+        return True
@@ -0,0 +1,129 @@
+from __future__ import annotations
+from playwright.async_api import Page, Locator, expect
+from core.parsing.models.job_to_target import JobDetails
+from core.utils.async_ui_helpers import AsyncPlaywrightHelper
+from core.jobscan.aio.pages.jobscan_report_modal import AsyncJobscanReportModal
+from core.jobscan.aio.pages.components.new_scan_component import AsyncNewScanComponent
+from core.jobscan.aio.pages.components.skills_analyzer_component import AsyncSkillsAnalyzerComponent
+from core.jobscan.models.jobscan_match_report import Check, JobscanMatchReport, MetricFinding, Skill, SkillType
+from core.jobscan.pages.match_report_page import MatchReportPage
+from core.services.config.models.settings import JobscanSettings, ResumeSettings
+from core.utils.normalization_helpers import SkillWhitelistIndex
+
+
+class AsyncMatchReportPage:
+    """asyncio counterpart of MatchReportPage; selectors, DOM scripts and finding builders are shared with it."""
+
+    def __init__(self, page: Page, playwright_helper: AsyncPlaywrightHelper, jobscan_settings: JobscanSettings, resume_settings: ResumeSettings, job_details: JobDetails) -> None:
+        self.page = page
+        self.playwright_helper = playwright_helper
+        self.jobscan_settings = jobscan_settings
+        self.resume_settings = resume_settings
+        self.job_details = job_details
+        self.jobscan_report_modal = AsyncJobscanReportModal(self.page, self.playwright_helper)
+
+        self.title = self.page.locator(MatchReportPage.TITLE_SELECTOR)
+        self.scan_sidebar_container = self.page.locator(MatchReportPage.SCAN_SIDEBAR_SELECTOR)
+        self.score = self.scan_sidebar_container.locator(MatchReportPage.SCORE_SELECTOR)
+        self.upload_and_rescan_button = self.scan_sidebar_container.locator(MatchReportPage.UPLOAD_AND_RESCAN_BUTTON_SELECTOR)
+        # Searchability
+        self.searchability_container = self.page.locator(MatchReportPage.SEARCHABILITY_SELECTOR)
+        self.searchability_metrics = self.page.locator(MatchReportPage.SEARCHABILITY_SELECTOR + MatchReportPage.FINDINGS_SUFFIX_SELECTOR)
+        # Hard Skills
+        self.hard_skills_container = self.page.locator(MatchReportPage.HARD_SKILLS_SELECTOR)
+        # Soft Skills
+        self.soft_skills_container = self.page.locator(MatchReportPage.SOFT_SKILLS_SELECTOR)
+        # Recruiter tips
+        self.recruiter_tips_container = self.page.locator(MatchReportPage.RECRUITER_TIPS_SELECTOR)
+        self.recruiter_tips_metrics = self.page.locator(MatchReportPage.RECRUITER_TIPS_SELECTOR + MatchReportPage.FINDINGS_SUFFIX_SELECTOR)
+        # Formatting
+        self.formatting_container = self.page.locator(MatchReportPage.FORMATTING_SELECTOR)
+        self.formatting_metrics = self.page.locator(MatchReportPage.FORMATTING_SELECTOR + MatchReportPage.FINDINGS_SUFFIX_SELECTOR)
+
+        self.new_scan_component = AsyncNewScanComponent(
+            container=self.page.locator(MatchReportPage.NEW_SCAN_CONTAINER_SELECTOR),
+            page=self.page,
+            playwright_helper=self.playwright_helper,
+            resume_settings=self.resume_settings)
+
+    async def _wait_for_match_report_page_to_load(self) -> None:
+        await self.title.wait_for(state="visible", timeout=3000)
+        await self.upload_and_rescan_button.wait_for(state="visible", timeout=3000)
+        await self.playwright_helper.wait_for_dom_quiet(self.page, required_selectors=MatchReportPage.REPORT_READY_SELECTORS)
+
+    async def process_match_report(self, iteration: int = 1) -> JobscanMatchReport:
+        await self._wait_for_match_report_page_to_load()
+        await self.jobscan_report_modal.dismiss_if_present()
+
+        jobscan_match_report = JobscanMatchReport(job_title=self.job_details.title, company=self.job_details.company, iteration=iteration, score=int(await self.score.inner_text()), report_url=self.page.url)
+        jobscan_match_report.metrics.update(await self._check_and_process_metric(self.searchability_container, self.searchability_metrics))
+        hard_skills = await self._process_skills(SkillType.HARD_SKILL, self.resume_settings.get_hard_skills_whitelist_index)
+        soft_skills = await self._process_skills(SkillType.SOFT_SKILL, self.resume_settings.get_soft_skills_whitelist_index)
+        jobscan_match_report.hard_skills = MatchReportPage.group_skills_by_appliance_type(hard_skills)
+        jobscan_match_report.soft_skills = MatchReportPage.group_skills_by_appliance_type(soft_skills)
+        jobscan_match_report.metrics.update(await self._check_and_process_metric(self.recruiter_tips_container, self.recruiter_tips_metrics))
+        jobscan_match_report.metrics.update(await self._check_and_process_metric(self.formatting_container, self.formatting_metrics))
+        return jobscan_match_report
+
+    async def _process_skills(self, skill_type: SkillType, whitelisted_skills: SkillWhitelistIndex) -> list[Skill]:
+        container = self.hard_skills_container if skill_type == SkillType.HARD_SKILL else self.soft_skills_container
+        skills_analyzer_component = AsyncSkillsAnalyzerComponent(self.page, self.playwright_helper, container, skill_type)
+        return await skills_analyzer_component.process_skills(whitelisted_skills)
+
+    async def _check_and_process_metric(self, container: Locator, findings: Locator) -> dict[str, list[MetricFinding]]:
+        metric_title = (await container.locator("h3").inner_text()).split("\n")[0]
+        return { metric_title: await self._collect_metric_findings(findings) }
+
+    async def _collect_metric_findings(self, findings: Locator) -> list[MetricFinding]:
+        metric_findings: list[MetricFinding] = []
+        snapshots = await findings.evaluate_all(MatchReportPage.FINDINGS_SNAPSHOT_SCRIPT)
+        # Indices are checked against the latest snapshot, which is taken again after every update interaction
+        finding_index = 0
+        while finding_index < len(snapshots):
+            finding_title = snapshots[finding_index]["title"]
+            finding_checks: list[Check] = []
+
+            check_index = 0
+            while check_index < len(snapshots[finding_index]["checks"]):
+                check_snapshot = snapshots[finding_index]["checks"][check_index]
+                status = MatchReportPage.parse_check_status(check_snapshot["status_class"])
+                description = check_snapshot["description"]
+                details: list[str] = []
+                if check_snapshot["has_evidence"]:
+                    check = findings.nth(finding_index).locator(MatchReportPage.CHECK_ROW_SELECTOR).nth(check_index)
+                    await self.playwright_helper.human_like_mouse_move_and_click(self.page, check.locator(MatchReportPage.CHECK_EVIDENCE_SELECTOR), passive=True)
+                    modal = self.page.locator(MatchReportPage.EVIDENCE_MODAL_SELECTOR)
+                    await expect(modal).to_contain_text(MatchReportPage.MODAL_CONTENT_PATTERN, timeout=self.playwright_helper.page_ready_timeout_ms)
+                    details = MatchReportPage.parse_evidence_details(await modal.inner_text())
+                    await self.playwright_helper.human_like_mouse_move_and_click(self.page, modal.locator(MatchReportPage.EVIDENCE_MODAL_CLOSE_SELECTOR), passive=True)
+                    await modal.wait_for(state="hidden", timeout=self.playwright_helper.page_ready_timeout_ms)
+                elif MatchReportPage.offers_update(finding_title, status, check_snapshot):
+                    check = findings.nth(finding_index).locator(MatchReportPage.CHECK_ROW_SELECTOR).nth(check_index)
+                    await self.playwright_helper.human_like_mouse_move_and_click(self.page, check.locator(MatchReportPage.CHECK_UPDATE_SELECTOR))
+                    modal_title = await self.page.locator(MatchReportPage.UPDATE_MODAL_SELECTOR).get_by_role(role="heading").inner_text()
+                    if modal_title != MatchReportPage.JOB_OPPORTUNITY_MODAL_TITLE:
+                        raise MatchReportPage.unsupported_update_error(modal_title)
+                    await self._update_job_opportunity_data(self.job_details)
+                    status = MatchReportPage.parse_check_status(await self.playwright_helper.get_class_attr(check.locator(MatchReportPage.CHECK_ICON_SELECTOR)))
+                    description = await check.locator(MatchReportPage.CHECK_DESCRIPTION_SELECTOR).inner_text()
+                    snapshots = await findings.evaluate_all(MatchReportPage.FINDINGS_SNAPSHOT_SCRIPT)
+                finding_checks.append(Check(description=description, details=details, status=status))
+                check_index += 1
+
+            metric_findings.append(MatchReportPage.build_metric_finding(finding_title, finding_checks))
+            finding_index += 1
+
+        return metric_findings
+
+    async def _update_job_opportunity_data(self, job_details: JobDetails) -> None:
+        for label, value in MatchReportPage.job_opportunity_fields(job_details).items():
+            field_input = self.page.get_by_label(label)
+            if value and await field_input.input_value() != value:
+                await self.playwright_helper.human_like_fill_data(self.page, field_input, value)
+        await self.playwright_helper.human_like_mouse_move_and_click(self.page, self.page.locator(MatchReportPage.UPDATE_DETAILS_BUTTON_SELECTOR))
+
+    async def rescan(self, path_to_resume: str, job_details: JobDetails) -> AsyncMatchReportPage:
+        await self.playwright_helper.human_like_mouse_move_and_click(self.page, self.upload_and_rescan_button)
+        await self.new_scan_component.scan(path_to_resume, job_details)
+        await self.page.wait_for_url(self.jobscan_settings.match_report_url_pattern, timeout=self.playwright_helper.page_ready_timeout_ms)
+        return AsyncMatchReportPage(page=self.page, playwright_helper=self.playwright_helper, jobscan_settings=self.jobscan_settings, resume_settings=self.resume_settings, job_details=job_details)
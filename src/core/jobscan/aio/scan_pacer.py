@@ -0,0 +1,30 @@
+import asyncio
+from typing import Optional
+
+
+class ScanPacer:
+    """
+    Per-account pacing: scan submissions start at least min_seconds_between_scans apart, however many pages run
+    concurrently. Slots are reserved under a lock and slept on outside of it, so waiting scans queue in order.
+    """
+
+    def __init__(self, min_seconds_between_scans: float):
+        self.min_seconds_between_scans = min_seconds_between_scans
+        self.total_wait_seconds = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._next_slot = 0.0
+
+    async def wait_turn(self) -> float:
+        """Wait for the next free slot and return the seconds waited."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_seconds_between_scans
+        wait_seconds = slot - now
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+        self.total_wait_seconds += wait_seconds
+        return wait_seconds
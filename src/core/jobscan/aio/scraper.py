@@ -0,0 +1,155 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright, TimeoutError as PlaywrightTimeoutError
+from core.jobscan.aio.pages.dashboard_page import AsyncDashboardPage
+from core.jobscan.aio.scan_pacer import ScanPacer
+from core.jobscan.models.enums import SessionMode
+from core.jobscan.models.jobscan_match_report import JobscanMatchReport
+from core.jobscan.network_filter import NetworkRequestFilter
+from core.jobscan.scraper import JobscanScraper
+from core.parsing.models.job_to_target import JobDetails
+from core.services.config.models.settings import JobscanSettings, PlaywrightSettings, ResumeSettings
+from core.utils.async_ui_helpers import AsyncPlaywrightHelper
+from core.utils.log_helper import LogHelper
+import core.utils.paths as path_utils
+
+
+@dataclass
+class JobScanResult:
+    job_details: JobDetails
+    match_report: Optional[JobscanMatchReport] = None
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+
+
+class AsyncJobscanScraper:
+    """
+    Scans one resume against many jobs concurrently, each job in its own context of a single browser.
+    At most max_concurrent_scans jobs are in flight, and scan submissions of the account are spaced by the
+    ScanPacer, so throughput grows with concurrency until the pacing budget becomes the limit.
+    Only live sessions are supported; record/replay (JobscanSessionRecorder) is available in JobscanScraper.
+    """
+    logger = LogHelper(__name__)
+
+    def __init__(self, jobscan_settings: JobscanSettings, playwright_settings: PlaywrightSettings, resume_settings: ResumeSettings, max_concurrent_scans: Optional[int] = None):
+        if jobscan_settings.session_mode != SessionMode.LIVE:
+            raise ValueError(f"Session mode '{jobscan_settings.session_mode.value}' is not supported by the async scraper; use JobscanScraper or session_mode 'live'")
+        self.jobscan_settings = jobscan_settings
+        self.playwright_settings = playwright_settings
+        self.resume_settings = resume_settings
+        self.max_concurrent_scans = max_concurrent_scans or jobscan_settings.max_concurrent_scans
+        self.pacer = ScanPacer(jobscan_settings.min_seconds_between_scans)
+        self.synthetic_delay_seconds = 0.0
+        self.network_filter = NetworkRequestFilter(self.playwright_settings) if self.playwright_settings.network_filter_enabled else None
+
+    async def scan_jobs(self, jobs: Sequence[JobDetails], path_to_resume: Optional[str] = None) -> list[JobScanResult]:
+        """Scan path_to_resume (the original resume by default) against every job; results keep the order of jobs."""
+        path_to_resume = path_to_resume or str(path_utils.get_original_resume_file_path())
+        self._validate_workflow_inputs(path_to_resume)
+        semaphore = asyncio.Semaphore(self.max_concurrent_scans)
+        started_at = time.perf_counter()
+
+        async with async_playwright() as playwright:
+            browser = await self._launch_browser_with_retry(playwright)
+            try:
+                user_agent = await self._get_user_agent(browser)
+                results = await asyncio.gather(*(self._scan_job(browser, user_agent, semaphore, job, path_to_resume) for job in jobs))
+            finally:
+                await browser.close()
+
+        failures = sum(1 for result in results if result.error)
+        AsyncJobscanScraper.logger.info(
+            f"Scanned {len(results) - failures}/{len(results)} jobs in {time.perf_counter() - started_at:.1f}s "
+            f"(concurrency {self.max_concurrent_scans}, {self.pacer.total_wait_seconds:.1f}s spent waiting for pacing, "
+            f"{self.synthetic_delay_seconds:.1f}s in synthetic UI delay)"
+        )
+        if self.network_filter:
+            self.network_filter.log_summary()
+        return list(results)
+
+    async def _scan_job(self, browser: Browser, user_agent: Optional[str], semaphore: asyncio.Semaphore, job_details: JobDetails, path_to_resume: str) -> JobScanResult:
+        async with semaphore:
+            started_at = time.perf_counter()
+            context: Optional[BrowserContext] = None
+            # Every job is its own session with its own synthetic delay budget
+            playwright_helper = AsyncPlaywrightHelper(self.playwright_settings, self.jobscan_settings.session_mode)
+            try:
+                context = await self._create_browser_context_with_retry(browser, user_agent)
+                page = await context.new_page()
+                await page.goto(self.jobscan_settings.home_url, timeout=30000)
+                await page.wait_for_url(self.jobscan_settings.home_url, timeout=15000)
+
+                await self.pacer.wait_turn()
+                dashboard_page = AsyncDashboardPage(page=page, playwright_helper=playwright_helper, jobscan_settings=self.jobscan_settings, resume_settings=self.resume_settings)
+                match_report_page = await dashboard_page.scan(path_to_resume, job_details)
+                report = await match_report_page.process_match_report(iteration=1)
+                try:
+                    report.write_to_file()
+                except Exception as e:
+                    AsyncJobscanScraper.logger.warning(f"Failed to save report for {job_details.company} {job_details.title}: {e}")
+                AsyncJobscanScraper.logger.info(f"Scanned {job_details.company} {job_details.title}: match rate {report.score}")
+                return JobScanResult(job_details=job_details, match_report=report, duration_seconds=time.perf_counter() - started_at)
+            except Exception as e:
+                AsyncJobscanScraper.logger.error(f"Scan failed for {job_details.company} {job_details.title}: {e}")
+                return JobScanResult(job_details=job_details, error=str(e), duration_seconds=time.perf_counter() - started_at)
+            finally:
+                self.synthetic_delay_seconds += playwright_helper.pacing_policy.total_delay_seconds
+                if context:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        AsyncJobscanScraper.logger.warning(f"Error closing context: {e}")
+
+    def _validate_workflow_inputs(self, path_to_resume: str) -> None:
+        if not os.path.exists(path_to_resume):
+            raise FileNotFoundError(f"Resume file not found: {path_to_resume}")
+        if not os.path.exists(self.jobscan_settings.storage_state_path):
+            AsyncJobscanScraper.logger.warning(f"Storage state file not found: {self.jobscan_settings.storage_state_path}")
+        if not self.jobscan_settings.home_url:
+            raise ValueError("Home URL is required")
+
+    async def _get_user_agent(self, browser: Browser) -> str:
+        cached_user_agent = JobscanScraper._load_cached_user_agent(
+            self.playwright_settings.user_agent_cache_path,
+            self.playwright_settings.user_agent_cache_max_age_days
+        )
+        if cached_user_agent:
+            return cached_user_agent
+
+        context = await browser.new_context()
+        try:
+            page = await context.new_page()
+            user_agent = await page.evaluate("() => navigator.userAgent")
+        finally:
+            await context.close()
+        if not user_agent or len(user_agent.strip()) == 0:
+            raise RuntimeError("Empty user agent received")
+        JobscanScraper._save_user_agent_to_cache(self.playwright_settings.user_agent_cache_path, user_agent)
+        return user_agent
+
+    async def _launch_browser_with_retry(self, playwright_instance: Playwright, max_retries: int = 3) -> Browser:
+        for attempt in range(max_retries):
+            try:
+                AsyncJobscanScraper.logger.info(f"Launching browser (attempt {attempt + 1}/{max_retries})")
+                return await playwright_instance.chromium.launch(headless=False)
+            except Exception as e:
+                AsyncJobscanScraper.logger.warning(f"Browser launch attempt {attempt + 1} failed: {e}")
+                if attempt == max_retries - 1:
+                    raise RuntimeError(f"Failed to launch browser after {max_retries} attempts: {e}")
+        raise RuntimeError("Exhausted retries while trying to launch a browser")
+
+    async def _create_browser_context_with_retry(self, browser: Browser, user_agent: Optional[str], max_retries: int = 3) -> BrowserContext:
+        for attempt in range(max_retries):
+            try:
+                context = await browser.new_context(**JobscanScraper.get_browser_context_options(self.jobscan_settings, self.playwright_settings, user_agent))
+                if self.network_filter:
+                    await self.network_filter.attach_async(context)
+                return context
+            except (PlaywrightTimeoutError, Exception) as e:
+                AsyncJobscanScraper.logger.warning(f"Context creation attempt {attempt + 1} failed: {e}")
+                if attempt == max_retries - 1:
+                    raise RuntimeError(f"Failed to create browser context after {max_retries} attempts: {e}")
+        raise RuntimeError("Exhausted retries while trying to create browser context")
@@ -0,0 +1,119 @@
+import re
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+from core.jobscan.models.jobscan_match_report import JobscanMatchReport, Skill
+from core.jobscan.models.enums import SkillApplianceType
+from core.parsing.models.resume import Resume, ResumeLite
+from core.services.config.models.settings import ResumeSettings
+from core.utils.log_helper import LogHelper
+from core.utils.normalization_helpers import SkillWhitelistIndex
+
+
+class AtsKeywordEstimator:
+    """
+    Local stand-in for a Jobscan rescan. Counts every skill of a previous match report in a resume
+    (case-insensitive, whole words) to reproduce actual_quantity/required_quantity, re-buckets the
+    skills and estimates the score by shifting the previous score with the change in skill coverage.
+    The estimate is a heuristic, not Jobscan's formula: the share of the match rate attributed to
+    hard/soft skill coverage comes from resume.estimator_hard_skills_score_weight and
+    resume.estimator_soft_skills_score_weight, tuned by hand against past scans. Only keyword-driven
+    parts of the score move; searchability, recruiter tips and formatting are assumed unchanged, so a
+    real scan is still needed for the final number.
+    """
+    logger = LogHelper(__name__)
+
+    def __init__(self, resume_settings: ResumeSettings):
+        self.resume_settings = resume_settings
+        self._patterns: Dict[str, re.Pattern] = {}
+
+    @staticmethod
+    def get_resume_text(resume: ResumeLite) -> str:
+        parts: List[str] = []
+        summary = resume.professional_summary
+        if summary.summary:
+            parts.append(summary.summary)
+        parts.extend(summary.highlights)
+        parts.extend(resume.technical_skills)
+        for experience in resume.professional_experience_list:
+            parts.extend(
+                value for value in (experience.position, experience.company, experience.company_description, experience.project_description)
+                if value
+            )
+            parts.extend(experience.bullets)
+        if isinstance(resume, Resume):
+            parts.extend(value for value in (resume.education.university, resume.education.country) if value)
+            for degree in resume.education.degree_list:
+                parts.extend(value for value in (degree.degree, degree.field_of_study) if value)
+            parts.extend(resume.professional_development_list)
+        return "\n".join(parts)
+
+    def _get_pattern(self, skill_name: str) -> re.Pattern:
+        pattern = self._patterns.get(skill_name)
+        if pattern is None:
+            # '+', '#' and '.' count as part of a term so that 'C' does not match inside 'C++' or 'C#'
+            pattern = re.compile(rf"(?<![\w+#.]){re.escape(skill_name)}(?![\w+#]|\.\w)", re.IGNORECASE)
+            self._patterns[skill_name] = pattern
+        return pattern
+
+    def count_occurrences(self, text: str, skill_names: Iterable[str]) -> Dict[str, int]:
+        return {name: len(self._get_pattern(name).findall(text)) for name in skill_names}
+
+    def estimate(self, resume: ResumeLite, previous_report: JobscanMatchReport, iteration: Optional[int] = None, baseline_resume: Optional[ResumeLite] = None) -> JobscanMatchReport:
+        """
+        Return the estimated match report for resume (heuristic score), based on the skills and score of previous_report.
+        When baseline_resume (the resume previous_report was scanned with) is given, the score shift is
+        measured between local counts of both resumes, which cancels out systematic counting differences
+        with Jobscan. Both are compared with the same sections: when only one of them is a full Resume
+        (education, professional development), their lite versions are compared instead.
+        """
+        if baseline_resume is not None and isinstance(resume, Resume) != isinstance(baseline_resume, Resume):
+            resume, baseline_resume = resume.get_lite_version(), baseline_resume.get_lite_version()
+        predicted_report = self._count_skills(resume, previous_report)
+        predicted_report.iteration = iteration if iteration is not None else previous_report.iteration
+        predicted_report.report_url = None
+        predicted_report.scanned_at = datetime.now(timezone.utc)
+        baseline_report = self._count_skills(baseline_resume, previous_report) if baseline_resume else previous_report
+        predicted_report.score = self._estimate_score(previous_report.score, baseline_report, predicted_report)
+        self.logger.info(f"Heuristic match rate estimate {predicted_report.score} (previous scan {previous_report.score})")
+        return predicted_report
+
+    def _count_skills(self, resume: ResumeLite, report: JobscanMatchReport) -> JobscanMatchReport:
+        text = self.get_resume_text(resume)
+        counted_report = report.model_copy(deep=True)
+        counted_report.hard_skills = self._estimate_skills(text, counted_report.hard_skills, self.resume_settings.get_hard_skills_whitelist_index)
+        counted_report.soft_skills = self._estimate_skills(text, counted_report.soft_skills, self.resume_settings.get_soft_skills_whitelist_index)
+        return counted_report
+
+    def _estimate_skills(self, text: str, skills: Dict[SkillApplianceType, List[Skill]], whitelist: SkillWhitelistIndex) -> Dict[SkillApplianceType, List[Skill]]:
+        all_skills = [skill for skills_for_type in skills.values() for skill in skills_for_type]
+        counts = self.count_occurrences(text, {skill.name for skill in all_skills if skill.name})
+        estimated_skills: Dict[SkillApplianceType, List[Skill]] = {
+            SkillApplianceType.APPLIED: [],
+            SkillApplianceType.MISSING: []
+        }
+        for skill in all_skills:
+            skill.actual_quantity = counts.get(skill.name, 0) if skill.name else 0
+            skill.update_is_supported(whitelist)
+            estimated_skills[skill.define_appliance_type()].append(skill)
+        return estimated_skills
+
+    @staticmethod
+    def get_skill_coverage(skills: Dict[SkillApplianceType, List[Skill]]) -> float:
+        """Share of required skill occurrences present in the resume, each skill capped at its required quantity."""
+        required_total = 0
+        covered_total = 0
+        for skills_for_type in skills.values():
+            for skill in skills_for_type:
+                required = skill.required_quantity or 1
+                required_total += required
+                covered_total += min(skill.actual_quantity or 0, required)
+        return covered_total / required_total if required_total else 1.0
+
+    def _estimate_score(self, previous_score: Optional[int], baseline_report: JobscanMatchReport, predicted_report: JobscanMatchReport) -> Optional[int]:
+        if previous_score is None:
+            return None
+        delta = (
+            self.resume_settings.estimator_hard_skills_score_weight * (self.get_skill_coverage(predicted_report.hard_skills) - self.get_skill_coverage(baseline_report.hard_skills))
+            + self.resume_settings.estimator_soft_skills_score_weight * (self.get_skill_coverage(predicted_report.soft_skills) - self.get_skill_coverage(baseline_report.soft_skills))
+        )
+        return max(0, min(100, round(previous_score + delta * 100)))
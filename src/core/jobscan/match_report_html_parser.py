@@ -0,0 +1,194 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+from lxml import etree
+from core.jobscan.models.jobscan_match_report import JobscanMatchReport, MetricFinding, SkillType
+from core.jobscan.pages.components.skills_analyzer_component import SkillsAnalyzerComponent
+from core.jobscan.pages.match_report_page import MatchReportPage
+from core.parsing.models.job_to_target import JobDetails
+from core.services.config.config_manager import ConfigManager
+from core.services.config.models.settings import ResumeSettings
+from core.utils.log_helper import LogHelper
+
+
+_worker_parser: Optional["MatchReportHtmlParser"] = None
+
+
+def _init_worker() -> None:
+    """Load settings and build the whitelist indexes once per worker process."""
+    global _worker_parser
+    _worker_parser = MatchReportHtmlParser(ConfigManager().settings.resume)
+
+
+def _parse_saved_page(path_to_file: Path, job_details: Optional[JobDetails]) -> tuple[Path, Optional[JobscanMatchReport], Optional[str]]:
+    try:
+        return path_to_file, _worker_parser.parse_file(path_to_file, job_details=job_details), None
+    except (OSError, ValueError, etree.LxmlError) as e:
+        return path_to_file, None, str(e)
+
+
+class MatchReportHtmlParser:
+    """
+    Builds a JobscanMatchReport from a saved match report page (e.g. a recorded DOM snapshot) without a browser.
+    Lookups mirror the selectors of MatchReportPage and SkillsAnalyzerComponent, and rows/findings go
+    through the same builders, so the result matches a live extraction except for evidence modal details,
+    which only exist after clicking.
+    """
+    METRIC_SECTION_IDS = ("searchability", "recruiterTips", "formatting")
+    SKILL_SECTION_IDS = {SkillType.HARD_SKILL: "hardSkills", SkillType.SOFT_SKILL: "softSkills"}
+    ITERATION_PATTERN = re.compile(r"match_report_(\d+)")
+    BLOCK_TAGS = frozenset({"address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "li", "main", "nav", "ol", "p", "pre", "section", "table", "tr", "ul"})
+
+    logger = LogHelper(__name__)
+
+    def __init__(self, resume_settings: ResumeSettings):
+        self.resume_settings = resume_settings
+        self.html_parser = etree.HTMLParser()
+
+    @staticmethod
+    def find_all(element: etree._Element, tag: str, class_name: str) -> list[etree._Element]:
+        """Descendants like CSS 'tag.class_name'; plain iteration is much cheaper than an XPath call per row."""
+        return [node for node in element.iter(tag) if node is not element and class_name in (node.get("class") or "").split()]
+
+    @staticmethod
+    def find_first(element: etree._Element, tag: str, class_name: str) -> Optional[etree._Element]:
+        for node in element.iter(tag):
+            if node is not element and class_name in (node.get("class") or "").split():
+                return node
+        return None
+
+    @staticmethod
+    def next_element_sibling(element: etree._Element) -> Optional[etree._Element]:
+        sibling = element.getnext()
+        while sibling is not None and not isinstance(sibling.tag, str):
+            sibling = sibling.getnext()
+        return sibling
+
+    @classmethod
+    def inner_text(cls, element: etree._Element) -> str:
+        """Approximation of HTMLElement.innerText: block elements and <br> break lines, whitespace is collapsed."""
+        if len(element) == 0:
+            return " ".join((element.text or "").split())
+        parts: list[str] = []
+
+        def walk(node: etree._Element) -> None:
+            is_block = isinstance(node.tag, str) and node.tag in cls.BLOCK_TAGS
+            if is_block:
+                parts.append("\n")
+            if node.tag == "br":
+                parts.append("\n")
+            if node.text and isinstance(node.tag, str):
+                parts.append(node.text)
+            for child in node:
+                walk(child)
+                if child.tail:
+                    parts.append(child.tail)
+            if is_block:
+                parts.append("\n")
+
+        walk(element)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def parse_html(self, page_html: str, job_details: Optional[JobDetails] = None, iteration: Optional[int] = None, report_url: Optional[str] = None) -> JobscanMatchReport:
+        document = etree.fromstring(page_html, self.html_parser)
+        if document is None:
+            raise ValueError("Empty match report page")
+        # One pass over the tree; every section is located from its id like '#hardSkills + div.skillsAnalyzer'
+        elements_by_id = {element.get("id"): element for element in document.iter() if isinstance(element.tag, str) and element.get("id")}
+        score_container = elements_by_id.get("score")
+        score_element = self.find_first(score_container, "span", "number") if score_container is not None else None
+        score_text = self.inner_text(score_element) if score_element is not None else ""
+        jobscan_match_report = JobscanMatchReport(
+            job_title=job_details.title if job_details else None,
+            company=job_details.company if job_details else None,
+            iteration=iteration,
+            score=int(score_text) if score_text.isdigit() else None,
+            report_url=report_url
+        )
+        for section_id in self.METRIC_SECTION_IDS:
+            jobscan_match_report.metrics.update(self._parse_metric(elements_by_id, section_id))
+        jobscan_match_report.hard_skills = MatchReportPage.group_skills_by_appliance_type(
+            SkillsAnalyzerComponent.build_skills(self._parse_skill_rows(elements_by_id, SkillType.HARD_SKILL), SkillType.HARD_SKILL, self.resume_settings.get_hard_skills_whitelist_index)
+        )
+        jobscan_match_report.soft_skills = MatchReportPage.group_skills_by_appliance_type(
+            SkillsAnalyzerComponent.build_skills(self._parse_skill_rows(elements_by_id, SkillType.SOFT_SKILL), SkillType.SOFT_SKILL, self.resume_settings.get_soft_skills_whitelist_index)
+        )
+        return jobscan_match_report
+
+    def parse_file(self, path_to_file: Path, job_details: Optional[JobDetails] = None, report_url: Optional[str] = None) -> JobscanMatchReport:
+        """Parse a saved page; the iteration is taken from names like '03_match_report_2.html'."""
+        path_to_file = Path(path_to_file)
+        iteration_match = self.ITERATION_PATTERN.search(path_to_file.stem)
+        iteration = int(iteration_match.group(1)) if iteration_match else None
+        return self.parse_html(path_to_file.read_text(encoding="utf-8"), job_details=job_details, iteration=iteration, report_url=report_url)
+
+    def parse_directory(self, directory: Path, pattern: str = "*match_report*.html", job_details: Optional[JobDetails] = None, max_workers: Optional[int] = None) -> Iterator[tuple[Path, JobscanMatchReport]]:
+        """
+        Yield (path, report) for every saved page in directory (recursively) in path order; unparsable pages are
+        logged and skipped. With max_workers > 1 pages are parsed in worker processes, for archives of thousands.
+        """
+        paths = sorted(Path(directory).rglob(pattern))
+        if max_workers and max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+                results = executor.map(_parse_saved_page, paths, [job_details] * len(paths), chunksize=32)
+                for path_to_file, report, error in results:
+                    if report is None:
+                        MatchReportHtmlParser.logger.warning(f"Could not parse {path_to_file}: {error}")
+                        continue
+                    yield path_to_file, report
+            return
+
+        for path_to_file in paths:
+            try:
+                yield path_to_file, self.parse_file(path_to_file, job_details=job_details)
+            except (OSError, ValueError, etree.LxmlError) as e:
+                MatchReportHtmlParser.logger.warning(f"Could not parse {path_to_file}: {e}")
+
+    def _get_adjacent_section(self, elements_by_id: dict[str, etree._Element], section_id: str, class_name: str) -> Optional[etree._Element]:
+        """Element matching '#section_id + div.class_name'."""
+        anchor = elements_by_id.get(section_id)
+        section = self.next_element_sibling(anchor) if anchor is not None else None
+        if section is None or section.tag != "div" or class_name not in (section.get("class") or "").split():
+            return None
+        return section
+
+    def _parse_skill_rows(self, elements_by_id: dict[str, etree._Element], skill_type: SkillType) -> list[dict[str, Optional[str]]]:
+        container = self._get_adjacent_section(elements_by_id, self.SKILL_SECTION_IDS[skill_type], "skillsAnalyzer")
+        if container is None:
+            return []
+        names = self.find_all(container, "span", "name")
+        counts = self.find_all(container, "span", "count")
+        rows: list[dict[str, Optional[str]]] = []
+        for i, name in enumerate(names):
+            count = counts[i] if i < len(counts) else None
+            count_cell = count.getparent() if count is not None else None
+            required_cell = self.next_element_sibling(count_cell) if count_cell is not None else None
+            rows.append({
+                "name": self.inner_text(name),
+                "matched": None if count is None or self.find_first(count, "span", "x") is not None else self.inner_text(count),
+                "required": self.inner_text(required_cell) if required_cell is not None else None
+            })
+        return rows
+
+    def _parse_metric(self, elements_by_id: dict[str, etree._Element], section_id: str) -> dict[str, list[MetricFinding]]:
+        container = elements_by_id.get(section_id)
+        heading = next(container.iter("h3"), None) if container is not None else None
+        if heading is None:
+            return {}
+        metric_title = self.inner_text(heading).split("\n")[0]
+        finding_section = self._get_adjacent_section(elements_by_id, section_id, "findingSection")
+        snapshots = []
+        for finding in self.find_all(finding_section, "div", "finding") if finding_section is not None else []:
+            title = self.find_first(finding, "div", "title")
+            checks = []
+            for check in self.find_all(finding, "div", "checkRow"):
+                icon = self.find_first(check, "div", "checkIcon")
+                description = self.find_first(check, "div", "description")
+                checks.append({
+                    "description": self.inner_text(description) if description is not None else None,
+                    "status_class": icon.get("class") if icon is not None else None
+                })
+            snapshots.append({"title": self.inner_text(title) if title is not None else "", "checks": checks})
+        return {metric_title: MatchReportPage.build_metric_findings(snapshots)}
@@ -14,4 +14,10 @@ class SkillType(str, Enum):
 class CheckStatusType(str, Enum):
     WARN = "warn"
     PASS = "pass"
-    FAIL = "fail"
\ No newline at end of file
+    FAIL = "fail"
+
+
+class SessionMode(str, Enum):
+    LIVE = "live"
+    RECORD = "record"
+    REPLAY = "replay"
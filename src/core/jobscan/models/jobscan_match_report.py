@@ -1,10 +1,11 @@
 import json
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 import core.utils.paths as path_utils
 from core.services.openai.models.prompt_instructions import Keyword, KeywordStatus, KeywordStatistics
 from core.jobscan.models.enums import SkillType, SkillApplianceType, CheckStatusType
+from core.utils.normalization_helpers import SkillWhitelistIndex
 
 
 class Skill(BaseModel):
@@ -21,14 +22,14 @@ class Skill(BaseModel):
             else SkillApplianceType.MISSING
         )
 
-    def update_is_supported(self, whitelist) -> bool:
+    def update_is_supported(self, whitelist: SkillWhitelistIndex) -> bool:
         """Update the is_supported field based on a whitelist and current usage."""
         if not self.name:
             self.is_supported = False
             return self.is_supported
         self.is_supported = (
             self.actual_quantity > 0 if self.actual_quantity else False
-            or self.name.lower() in whitelist
+            or self.name in whitelist
         )
         return self.is_supported
     
@@ -65,10 +66,20 @@ class JobscanMatchReport(BaseModel):
     hard_skills: Dict[SkillApplianceType, List[Skill]] = Field(default_factory=dict)
     soft_skills: Dict[SkillApplianceType, List[Skill]] = Field(default_factory=dict)
     metrics: Dict[str,List[MetricFinding]] = Field(default_factory=dict)
+    _keyword_statistics: Optional[KeywordStatistics] = PrivateAttr(default=None)
 
     class Config:
         model_config = {"validate_assignment": True}  # validate on assignment
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ("hard_skills", "soft_skills"):
+            self.invalidate_keyword_statistics()
+
+    def invalidate_keyword_statistics(self) -> None:
+        """Drop the cached keyword statistics; needed only after mutating skills in place."""
+        self._keyword_statistics = None
+
     def write_to_file(self) -> None:
         if not self.company or not self.job_title or not self.iteration:
             raise ValueError("Missing data!")
@@ -81,12 +92,15 @@ class JobscanMatchReport(BaseModel):
         print(f"[write_to_file] Wrote Jobscan Match Report JSON to: {path_to_match_report_path}  (exists={path_to_match_report_path.exists()})")
 
     def get_keywords_to_prompt(self) -> KeywordStatistics:
-        return KeywordStatistics(
-            keywords={
-                SkillType.HARD_SKILL: self._transform_skills(skills=self.hard_skills),
-                SkillType.SOFT_SKILL: self._transform_skills(skills=self.soft_skills)
-            }
-        )
+        """A fresh KeywordStatistics per call; the cached one (and its index) cannot be changed through it."""
+        if self._keyword_statistics is None:
+            self._keyword_statistics = KeywordStatistics(
+                keywords={
+                    SkillType.HARD_SKILL: self._transform_skills(skills=self.hard_skills),
+                    SkillType.SOFT_SKILL: self._transform_skills(skills=self.soft_skills)
+                }
+            )
+        return self._keyword_statistics.copy_with_index()
 
     def _transform_skills(self, skills: Dict[SkillApplianceType, List[Skill]]) -> list[Keyword]:
         keywords = []
@@ -117,17 +131,15 @@ class JobscanMatchReport(BaseModel):
         return keywords
 
     def get_unsupported_keywords(self) -> dict[SkillType, list[Keyword]]:
-        keywords:  dict[SkillType, list[Keyword]] = {} 
-        keywords[SkillType.HARD_SKILL] = self._transform_skills(supported=False, skills=self.hard_skills)
-        keywords[SkillType.SOFT_SKILL] = self._transform_skills(supported=False, skills=self.soft_skills)
-        return keywords
+        return self.get_keywords_to_prompt().get_keywords_to_ignore()
 
-    def _update_supported_skills(self, skill_type: SkillType, whitelist: list[str]) -> None:
+    def _update_supported_skills(self, skill_type: SkillType, whitelist: SkillWhitelistIndex) -> None:
         skills = self.hard_skills if skill_type == SkillType.HARD_SKILL else self.soft_skills
         for appliance_type in skills:
             for skill in skills[appliance_type]:
                 skill.update_is_supported(whitelist)
 
-    def update_supported_skills(self, whitelisted_hard_skills: list[str], whitelisted_soft_skills: list[str]) -> None:
+    def update_supported_skills(self, whitelisted_hard_skills: SkillWhitelistIndex, whitelisted_soft_skills: SkillWhitelistIndex) -> None:
         self._update_supported_skills(SkillType.HARD_SKILL, whitelisted_hard_skills)
         self._update_supported_skills(SkillType.SOFT_SKILL, whitelisted_soft_skills)
+        self.invalidate_keyword_statistics()
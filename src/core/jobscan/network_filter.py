@@ -0,0 +1,131 @@
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+from playwright.sync_api import BrowserContext, Route
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Route as AsyncRoute
+from core.services.config.models.settings import PlaywrightSettings
+from core.utils.log_helper import LogHelper
+
+
+@dataclass
+class NetworkFilterStats:
+    allowed_requests: int = 0
+    blocked_requests: int = 0
+    stubbed_requests: int = 0
+    estimated_bytes_saved: int = 0
+    blocked_by_type: Counter = field(default_factory=Counter)
+
+    def summary(self) -> str:
+        by_type = ", ".join(f"{resource_type}: {count}" for resource_type, count in self.blocked_by_type.most_common())
+        return (
+            f"blocked {self.blocked_requests}, stubbed {self.stubbed_requests}, allowed {self.allowed_requests} requests, "
+            f"~{self.estimated_bytes_saved / 1024:.0f} KiB saved ({by_type or 'nothing filtered'})"
+        )
+
+
+class NetworkRequestFilter:
+    """
+    Route handler that drops what the scraper never reads. Requests of blocked resource types or matching
+    blocked URL globs are aborted; requests matching stubbed URL globs get an empty 200 response, for
+    third-party scripts whose absence would make page scripts fail. Documents are always let through.
+    Everything else falls back to other route handlers (or the network), so the filter composes with HAR replay.
+    Bytes saved are estimated from typical sizes per resource type since blocked responses are never fetched.
+    """
+    TYPICAL_RESOURCE_BYTES = {
+        "image": 40_000,
+        "media": 500_000,
+        "font": 30_000,
+        "script": 60_000,
+        "stylesheet": 20_000,
+        "xhr": 5_000,
+        "fetch": 5_000,
+        "other": 5_000
+    }
+    STUB_CONTENT_TYPES = {
+        "script": "application/javascript",
+        "stylesheet": "text/css",
+        "xhr": "application/json",
+        "fetch": "application/json"
+    }
+    BLOCK = "block"
+    STUB = "stub"
+
+    logger = LogHelper(__name__)
+
+    def __init__(self, playwright_settings: PlaywrightSettings):
+        self.blocked_resource_types = frozenset(playwright_settings.blocked_resource_types)
+        self.blocked_url_patterns = [self.glob_to_regex(pattern) for pattern in playwright_settings.blocked_url_patterns]
+        self.stubbed_url_patterns = [self.glob_to_regex(pattern) for pattern in playwright_settings.stubbed_url_patterns]
+        self.stats = NetworkFilterStats()
+
+    @staticmethod
+    def glob_to_regex(pattern: str) -> re.Pattern:
+        """Playwright-style URL glob: '**' matches anything, '*' anything but '/'."""
+        parts = []
+        for token in re.split(r"(\*\*|\*)", pattern):
+            if token == "**":
+                parts.append(".*")
+            elif token == "*":
+                parts.append("[^/]*")
+            else:
+                parts.append(re.escape(token))
+        return re.compile("^" + "".join(parts) + "$")
+
+    def classify(self, resource_type: str, url: str) -> Optional[str]:
+        """Return BLOCK, STUB or None (let through) for a request."""
+        if resource_type == "document":
+            return None
+        if any(pattern.match(url) for pattern in self.stubbed_url_patterns):
+            return self.STUB
+        if resource_type in self.blocked_resource_types or any(pattern.match(url) for pattern in self.blocked_url_patterns):
+            return self.BLOCK
+        return None
+
+    def _record(self, decision: Optional[str], resource_type: str) -> None:
+        if decision is None:
+            self.stats.allowed_requests += 1
+            return
+        if decision == self.BLOCK:
+            self.stats.blocked_requests += 1
+        else:
+            self.stats.stubbed_requests += 1
+        self.stats.blocked_by_type[resource_type] += 1
+        self.stats.estimated_bytes_saved += self.TYPICAL_RESOURCE_BYTES.get(resource_type, self.TYPICAL_RESOURCE_BYTES["other"])
+
+    def _stub_content_type(self, resource_type: str) -> str:
+        return self.STUB_CONTENT_TYPES.get(resource_type, "text/plain")
+
+    def handle_route(self, route: Route) -> None:
+        request = route.request
+        decision = self.classify(request.resource_type, request.url)
+        self._record(decision, request.resource_type)
+        if decision == self.BLOCK:
+            route.abort("blockedbyclient")
+        elif decision == self.STUB:
+            route.fulfill(status=200, body="", content_type=self._stub_content_type(request.resource_type))
+        else:
+            route.fallback()
+
+    async def handle_route_async(self, route: AsyncRoute) -> None:
+        request = route.request
+        decision = self.classify(request.resource_type, request.url)
+        self._record(decision, request.resource_type)
+        if decision == self.BLOCK:
+            await route.abort("blockedbyclient")
+        elif decision == self.STUB:
+            await route.fulfill(status=200, body="", content_type=self._stub_content_type(request.resource_type))
+        else:
+            await route.fallback()
+
+    def attach(self, context: BrowserContext) -> None:
+        context.route("**/*", self.handle_route)
+
+    def detach(self, context: BrowserContext) -> None:
+        context.unroute("**/*", self.handle_route)
+
+    async def attach_async(self, context: AsyncBrowserContext) -> None:
+        await context.route("**/*", self.handle_route_async)
+
+    def log_summary(self) -> None:
+        NetworkRequestFilter.logger.info(f"Network filter: {self.stats.summary()}")
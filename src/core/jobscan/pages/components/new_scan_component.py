@@ -5,6 +5,13 @@ from core.parsing.models.job_to_target import JobDetails
 
 
 class NewScanComponent:
+    RESUME_TEXT_AREA_SELECTOR = "textarea#resume-text-input"
+    RESUME_DRAG_AND_DROP_BUTTON_SELECTOR = "div.resumeActions > button.upload"
+    JOB_DESCRIPTION_TEXT_AREA_SELECTOR = "textarea#jobDescriptionInput"
+    SCAN_BUTTON_SELECTOR = "//span[normalize-space(.) = 'Scan']/parent::button"
+    LOADING_OVERLAY_SELECTOR = ".loadingOverlay"
+    SCAN_STARTED_PREDICATE = f"prev => location.href !== prev || !!document.querySelector('{LOADING_OVERLAY_SELECTOR}')?.offsetParent"
+
     def __init__(self, container: Locator, page: Page, playwright_helper: PlaywrightHelper, resume_settings: ResumeSettings) -> None:
         self.container = container
         self.page = page
@@ -13,11 +20,11 @@ class NewScanComponent:
 
     @property
     def resume_text_area(self) -> Locator:
-        return self.container.locator("textarea#resume-text-input")
+        return self.container.locator(self.RESUME_TEXT_AREA_SELECTOR)
 
     @property
     def resume_drag_and_drop_button(self) -> Locator:
-        return self.container.locator("div.resumeActions > button.upload")
+        return self.container.locator(self.RESUME_DRAG_AND_DROP_BUTTON_SELECTOR)
 
     @property
     def resume_upload_input(self) -> Locator:
@@ -25,15 +32,15 @@ class NewScanComponent:
 
     @property
     def job_description_text_area(self) -> Locator:
-        return self.container.locator("textarea#jobDescriptionInput")
+        return self.container.locator(self.JOB_DESCRIPTION_TEXT_AREA_SELECTOR)
 
     @property
     def scan_button(self) -> Locator:
-        return self.container.locator("//span[normalize-space(.) = 'Scan']/parent::button")
+        return self.container.locator(self.SCAN_BUTTON_SELECTOR)
 
     @property
     def loading_overlay(self) -> Locator:
-        return self.container.locator(".loadingOverlay")
+        return self.container.locator(self.LOADING_OVERLAY_SELECTOR)
 
     def upload_resume(self, path_to_resume: str) -> None:
         self.playwright_helper.human_like_mouse_move_and_click(self.page, self.resume_text_area)
@@ -45,6 +52,19 @@ class NewScanComponent:
         self.upload_resume(path_to_resume)
         self.playwright_helper.human_like_fill_data(self.page, self.job_description_text_area,  str(job_details))
         expect(self.scan_button).to_be_enabled(timeout=2000)
+        previous_url = self.page.url
         self.playwright_helper.human_like_mouse_move_and_click(self.page, self.scan_button)
-        self.loading_overlay.wait_for(state="visible", timeout=5000)
-        self.loading_overlay.wait_for(state="hidden", timeout=15000)
\ No newline at end of file
+        self.wait_for_scan_to_start(previous_url)
+        # The scan is done once the overlay is gone; MatchReportPage then waits for the report itself
+        self.loading_overlay.wait_for(state="hidden", timeout=self.playwright_helper.page_ready_timeout_ms)
+
+    def wait_for_scan_to_start(self, previous_url: str) -> None:
+        """
+        Wait until the loading overlay is visible or the page has moved to another URL. On rescan the previous
+        report is still on the page, so waiting only for a quiet DOM without the overlay could read the stale report.
+        """
+        self.page.wait_for_function(
+            self.SCAN_STARTED_PREDICATE,
+            arg=previous_url,
+            timeout=self.playwright_helper.page_ready_timeout_ms
+        )
\ No newline at end of file
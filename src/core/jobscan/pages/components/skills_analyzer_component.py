@@ -1,9 +1,32 @@
-from playwright.sync_api import Page, Locator
+from typing import Optional
+from playwright.sync_api import Page, Locator, expect
 from core.jobscan.models.jobscan_match_report import SkillType, SkillApplianceType, Skill
 from core.utils.ui_helpers import PlaywrightHelper
+from core.utils.normalization_helpers import SkillWhitelistIndex
 
 
 class SkillsAnalyzerComponent:
+    SHOW_MORE_BUTTON_SELECTOR = "//button[normalize-space(.)='Show more']"
+    NAME_COLUMN_SELECTOR = "span.name"
+
+    # Reads the whole skills table in one round trip. A matched count rendered as span.x means the skill is missing;
+    # the required count is the text of the cell following the matched count cell.
+    TABLE_ROWS_SCRIPT = """
+        container => {
+            const names = container.querySelectorAll("span.name");
+            const counts = container.querySelectorAll("span.count");
+            return Array.from(names, (name, i) => {
+                const count = counts[i];
+                const requiredCell = count ? count.parentElement.nextElementSibling : null;
+                return {
+                    name: name.innerText,
+                    matched: !count || count.querySelector("span.x") ? null : count.innerText,
+                    required: requiredCell ? requiredCell.innerText : null
+                };
+            });
+        }
+    """
+
     def __init__(self, page: Page, playwright_helper: PlaywrightHelper, container: Locator, skill_type: SkillType) -> None:
         self.page = page
         self.playwright_helper = playwright_helper
@@ -12,36 +35,31 @@ class SkillsAnalyzerComponent:
     
     @property
     def show_more_button(self) -> Locator:
-        return self.container.locator("//button[normalize-space(.)='Show more']")
+        return self.container.locator(self.SHOW_MORE_BUTTON_SELECTOR)
     
     @property
     def name_columns(self) -> Locator:
-        return self.container.locator("span.name")
+        return self.container.locator(self.NAME_COLUMN_SELECTOR)
 
-    @property
-    def matching_count_columns(self) -> Locator:
-        return self.container.locator("span.count")
+    @staticmethod
+    def build_skill(row: dict[str, Optional[str]], skill_type: SkillType, whitelisted_skills: SkillWhitelistIndex) -> Skill:
+        """Build a Skill from one extracted table row: {'name', 'matched' (None when missing), 'required'}."""
+        skill_matching_count = int(row["matched"]) if row.get("matched") else 0
+        skill_required_count = int(row["required"].split()[0]) if row.get("required") else 0
+        skill = Skill(name=row["name"], type=skill_type, required_quantity=skill_required_count, actual_quantity=skill_matching_count)
+        skill.update_is_supported(whitelisted_skills)
+        return skill
 
-    @property
-    def required_count_columns(self) -> Locator:
-        return self.matching_count_columns.locator("//parent::div/following-sibling::div[1]")
+    @staticmethod
+    def build_skills(rows: list[dict[str, Optional[str]]], skill_type: SkillType, whitelisted_skills: SkillWhitelistIndex) -> list[Skill]:
+        return [SkillsAnalyzerComponent.build_skill(row, skill_type, whitelisted_skills) for row in rows]
 
-    def process_skills(self, whitelisted_skills: list[str]) -> list[Skill]:
+    def process_skills(self, whitelisted_skills: SkillWhitelistIndex) -> list[Skill]:
         if self.playwright_helper.exists(self.show_more_button):
-            self.playwright_helper.human_like_mouse_move_and_click(self.page, self.show_more_button)
-        
-        skills: list[Skill] = []
-        skill_name_colum_texts = self.name_columns.all_inner_texts()
-        skill_matching_count_colum_texts = self.matching_count_columns.all_inner_texts()
-        skill_required_column_column_texts = self.required_count_columns.all_inner_texts()
-        for i in range(len(skill_name_colum_texts)):
-            skill_name = skill_name_colum_texts[i]
-            skill_matching_count = 0
-            if not self.playwright_helper.exists(self.matching_count_columns.nth(i).locator("span.x")):
-                skill_matching_count = int(skill_matching_count_colum_texts[i])
-            skill_required_count = int(skill_required_column_column_texts[i].split()[0])
-            skill = Skill(name=skill_name, type=self.skill_type, required_quantity=skill_required_count, actual_quantity=skill_matching_count)
-            skill.update_is_supported(whitelisted_skills)
-            skills.append(skill)
-
-        return skills
\ No newline at end of file
+            rows_before = self.name_columns.count()
+            self.playwright_helper.human_like_mouse_move_and_click(self.page, self.show_more_button, passive=True)
+            # The click is not paced, so wait for the table to expand before the rows are read in one go
+            expect(self.name_columns).not_to_have_count(rows_before, timeout=self.playwright_helper.page_ready_timeout_ms)
+
+        rows = self.container.evaluate(self.TABLE_ROWS_SCRIPT)
+        return self.build_skills(rows, self.skill_type, whitelisted_skills)
@@ -3,11 +3,14 @@ from core.utils.ui_helpers import PlaywrightHelper
 
 
 class JobscanReportModal:
+    MODAL_SELECTOR = "//div[@role='dialog'][.//h3[normalize-space(.)='Jobscan Report']]"
+    DISMISS_BUTTON_SELECTOR = "//button[normalize-space(.)='Dismiss']"
+
     def __init__(self, page: Page, playwright_helper: PlaywrightHelper):
         self.page = page
         self.playwright_helper = playwright_helper
-        self.modal = self.page.locator("//div[@role='dialog'][.//h3[normalize-space(.)='Jobscan Report']]")
-        self.dismiss_button = self.modal.locator("//button[normalize-space(.)='Dismiss']")
+        self.modal = self.page.locator(self.MODAL_SELECTOR)
+        self.dismiss_button = self.modal.locator(self.DISMISS_BUTTON_SELECTOR)
 
     def is_visible(self, timeout_ms: int = 5000) -> bool:
         try:
@@ -19,7 +22,7 @@ class JobscanReportModal:
         if not self.is_visible(timeout_ms):
             return False
         try:
-            self.playwright_helper.human_like_mouse_move_and_click(self.page, self.dismiss_button)
+            self.playwright_helper.human_like_mouse_move_and_click(self.page, self.dismiss_button, passive=True)
         except Exception:
             self.page.keyboard.press("Escape")
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from enum import Enum
-import time
-from playwright.sync_api import Page, Locator
+from typing import Any, Optional
+from playwright.sync_api import Page, Locator, expect
 from core.parsing.models.job_to_target import JobDetails
 from core.utils.ui_helpers import PlaywrightHelper
 from core.jobscan.pages.jobscan_report_modal import JobscanReportModal
@@ -10,6 +10,7 @@ from core.services.config.models.settings import JobscanSettings, ResumeSettings
 from core.jobscan.pages.components.skills_analyzer_component import SkillsAnalyzerComponent
 import re
 from core.jobscan.pages.components.new_scan_component import NewScanComponent
+from core.utils.normalization_helpers import SkillWhitelistIndex
 
 
 class SearchabilityMetrics(str, Enum):
@@ -23,6 +24,59 @@ class SearchabilityMetrics(str, Enum):
     FILE_TYPE = "File Type"
 
 class MatchReportPage:
+    # One snapshot of a findings section: titles, check descriptions, raw status classes and which checks offer
+    # an evidence modal or an 'Update' action, mirroring the locators used for interaction below.
+    FINDINGS_SNAPSHOT_SCRIPT = """
+        findings => findings.map(finding => {
+            const title = finding.querySelector("div.title");
+            return {
+                title: title ? title.innerText : "",
+                checks: Array.from(finding.querySelectorAll("div.checkRow"), check => {
+                    const icon = check.querySelector("div.checkIcon");
+                    const description = check.querySelector("div.description");
+                    return {
+                        description: description ? description.innerText : null,
+                        status_class: icon ? icon.getAttribute("class") : null,
+                        has_evidence: check.querySelector("div.evidence") !== null,
+                        has_update: Array.from(check.querySelectorAll("div.additional span")).some(span => span.textContent.toLowerCase().includes("update"))
+                    };
+                })
+            };
+        })
+    """
+
+    # Any non-whitespace text: the evidence modal is rendered empty first and filled in afterwards
+    MODAL_CONTENT_PATTERN = re.compile(r"\S")
+
+    TITLE_SELECTOR = "//div[normalize-space(.)='Resume scan results']"
+    SCAN_SIDEBAR_SELECTOR = "div.scan-sidebar"
+    SCORE_SELECTOR = "div#score span.number"
+    UPLOAD_AND_RESCAN_BUTTON_SELECTOR = "button#upload-and-scan"
+    SEARCHABILITY_SELECTOR = "div#searchability"
+    HARD_SKILLS_SELECTOR = "div#hardSkills + div.skillsAnalyzer"
+    SOFT_SKILLS_SELECTOR = "div#softSkills + div.skillsAnalyzer"
+    RECRUITER_TIPS_SELECTOR = "div#recruiterTips"
+    FORMATTING_SELECTOR = "div#formatting"
+    FINDINGS_SUFFIX_SELECTOR = " + div.findingSection div.finding"
+    NEW_SCAN_CONTAINER_SELECTOR = "div.baseModal"
+    # Finding checks and the modals they open
+    CHECK_ROW_SELECTOR = "div.checkRow"
+    CHECK_ICON_SELECTOR = "div.checkIcon"
+    CHECK_DESCRIPTION_SELECTOR = "div.description"
+    CHECK_EVIDENCE_SELECTOR = "div.evidence"
+    CHECK_UPDATE_SELECTOR = "div.additional span:has-text('Update')"
+    EVIDENCE_MODAL_SELECTOR = "div#modal"
+    EVIDENCE_MODAL_CLOSE_SELECTOR = "//button[@data-test='dismissableCloseIcon']"
+    UPDATE_MODAL_SELECTOR = "//div[contains(@class, 'modal')]"
+    JOB_OPPORTUNITY_MODAL_TITLE = "Job Opportunity"
+    UPDATE_DETAILS_BUTTON_SELECTOR = "//button[normalize-space(.)='Update Details']"
+
+    REPORT_READY_SELECTORS = (
+        f"{SCAN_SIDEBAR_SELECTOR} {SCORE_SELECTOR}",
+        HARD_SKILLS_SELECTOR,
+        SOFT_SKILLS_SELECTOR
+    )
+
     def __init__(self, page: Page, playwright_helper: PlaywrightHelper, jobscan_settings: JobscanSettings, resume_settings: ResumeSettings, job_details: JobDetails) -> None:
         self.page = page
         self.playwright_helper = playwright_helper
@@ -32,28 +86,28 @@ class MatchReportPage:
         self.jobscan_report_modal = JobscanReportModal(self.page, self.playwright_helper)
         self.jobscan_match_report = JobscanMatchReport()
 
-        self.title = self.page.locator("//div[normalize-space(.)='Resume scan results']")
-        self.scan_sidebar_container = self.page.locator("div.scan-sidebar")
+        self.title = self.page.locator(self.TITLE_SELECTOR)
+        self.scan_sidebar_container = self.page.locator(self.SCAN_SIDEBAR_SELECTOR)
         self.match_rate_title = self.scan_sidebar_container.get_by_role("heading", name="Match Rate")
-        self.score = self.scan_sidebar_container.locator("div#score span.number")
-        self.upload_and_rescan_button = self.scan_sidebar_container.locator("button#upload-and-scan")
+        self.score = self.scan_sidebar_container.locator(self.SCORE_SELECTOR)
+        self.upload_and_rescan_button = self.scan_sidebar_container.locator(self.UPLOAD_AND_RESCAN_BUTTON_SELECTOR)
         self.match_rate_bars = self.scan_sidebar_container.locator("div.match-rate-bar")
         # Searchability
-        self.searchability_container = self.page.locator("div#searchability")
-        self.searchability_metrics = self.page.locator("div#searchability + div.findingSection div.finding")
+        self.searchability_container = self.page.locator(self.SEARCHABILITY_SELECTOR)
+        self.searchability_metrics = self.page.locator(self.SEARCHABILITY_SELECTOR + self.FINDINGS_SUFFIX_SELECTOR)
         # Hard Skills
-        self.hard_skills_container = self.page.locator("div#hardSkills + div.skillsAnalyzer")
+        self.hard_skills_container = self.page.locator(self.HARD_SKILLS_SELECTOR)
         # Soft Skills
-        self.soft_skills_container = self.page.locator("div#softSkills + div.skillsAnalyzer")
+        self.soft_skills_container = self.page.locator(self.SOFT_SKILLS_SELECTOR)
         # Recruiter tips
-        self.recruiter_tips_container = self.page.locator("div#recruiterTips")
-        self.recruiter_tips_metrics = self.page.locator("div#recruiterTips + div.findingSection div.finding")
+        self.recruiter_tips_container = self.page.locator(self.RECRUITER_TIPS_SELECTOR)
+        self.recruiter_tips_metrics = self.page.locator(self.RECRUITER_TIPS_SELECTOR + self.FINDINGS_SUFFIX_SELECTOR)
         # Formatting
-        self.formatting_container = self.page.locator("div#formatting")
-        self.formatting_metrics = self.page.locator("div#formatting + div.findingSection div.finding")
+        self.formatting_container = self.page.locator(self.FORMATTING_SELECTOR)
+        self.formatting_metrics = self.page.locator(self.FORMATTING_SELECTOR + self.FINDINGS_SUFFIX_SELECTOR)
 
         self.new_scan_component = NewScanComponent(
-            container=self.page.locator("div.baseModal"),
+            container=self.page.locator(self.NEW_SCAN_CONTAINER_SELECTOR),
             page=self.page,
             playwright_helper=self.playwright_helper,
             resume_settings=self.resume_settings)
@@ -64,20 +118,15 @@ class MatchReportPage:
         
         issues_count_match = re.match(r"\d+", issues_text.inner_text())
         if issues_count_match and int(issues_count_match.group()) > 0:
-            self.playwright_helper.human_like_mouse_move_and_click(self.page, issues_text)
+            self.playwright_helper.human_like_mouse_move_and_click(self.page, issues_text, passive=True)
             return True
         return False
 
-    def _wait_for_match_report_page_to_load(self, timeout_seconds: int = 1) -> None:
+    def _wait_for_match_report_page_to_load(self) -> None:
         self.title.wait_for(state="visible", timeout=3000)
         self.upload_and_rescan_button.wait_for(state="visible", timeout=3000)
-        previous_score = self.score.inner_text()
-        while True:
-            time.sleep(timeout_seconds)
-            if self.score.inner_text() != previous_score:
-                previous_score = self.score.inner_text()
-            else:
-                break
+        # The score animates and the skill tables fill in after the page renders; wait until all of them settle
+        self.playwright_helper.wait_for_dom_quiet(self.page, required_selectors=self.REPORT_READY_SELECTORS)
 
     def process_match_report(self, iteration: int = 1) -> JobscanMatchReport:
         self._wait_for_match_report_page_to_load()
@@ -85,27 +134,25 @@ class MatchReportPage:
         
         jobscan_match_report = JobscanMatchReport(job_title=self.job_details.title, company=self.job_details.company, iteration=iteration, score=int(self.score.inner_text()), report_url=self.page.url)
         jobscan_match_report.metrics.update(self._check_and_process_metric(self.searchability_container, self.searchability_metrics))
-        hard_skills: list[Skill] = self._process_skills(SkillType.HARD_SKILL, self.resume_settings.get_normalized_whitelisted_hard_skills)
-        soft_skills: list[Skill] = self._process_skills(SkillType.SOFT_SKILL, self.resume_settings.get_normalized_whitelisted_soft_skills)
-        sorted_hard_skills: dict[SkillApplianceType, list[Skill]] = {
-            SkillApplianceType.APPLIED: [],
-            SkillApplianceType.MISSING: []
-        }
-        sorted_soft_skills: dict[SkillApplianceType, list[Skill]] = {
-            SkillApplianceType.APPLIED: [],
-            SkillApplianceType.MISSING: []
-        }
-        for skill in hard_skills:
-            sorted_hard_skills[skill.define_appliance_type()].append(skill)
-        for skill in soft_skills:
-            sorted_soft_skills[skill.define_appliance_type()].append(skill)
-        jobscan_match_report.hard_skills = sorted_hard_skills
-        jobscan_match_report.soft_skills = sorted_soft_skills
+        hard_skills: list[Skill] = self._process_skills(SkillType.HARD_SKILL, self.resume_settings.get_hard_skills_whitelist_index)
+        soft_skills: list[Skill] = self._process_skills(SkillType.SOFT_SKILL, self.resume_settings.get_soft_skills_whitelist_index)
+        jobscan_match_report.hard_skills = self.group_skills_by_appliance_type(hard_skills)
+        jobscan_match_report.soft_skills = self.group_skills_by_appliance_type(soft_skills)
         jobscan_match_report.metrics.update(self._check_and_process_metric(self.recruiter_tips_container, self.recruiter_tips_metrics))
         jobscan_match_report.metrics.update(self._check_and_process_metric(self.formatting_container, self.formatting_metrics))
         return jobscan_match_report
 
-    def _process_skills(self, skill_type: SkillType, whitelisted_skills: list[str]) -> list[Skill]:
+    @staticmethod
+    def group_skills_by_appliance_type(skills: list[Skill]) -> dict[SkillApplianceType, list[Skill]]:
+        sorted_skills: dict[SkillApplianceType, list[Skill]] = {
+            SkillApplianceType.APPLIED: [],
+            SkillApplianceType.MISSING: []
+        }
+        for skill in skills:
+            sorted_skills[skill.define_appliance_type()].append(skill)
+        return sorted_skills
+
+    def _process_skills(self, skill_type: SkillType, whitelisted_skills: SkillWhitelistIndex) -> list[Skill]:
         container = self.hard_skills_container if skill_type == SkillType.HARD_SKILL else self.soft_skills_container
         skills_analyzer_component = SkillsAnalyzerComponent(self.page, self.playwright_helper, container, skill_type)
         return skills_analyzer_component.process_skills(whitelisted_skills)
@@ -114,71 +161,107 @@ class MatchReportPage:
         metric_title = container.locator("h3").inner_text().split("\n")[0]
         return { metric_title: self._collect_metric_findings(findings) }
 
-    def _get_metric_status(self, element: Locator) -> CheckStatusType:
-        class_attr = self.playwright_helper.get_class_attr(element)
+    @staticmethod
+    def parse_check_status(class_attr: Optional[str]) -> CheckStatusType:
+        """The check status is the last class of div.checkIcon, e.g. 'checkIcon fail'."""
         status_value = class_attr.split()[-1] if class_attr else None
-        try:
-            return CheckStatusType(status_value)
-        except ValueError as e:
-            raise
+        return CheckStatusType(status_value)
+
+    @staticmethod
+    def build_metric_finding(title: str, checks: list[Check]) -> MetricFinding:
+        is_finding_fully_applied = all(check.status not in (CheckStatusType.FAIL, CheckStatusType.WARN) for check in checks)
+        return MetricFinding(title=title, is_fully_applied=is_finding_fully_applied, checks=checks)
+
+    @staticmethod
+    def build_metric_findings(snapshots: list[dict[str, Any]]) -> list[MetricFinding]:
+        """Build findings from FINDINGS_SNAPSHOT_SCRIPT output without any page interaction (no evidence details)."""
+        return [
+            MatchReportPage.build_metric_finding(
+                snapshot["title"],
+                [Check(description=check["description"], status=MatchReportPage.parse_check_status(check["status_class"])) for check in snapshot["checks"]]
+            )
+            for snapshot in snapshots
+        ]
+
+    @staticmethod
+    def offers_update(finding_title: str, status: CheckStatusType, check_snapshot: dict[str, Any]) -> bool:
+        """Whether a check should be fixed through its 'Update' action; the job title is left as Jobscan parsed it."""
+        return status in (CheckStatusType.FAIL, CheckStatusType.WARN) and check_snapshot["has_update"] and finding_title != SearchabilityMetrics.JOB_TITLE_MATCH.value
+
+    @staticmethod
+    def parse_evidence_details(modal_text: str) -> list[str]:
+        return [line.strip() for line in modal_text.splitlines() if line]
+
+    @staticmethod
+    def unsupported_update_error(modal_title: str) -> NotImplementedError:
+        return NotImplementedError(f"There is no functionality implemented for {modal_title} within _collect_metric_findings method")
+
+    @staticmethod
+    def job_opportunity_fields(job_details: JobDetails) -> dict[str, Optional[str]]:
+        """Labels of the Job Opportunity modal inputs mapped to the values they should hold; empty values are left alone."""
+        return {
+            "Which company are you applying to?": job_details.company,
+            "What job title are you applying for?": job_details.title,
+            "What is the url of the job listing?": job_details.url
+        }
+
+    def _get_metric_status(self, element: Locator) -> CheckStatusType:
+        return self.parse_check_status(self.playwright_helper.get_class_attr(element))
 
     def _collect_metric_findings(self, findings: Locator) -> list[MetricFinding]:
         metric_findings: list[MetricFinding] = []
-        for finding in findings.all():
-            finding_title = finding.locator("div.title").inner_text()
-            checks = finding.locator("div.checkRow").all()
-            metric_finding = MetricFinding(title=finding_title)
-            is_finding_fully_applied = True
+        snapshots = findings.evaluate_all(self.FINDINGS_SNAPSHOT_SCRIPT)
+        # Indices are checked against the latest snapshot, which is taken again after every update interaction
+        finding_index = 0
+        while finding_index < len(snapshots):
+            finding_title = snapshots[finding_index]["title"]
             finding_checks: list[Check] = []
 
-            for check in checks:
-                status = self._get_metric_status(check.locator("div.checkIcon"))
-                evidence_button = check.locator("div.evidence")
-                update_button = check.locator("div.additional span:has-text('Update')")
+            check_index = 0
+            while check_index < len(snapshots[finding_index]["checks"]):
+                check_snapshot = snapshots[finding_index]["checks"][check_index]
+                status = self.parse_check_status(check_snapshot["status_class"])
+                description = check_snapshot["description"]
                 details: list[str] = []
-                if self.playwright_helper.exists(evidence_button):
-                    self.playwright_helper.human_like_mouse_move_and_click(self.page, evidence_button)
-                    modal = self.page.locator("div#modal")
-                    details.extend(line.strip() for line in modal.inner_text().splitlines() if line)
-                    self.playwright_helper.human_like_mouse_move_and_click(self.page, modal.locator("//button[@data-test='dismissableCloseIcon']"))
-                elif (status == CheckStatusType.FAIL or status == CheckStatusType.WARN) and self.playwright_helper.exists(update_button) and finding_title != "Job Title Match":
-                    self.playwright_helper.human_like_mouse_move_and_click(self.page, update_button)
-                    modal = self.page.locator("//div[contains(@class, 'modal')]")
-                    modal_title = modal.get_by_role(role="heading").inner_text()
-                    if modal_title == "Job Opportunity":
-                        self._update_job_opportunity_data(self.job_details)
-                        status = self._get_metric_status(check.locator("div.checkIcon"))
-                    else:
-                        error_message = f"There is no functionality implemented for {modal_title} within {self._collect_metric_findings.__name__} method"
-                        raise NotImplementedError(error_message)
-                description = check.locator("div.description").inner_text()
-                if is_finding_fully_applied and (status == CheckStatusType.FAIL or status == CheckStatusType.WARN):
-                    is_finding_fully_applied = False
+                # Locators are resolved only for checks that need real interaction
+                if check_snapshot["has_evidence"]:
+                    check = findings.nth(finding_index).locator(self.CHECK_ROW_SELECTOR).nth(check_index)
+                    self.playwright_helper.human_like_mouse_move_and_click(self.page, check.locator(self.CHECK_EVIDENCE_SELECTOR), passive=True)
+                    modal = self.page.locator(self.EVIDENCE_MODAL_SELECTOR)
+                    # The clicks are not paced, so wait for the modal content and for the modal to close explicitly
+                    expect(modal).to_contain_text(self.MODAL_CONTENT_PATTERN, timeout=self.playwright_helper.page_ready_timeout_ms)
+                    details = self.parse_evidence_details(modal.inner_text())
+                    self.playwright_helper.human_like_mouse_move_and_click(self.page, modal.locator(self.EVIDENCE_MODAL_CLOSE_SELECTOR), passive=True)
+                    modal.wait_for(state="hidden", timeout=self.playwright_helper.page_ready_timeout_ms)
+                elif self.offers_update(finding_title, status, check_snapshot):
+                    check = findings.nth(finding_index).locator(self.CHECK_ROW_SELECTOR).nth(check_index)
+                    self.playwright_helper.human_like_mouse_move_and_click(self.page, check.locator(self.CHECK_UPDATE_SELECTOR))
+                    modal_title = self.page.locator(self.UPDATE_MODAL_SELECTOR).get_by_role(role="heading").inner_text()
+                    if modal_title != self.JOB_OPPORTUNITY_MODAL_TITLE:
+                        raise self.unsupported_update_error(modal_title)
+                    self._update_job_opportunity_data(self.job_details)
+                    status = self._get_metric_status(check.locator(self.CHECK_ICON_SELECTOR))
+                    description = check.locator(self.CHECK_DESCRIPTION_SELECTOR).inner_text()
+                    # The update can change other checks too, so the remaining ones need a fresh snapshot
+                    snapshots = findings.evaluate_all(self.FINDINGS_SNAPSHOT_SCRIPT)
                 finding_checks.append(Check(description=description, details=details, status=status))
+                check_index += 1
 
-            metric_finding.is_fully_applied = is_finding_fully_applied
-            metric_finding.checks = finding_checks
-            metric_findings.append(metric_finding)
+            metric_findings.append(self.build_metric_finding(finding_title, finding_checks))
+            finding_index += 1
 
         return metric_findings
 
     def _update_job_opportunity_data(self, job_details: JobDetails):
-        company_input = self.page.get_by_label("Which company are you applying to?")
-        job_title_input = self.page.get_by_label("What job title are you applying for?")
-        url_input = self.page.get_by_label("What is the url of the job listing?")
-        update_details_button = self.page.locator("//button[normalize-space(.)='Update Details']")
-
         #need to check after rescan - if the values are still missing/incorrect, then it would make sense to depend on the relevant properties from JobscanMatchReport
-        if company_input.input_value() != job_details.company:
-            self.playwright_helper.human_like_fill_data(self.page, company_input, job_details.company)
-        if job_title_input.input_value() != job_details.title:
-            self.playwright_helper.human_like_fill_data(self.page, job_title_input, job_details.title)
-        if job_details.url and url_input.input_value() != job_details.url:
-            self.playwright_helper.human_like_fill_data(self.page, url_input, job_details.url)
-        self.playwright_helper.human_like_mouse_move_and_click(self.page, update_details_button)
+        for label, value in self.job_opportunity_fields(job_details).items():
+            field_input = self.page.get_by_label(label)
+            if value and field_input.input_value() != value:
+                self.playwright_helper.human_like_fill_data(self.page, field_input, value)
+        self.playwright_helper.human_like_mouse_move_and_click(self.page, self.page.locator(self.UPDATE_DETAILS_BUTTON_SELECTOR))
 
     def rescan(self, path_to_resume: str, job_details: JobDetails) -> MatchReportPage:
         self.playwright_helper.human_like_mouse_move_and_click(self.page, self.upload_and_rescan_button)
         self.new_scan_component.scan(path_to_resume, job_details)
-        self.page.wait_for_url(self.jobscan_settings.match_report_url_pattern, timeout=15000)
+        self.page.wait_for_url(self.jobscan_settings.match_report_url_pattern, timeout=self.playwright_helper.page_ready_timeout_ms)
         return MatchReportPage(page=self.page, playwright_helper=self.playwright_helper, jobscan_settings=self.jobscan_settings, resume_settings=self.resume_settings, job_details=job_details)
\ No newline at end of file
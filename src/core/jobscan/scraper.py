@@ -1,6 +1,6 @@
 from pathlib import Path
-from typing import Optional
-from playwright.sync_api import Browser, BrowserContext, sync_playwright, Playwright, TimeoutError as PlaywrightTimeoutError
+from typing import Any, Optional
+from playwright.sync_api import Browser, BrowserContext, TimeoutError as PlaywrightTimeoutError
 import os
 import json
 from datetime import datetime, timedelta, timezone
@@ -13,6 +13,9 @@ from core.jobscan.models.jobscan_match_report import JobscanMatchReport
 from core.jobscan.pages.match_report_page import MatchReportPage
 from core.jobscan.pages.match_report_page import MatchReportPage
 from core.utils.session_helpers import Session
+from core.jobscan.session_pool import BrowserSessionPool
+from core.jobscan.network_filter import NetworkRequestFilter
+from core.jobscan.session_recorder import JobscanSessionRecorder
 from core.parsing.parsing_utils import MatchReportParserUtils
 import core.utils.paths as path_utils
 
@@ -25,15 +28,17 @@ class JobscanScraper:
         self.playwright_settings = playwright_settings
         self.job_details = job_details
         self.resume_settings = resume_settings
-        self.playwright_helper = PlaywrightHelper(self.playwright_settings)
+        self.playwright_helper = PlaywrightHelper(self.playwright_settings, self.jobscan_settings.session_mode)
         self.resume_path = path_utils.get_original_resume_file_path()
+        self.network_filter = NetworkRequestFilter(self.playwright_settings) if self.playwright_settings.network_filter_enabled else None
+        self.session_recorder = JobscanSessionRecorder(self.jobscan_settings)
 
     @staticmethod
-    def get_cached_user_agent(playwright: Playwright, path_to_cached_user_agent: str, max_age_days: int) -> str:
+    def get_cached_user_agent(browser: Browser, path_to_cached_user_agent: str, max_age_days: int) -> str:
         """
-        Get cached user agent or generate a new one with error handling and retry logic.
+        Get cached user agent or read a new one from the given browser with error handling and retry logic.
         Args:
-            playwright: Playwright instance
+            browser: Running browser to read navigator.userAgent from
             path_to_cached_user_agent: Path to cache file
             max_age_days: Maximum age of cached user agent in days
         Returns:
@@ -47,7 +52,7 @@ class JobscanScraper:
             return cached_user_agent
 
         # Generate new user agent with retry logic
-        return JobscanScraper._generate_user_agent_with_retry(playwright, path_to_cached_user_agent)
+        return JobscanScraper._generate_user_agent_with_retry(browser, path_to_cached_user_agent)
 
     @staticmethod
     def _load_cached_user_agent(path_to_cached_user_agent: str, max_age_days: int) -> Optional[str]:
@@ -84,16 +89,14 @@ class JobscanScraper:
             return None
 
     @staticmethod
-    def _generate_user_agent_with_retry(playwright: Playwright, path_to_cached_user_agent: str, max_retries: int = 3) -> str:
-        """Generate user agent with retry logic and error handling."""
-        browser = None
+    def _generate_user_agent_with_retry(browser: Browser, path_to_cached_user_agent: str, max_retries: int = 3) -> str:
+        """Generate user agent in a throwaway context of an already running browser with retry logic and error handling."""
         context = None
         
         for attempt in range(max_retries):
             try:
                 JobscanScraper.logger.info(f"Generating user agent (attempt {attempt + 1}/{max_retries})")
                 
-                browser = playwright.chromium.launch(headless=False)
                 context = browser.new_context()
                 page = context.new_page()
                 
@@ -122,11 +125,7 @@ class JobscanScraper:
                         context.close()
                     except Exception as e:
                         JobscanScraper.logger.warning(f"Error closing context: {e}")
-                if browser:
-                    try:
-                        browser.close()
-                    except Exception as e:
-                        JobscanScraper.logger.warning(f"Error closing browser: {e}")
+                    context = None
         else:
             raise RuntimeError("Exhausted retries without valid user agent")
 
@@ -151,19 +150,32 @@ class JobscanScraper:
     def open_session(self) -> Session:
         self._validate_workflow_inputs()
 
-        pw = sync_playwright().start()
-        ua = self.get_cached_user_agent(
-            pw,
-            self.playwright_settings.user_agent_cache_path,
-            self.playwright_settings.user_agent_cache_max_age_days,
+        # One browser process is shared by all scrapers; sessions are warm contexts handed out by the pool
+        pool = BrowserSessionPool.get_shared(
+            launch_browser=self._launch_browser_with_retry,
+            max_context_uses=self.playwright_settings.max_context_uses,
+            get_user_agent=lambda browser: self.get_cached_user_agent(
+                browser,
+                self.playwright_settings.user_agent_cache_path,
+                self.playwright_settings.user_agent_cache_max_age_days,
+            )
         )
-        browser = self._launch_browser_with_retry(pw)
-        context = self._create_browser_context_with_retry(browser, ua)
-        page = context.new_page()
-        return Session(pw, browser, context, page)
+        # The network filter is attached per session so that its stats count this scraper's requests only
+        session = pool.acquire(
+            create_context=self._create_browser_context_with_retry,
+            context_key=self._get_context_key(),
+            on_acquire=self.network_filter.attach if self.network_filter else None,
+            on_release=self.network_filter.detach if self.network_filter else None,
+            # A recorded session's HAR is only written when its context closes
+            reusable=self.session_recorder.reuses_contexts
+        )
+        # Synthetic delay is budgeted per session
+        self.playwright_helper.pacing_policy.start_session()
+        return session
 
     def navigate_to_dashboard(self, session: Session) -> None:
         self._navigate_to_dashboard_with_retry(session.page)
+        self.session_recorder.snapshot(session.page, "dashboard")
 
     def scan_resume(self, session: Session, path_to_resume: str, iteration: int = 1) -> tuple[JobscanMatchReport, MatchReportPage]:
         """
@@ -209,9 +221,9 @@ class JobscanScraper:
 
         except Exception as e:
             JobscanScraper.logger.error(f"Tailoring workflow failed: {e}")
-            # close session on failure
+            # close session on failure; a pooled context is recycled instead of reused
             if session and not keep_session_open:
-                session.close()
+                session.close(failed=True)
             raise
         finally:
             if session and not keep_session_open:
@@ -246,23 +258,33 @@ class JobscanScraper:
         else:
             raise RuntimeError("Exhausted retries while trying to launch a browser")
 
+    @staticmethod
+    def get_browser_context_options(jobscan_settings: JobscanSettings, playwright_settings: PlaywrightSettings, user_agent: Optional[str]) -> dict[str, Any]:
+        """Keyword arguments for browser.new_context, shared by the sync and async scrapers."""
+        return {
+            "storage_state": jobscan_settings.storage_state_path,
+            "user_agent": user_agent,
+            "viewport": {"width": playwright_settings.viewport_width, "height": playwright_settings.viewport_height},
+            "permissions": [],
+            "device_scale_factor": 1,
+            "is_mobile": False,
+            "has_touch": False,
+            "locale": playwright_settings.locale,
+            "timezone_id": playwright_settings.timezone_id
+        }
+
     def _create_browser_context_with_retry(self, browser, user_agent: Optional[str], max_retries: int = 3) -> BrowserContext:
         """Create browser context with retry logic."""
         for attempt in range(max_retries):
             try:
                 JobscanScraper.logger.info(f"Creating browser context (attempt {attempt + 1}/{max_retries})")
                 
-                return browser.new_context(
-                    storage_state=self.jobscan_settings.storage_state_path,
-                    user_agent=user_agent,
-                    viewport={"width": self.playwright_settings.viewport_width, "height": self.playwright_settings.viewport_height},
-                    permissions=[],
-                    device_scale_factor=1,
-                    is_mobile=False,
-                    has_touch=False,
-                    locale=self.playwright_settings.locale,
-                    timezone_id=self.playwright_settings.timezone_id
-                )
+                context_options = self.get_browser_context_options(self.jobscan_settings, self.playwright_settings, user_agent)
+                context_options.update(self.session_recorder.get_context_option_overrides())
+                context = browser.new_context(**context_options)
+                # Registered before the per-session network filter, which thus sees requests first and falls back to the HAR
+                self.session_recorder.prepare_context(context)
+                return context
             except Exception as e:
                 JobscanScraper.logger.warning(f"Context creation attempt {attempt + 1} failed: {e}")
                 if attempt == max_retries - 1:
@@ -270,6 +292,16 @@ class JobscanScraper:
         else:
             raise RuntimeError("Exhausted retries while trying to create browser context")
 
+    def _get_context_key(self) -> str:
+        """Everything _create_browser_context_with_retry depends on besides the pool-wide user agent."""
+        context_options = self.get_browser_context_options(self.jobscan_settings, self.playwright_settings, None)
+        context_options.update(self.session_recorder.get_context_option_overrides())
+        return json.dumps({
+            "context_options": context_options,
+            "session_mode": self.session_recorder.mode.value,
+            "recording_dir": str(self.session_recorder.recording_dir)
+        }, sort_keys=True)
+
     def _navigate_to_dashboard_with_retry(self, page, max_retries: int = 3) -> None:
         """Navigate to dashboard with retry logic."""
         for attempt in range(max_retries):
@@ -295,6 +327,10 @@ class JobscanScraper:
         """Execute the scanning workflow with error handling."""
         try:
             report = match_report_page.process_match_report(iteration=iteration)
+            self.session_recorder.snapshot(match_report_page.page, f"match_report_{iteration}")
+            if self.network_filter:
+                self.network_filter.log_summary()
+            self.playwright_helper.pacing_policy.log_summary()
             
             # Save report with error handling
             try:
@@ -0,0 +1,156 @@
+from __future__ import annotations
+import atexit
+from dataclasses import dataclass
+from typing import Callable, Optional
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+from core.utils.log_helper import LogHelper
+from core.utils.session_helpers import Session
+
+
+@dataclass
+class PooledContext:
+    context: BrowserContext
+    page: Page
+    context_key: str
+    uses: int = 0
+    reusable: bool = True
+    on_release: Optional[Callable[[BrowserContext], None]] = None
+
+
+class BrowserSessionPool:
+    """
+    Keeps one Playwright driver and browser process alive and hands out warm browser contexts (created from the
+    storage state, so already authenticated) wrapped in Sessions. Closing such a Session returns its context to
+    the pool; a context is recycled after max_context_uses sessions, when the session failed or when it was
+    acquired as not reusable.
+    Idle contexts are kept per context_key, so a context is only reused by callers that would have created it the
+    same way. Per-session state (route handlers, stats) is attached with on_acquire and removed with on_release,
+    so every caller sees its own hooks on a reused context.
+    Playwright's sync API is bound to the thread that started it, so a pool must only be used from one thread.
+    """
+    logger = LogHelper(__name__)
+    _shared: Optional[BrowserSessionPool] = None
+
+    def __init__(self, launch_browser: Callable[[Playwright], Browser], max_context_uses: int, get_user_agent: Optional[Callable[[Browser], str]] = None):
+        self.launch_browser = launch_browser
+        self.get_user_agent = get_user_agent
+        self.max_context_uses = max_context_uses
+        self._pw: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._user_agent: Optional[str] = None
+        self._idle: dict[str, list[PooledContext]] = {}
+        self._in_use: dict[int, PooledContext] = {}
+
+    @classmethod
+    def get_shared(cls, launch_browser: Callable[[Playwright], Browser], max_context_uses: int, get_user_agent: Optional[Callable[[Browser], str]] = None) -> BrowserSessionPool:
+        """Process-wide pool, created on first use and shut down at interpreter exit; contexts are configured per acquire()."""
+        if cls._shared is None:
+            cls._shared = cls(launch_browser, max_context_uses, get_user_agent)
+            atexit.register(cls._shared.shutdown)
+        return cls._shared
+
+    @property
+    def user_agent(self) -> Optional[str]:
+        return self._user_agent
+
+    def acquire(
+        self,
+        create_context: Callable[[Browser, Optional[str]], BrowserContext],
+        context_key: str,
+        on_acquire: Optional[Callable[[BrowserContext], None]] = None,
+        on_release: Optional[Callable[[BrowserContext], None]] = None,
+        reusable: bool = True,
+    ) -> Session:
+        """
+        Return a session on an idle context created for context_key, or on a new one from create_context.
+        on_acquire runs for every session (new or reused context), on_release when the session is released.
+        A session that is not reusable always gets a new context, which is closed when the session is released.
+        """
+        browser = self._ensure_browser()
+        idle = self._idle.get(context_key) if reusable else None
+        pooled = idle.pop() if idle else None
+        if pooled and pooled.page.is_closed():
+            pooled.page = pooled.context.new_page()
+        if pooled is None:
+            context = create_context(browser, self._user_agent)
+            pooled = PooledContext(context=context, page=context.new_page(), context_key=context_key, reusable=reusable)
+            BrowserSessionPool.logger.info("Created a new pooled browser context")
+        else:
+            BrowserSessionPool.logger.info(f"Reusing a warm browser context (used {pooled.uses} times)")
+        if on_acquire:
+            try:
+                on_acquire(pooled.context)
+            except Exception:
+                self._close_context(pooled)
+                raise
+        pooled.on_release = on_release
+        self._in_use[id(pooled.context)] = pooled
+        return Session(self._pw, browser, pooled.context, pooled.page, pool=self)
+
+    def release(self, session: Session, failed: bool = False) -> None:
+        """Return a session's context to the pool; releasing the same session twice is a no-op."""
+        pooled = self._in_use.pop(id(session.context), None)
+        if pooled is None:
+            return
+        pooled.uses += 1
+        if pooled.on_release:
+            try:
+                pooled.on_release(pooled.context)
+            except Exception as e:
+                BrowserSessionPool.logger.warning(f"Error detaching session hooks, recycling the context: {e}")
+                failed = True
+            pooled.on_release = None
+        if failed or not pooled.reusable or pooled.uses >= self.max_context_uses or not self._is_browser_alive():
+            reason = "after a failure" if failed else "at the end of its session" if not pooled.reusable else f"after {pooled.uses} uses"
+            BrowserSessionPool.logger.info(f"Recycling browser context {reason}")
+            self._close_context(pooled)
+            return
+        # Drop extra tabs so the next session starts from a single page
+        for page in pooled.context.pages:
+            if page is not pooled.page:
+                self._close_quietly(page)
+        self._idle.setdefault(pooled.context_key, []).append(pooled)
+
+    def shutdown(self) -> None:
+        for pooled in [pooled for idle in self._idle.values() for pooled in idle] + list(self._in_use.values()):
+            self._close_context(pooled)
+        self._idle.clear()
+        self._in_use.clear()
+        if self._browser:
+            self._close_quietly(self._browser)
+        if self._pw:
+            try:
+                self._pw.stop()
+            except Exception as e:
+                BrowserSessionPool.logger.warning(f"Error stopping Playwright: {e}")
+        self._browser = None
+        self._pw = None
+        if BrowserSessionPool._shared is self:
+            BrowserSessionPool._shared = None
+
+    def _ensure_browser(self) -> Browser:
+        if self._browser and self._is_browser_alive():
+            return self._browser
+        if self._browser:
+            BrowserSessionPool.logger.warning("Pooled browser disconnected, launching a new one")
+            self._idle.clear()
+            self._in_use.clear()
+        if self._pw is None:
+            self._pw = sync_playwright().start()
+        self._browser = self.launch_browser(self._pw)
+        if self.get_user_agent and self._user_agent is None:
+            self._user_agent = self.get_user_agent(self._browser)
+        return self._browser
+
+    def _is_browser_alive(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    def _close_context(self, pooled: PooledContext) -> None:
+        self._close_quietly(pooled.context)
+
+    @staticmethod
+    def _close_quietly(resource: Browser | BrowserContext | Page) -> None:
+        try:
+            resource.close()
+        except Exception as e:
+            BrowserSessionPool.logger.warning(f"Error closing pooled resource: {e}")
@@ -0,0 +1,110 @@
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+from playwright.sync_api import BrowserContext, Page
+from core.jobscan.models.enums import SessionMode
+from core.services.config.models.settings import JobscanSettings
+from core.utils.cache_helpers import FileUtils
+from core.utils.log_helper import LogHelper
+import core.utils.paths as path_utils
+
+
+class JobscanSessionRecorder:
+    """
+    Record/replay of Jobscan sessions, so the scraper can run end to end without a live account.
+    RECORD captures all network traffic of each session into its own HAR file (session_01.har, ...; written
+    when the session's context closes, so recorded contexts are never reused) and DOM snapshots of each stage
+    (dashboard, match reports) next to them.
+    REPLAY serves the n-th session from the n-th HAR through Playwright routing and aborts anything that was
+    not recorded, so no request leaves the machine; no storage state is needed either.
+    LIVE leaves contexts untouched.
+    """
+    HAR_FILE_NAME_TEMPLATE = "session_{:02d}.har"
+    SNAPSHOTS_DIR_NAME = "snapshots"
+    MANIFEST_FILE_NAME = "manifest.json"
+
+    logger = LogHelper(__name__)
+
+    def __init__(self, jobscan_settings: JobscanSettings, mode: Optional[SessionMode] = None, recording_name: Optional[str] = None):
+        self.jobscan_settings = jobscan_settings
+        self.mode = mode or jobscan_settings.session_mode
+        self.recording_dir = path_utils.get_jobscan_recording_dir_path(recording_name or jobscan_settings.recording_name)
+        self._snapshot_count = 0
+        self._session_count = 0
+
+    def get_har_path(self, session_number: int) -> Path:
+        return self.recording_dir / self.HAR_FILE_NAME_TEMPLATE.format(session_number)
+
+    def list_hars(self) -> list[Path]:
+        return sorted(self.recording_dir.glob(self.HAR_FILE_NAME_TEMPLATE.replace("{:02d}", "*"))) if self.recording_dir.is_dir() else []
+
+    @property
+    def snapshots_dir(self) -> Path:
+        return self.recording_dir / self.SNAPSHOTS_DIR_NAME
+
+    @property
+    def is_offline(self) -> bool:
+        return self.mode == SessionMode.REPLAY
+
+    @property
+    def reuses_contexts(self) -> bool:
+        """A recorded or replayed context belongs to one session: its HAR is per session and only written on close."""
+        return self.mode == SessionMode.LIVE
+
+    def get_context_option_overrides(self) -> dict[str, Any]:
+        """Options to merge into browser.new_context; a replayed session needs no logged-in storage state."""
+        if self.mode == SessionMode.REPLAY:
+            return {"storage_state": None}
+        return {}
+
+    def prepare_context(self, context: BrowserContext) -> None:
+        """Register HAR recording or replay on the new context of the next session; call before other route handlers are added."""
+        if self.mode == SessionMode.LIVE:
+            return
+        self._session_count += 1
+        har_path = self.get_har_path(self._session_count)
+        if self.mode == SessionMode.RECORD:
+            if self._session_count == 1:
+                # A new recording replaces the sessions of the previous one
+                for stale_har in self.list_hars():
+                    stale_har.unlink()
+            self.recording_dir.mkdir(parents=True, exist_ok=True)
+            context.route_from_har(har_path, update=True, update_content="embed", update_mode="full")
+            JobscanSessionRecorder.logger.info(f"Recording Jobscan session to {har_path}")
+        else:
+            if not har_path.is_file():
+                raise FileNotFoundError(f"No recorded Jobscan session at {har_path}; run once with session_mode 'record'")
+            context.route_from_har(har_path, not_found="abort")
+            JobscanSessionRecorder.logger.info(f"Replaying Jobscan session from {har_path}")
+
+    def snapshot(self, page: Page, stage: str) -> Optional[Path]:
+        """Save the current DOM of page as {n}_{stage}.html when recording; no-op otherwise."""
+        if self.mode != SessionMode.RECORD:
+            return None
+        self._snapshot_count += 1
+        if self._snapshot_count == 1:
+            # A new recording replaces the snapshots of the previous one
+            for stale_snapshot in self.list_snapshots():
+                stale_snapshot.unlink()
+        file_name = f"{self._snapshot_count:02d}_{re.sub(r'[^A-Za-z0-9_-]+', '_', stage)}.html"
+        snapshot_path = self.snapshots_dir / file_name
+        FileUtils.write_text_atomic(snapshot_path, page.content())
+        self._update_manifest(file_name, stage, page.url)
+        JobscanSessionRecorder.logger.info(f"Saved DOM snapshot {snapshot_path}")
+        return snapshot_path
+
+    def list_snapshots(self) -> list[Path]:
+        return sorted(self.snapshots_dir.glob("*.html")) if self.snapshots_dir.is_dir() else []
+
+    def _update_manifest(self, file_name: str, stage: str, url: str) -> None:
+        manifest_path = self.recording_dir / self.MANIFEST_FILE_NAME
+        manifest: dict[str, Any] = {"recorded_at": datetime.now(timezone.utc).isoformat(), "snapshots": []}
+        if self._snapshot_count > 1 and manifest_path.is_file():
+            try:
+                manifest = json.loads(manifest_path.read_text())
+            except (OSError, ValueError) as e:
+                JobscanSessionRecorder.logger.warning(f"Recording manifest is unreadable, starting a new one: {e}")
+        manifest["snapshots"].append({"file_name": file_name, "stage": stage, "url": url})
+        FileUtils.write_text_atomic(manifest_path, json.dumps(manifest, indent=2))
@@ -0,0 +1,110 @@
+import glob
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from core.parsing.position_matcher import PositionMatcher
+from core.parsing.resume_parser import ResumeParser
+from core.services.config.config_manager import ConfigManager
+from core.utils.cache_helpers import FileUtils
+from core.utils.log_helper import LogHelper
+import core.utils.paths as path_utils
+
+
+class BatchParseResult(BaseModel):
+    resume_path: str
+    output_path: Optional[str] = None
+    duration_seconds: float
+    error: Optional[str] = None
+
+class BatchParseSummary(BaseModel):
+    source: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    max_workers: int
+    total: int = 0
+    succeeded: int = 0
+    failures: List[BatchParseResult] = Field(default_factory=list)
+    results: List[BatchParseResult] = Field(default_factory=list)
+
+
+def _init_worker() -> None:
+    """Load settings and compile the position matcher once per worker process instead of once per file."""
+    ConfigManager()
+    PositionMatcher.load(path_utils.get_positions_file_path())
+
+
+def _parse_resume_file(resume_path: str, output_path: str) -> BatchParseResult:
+    start = time.perf_counter()
+    try:
+        resume = ResumeParser(Path(resume_path)).parse()
+        FileUtils.write_text_atomic(Path(output_path), json.dumps(resume.model_dump(mode="json")))
+        return BatchParseResult(resume_path=resume_path, output_path=output_path, duration_seconds=time.perf_counter() - start)
+    except Exception as e:
+        return BatchParseResult(resume_path=resume_path, duration_seconds=time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+
+
+class BatchResumeParser:
+    SUMMARY_FILE_NAME = "batch_summary.json"
+
+    def __init__(self, max_workers: Optional[int] = None, output_dir: Optional[Path] = None):
+        self.config = ConfigManager()
+        self.logger = LogHelper("batch_resume_parser")
+        self.max_workers = max_workers or self.config.settings.batch_parsing.max_workers
+        self.output_dir = Path(output_dir) if output_dir else path_utils.get_batch_parsing_output_dir_path()
+
+    def collect_resume_paths(self, source: str) -> list[Path]:
+        """Return resumes from a directory (non-recursive, supported formats only) or a glob pattern."""
+        source_path = Path(source)
+        supported_formats = {file_format.lower() for file_format in self.config.settings.resume.supported_formats}
+        if source_path.is_dir():
+            candidates = source_path.iterdir()
+        else:
+            candidates = (Path(path) for path in glob.glob(source, recursive=True))
+        return sorted(path for path in candidates if path.is_file() and path.suffix.lower() in supported_formats)
+
+    def _get_output_paths(self, resume_paths: list[Path]) -> dict[Path, Path]:
+        """Map each resume to its JSON output, disambiguating resumes that share a file name."""
+        output_paths: dict[Path, Path] = {}
+        used_names: set[str] = set()
+        for resume_path in resume_paths:
+            name = resume_path.stem
+            suffix = 1
+            while name in used_names:
+                suffix += 1
+                name = f"{resume_path.stem}_{suffix}"
+            used_names.add(name)
+            output_paths[resume_path] = self.output_dir / f"{name}.json"
+        return output_paths
+
+    def parse(self, source: str) -> BatchParseSummary:
+        resume_paths = self.collect_resume_paths(source)
+        summary = BatchParseSummary(source=source, started_at=datetime.now(timezone.utc), max_workers=self.max_workers, total=len(resume_paths))
+        if not resume_paths:
+            self.logger.warning(f"No resumes found for {source}")
+        else:
+            self.logger.info(f"Parsing {len(resume_paths)} resumes with {self.max_workers} workers")
+            output_paths = self._get_output_paths(resume_paths)
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker) as executor:
+                futures = [
+                    executor.submit(_parse_resume_file, str(resume_path), str(output_paths[resume_path]))
+                    for resume_path in resume_paths
+                ]
+                for future in as_completed(futures):
+                    result = future.result()
+                    summary.results.append(result)
+                    if result.error:
+                        summary.failures.append(result)
+                        self.logger.error(f"Failed to parse {result.resume_path} in {result.duration_seconds:.2f}s: {result.error}")
+                    else:
+                        summary.succeeded += 1
+                        self.logger.info(f"Parsed {result.resume_path} in {result.duration_seconds:.2f}s")
+
+        summary.finished_at = datetime.now(timezone.utc)
+        summary_path = self.output_dir / self.SUMMARY_FILE_NAME
+        FileUtils.write_text_atomic(summary_path, summary.model_dump_json(indent=2))
+        self.logger.info(f"Batch parsing finished: {summary.succeeded}/{summary.total} succeeded, summary written to {summary_path}")
+        return summary
@@ -59,6 +59,9 @@ class ResumeLite(BaseModel):
     class Config:
         model_config = {"validate_assignment": True}  # validate on assignment
 
+    def get_lite_version(self):
+        return self
+
     def write_to_file(self) -> None:
         parsed_resume_file_path = path_utils.get_parsed_resume_file_path()
         parsed_resume_file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+from typing import Dict, Optional
+import json
+from core.parsing.models.enums import ResumeSectionType
+import core.utils.paths as path_utils
+
+
+class ResumeSectionHashes(BaseModel):
+    fingerprint: str
+    sections: Dict[ResumeSectionType, str] = Field(default_factory=dict)
+
+    class Config:
+        model_config = {"validate_assignment": True}  # validate on assignment
+
+    def get_changed_sections(self, previous: Optional["ResumeSectionHashes"]) -> set[ResumeSectionType]:
+        """Sections whose content differs from previous; everything is changed when parser inputs differ."""
+        if not previous or previous.fingerprint != self.fingerprint:
+            return set(self.sections)
+        return {
+            section_type for section_type in set(self.sections) | set(previous.sections)
+            if previous.sections.get(section_type) != self.sections.get(section_type)
+        }
+
+    def write_to_file(self) -> None:
+        section_hashes_file_path = path_utils.get_parsed_resume_sections_file_path()
+        section_hashes_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with section_hashes_file_path.open("w+") as f:
+            json.dump(self.model_dump(mode="json"), f)
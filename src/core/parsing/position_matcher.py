@@ -0,0 +1,134 @@
+import pickle
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar, Optional
+from core.parsing.parsing_utils import PositionUtils
+from core.utils.cache_helpers import FileUtils
+from core.utils.helpers import HashUtils
+from core.utils.log_helper import LogHelper
+import core.utils.paths as path_utils
+
+
+@dataclass(frozen=True)
+class PositionMatch:
+    position: str
+    dates: str
+    start: int
+    end: int
+
+
+class PositionMatcher:
+    """
+    Aho–Corasick automaton over all position aliases from positions.json.
+    Finds "<position> <MM/YYYY...>" lines in a single pass over the experience text,
+    independent of how many aliases are configured. Matching follows the regex
+    r"(alias_1|alias_2|...)\\s+(\\d{2}/\\d{4}.*?)\\n": leftmost match wins and,
+    for aliases starting at the same offset, the one listed first in positions.json.
+    """
+    # Bump whenever the pickled layout changes so stale cache files are ignored
+    CACHE_FORMAT_VERSION = "1"
+    DATES_PATTERN = re.compile(r"\s+(\d{2}/\d{4}.*?)\n")
+
+    logger = LogHelper(__name__)
+    _compiled: ClassVar[dict[str, "PositionMatcher"]] = {}
+
+    def __init__(self, aliases: list[str]):
+        self.aliases = aliases
+        self._transitions: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Alias indices recognised at each state, including those reachable through fail links
+        self._outputs: list[list[int]] = [[]]
+        self._build()
+
+    @classmethod
+    def load(cls, positions_file_path: Path) -> "PositionMatcher":
+        """Return the matcher for the current positions file, compiling it at most once per content hash."""
+        positions_hash = HashUtils.sha256_text(cls.CACHE_FORMAT_VERSION, HashUtils.sha256_file(positions_file_path))
+        matcher = cls._compiled.get(positions_hash)
+        if matcher:
+            return matcher
+
+        cache_file_path = path_utils.get_position_matcher_cache_file_path(positions_hash)
+        matcher = cls._load_from_cache(cache_file_path)
+        if not matcher:
+            matcher = cls(PositionUtils.get_supported_positions(positions_file_path, cls.logger))
+            cls._save_to_cache(cache_file_path, matcher)
+        cls._compiled[positions_hash] = matcher
+        return matcher
+
+    @classmethod
+    def _load_from_cache(cls, cache_file_path: Path) -> Optional["PositionMatcher"]:
+        if not cache_file_path.is_file():
+            return None
+        try:
+            with cache_file_path.open("rb") as f:
+                matcher = pickle.load(f)
+            if isinstance(matcher, cls):
+                cls.logger.debug(f"Loaded compiled position matcher from {cache_file_path}")
+                return matcher
+            cls.logger.warning(f"Unexpected object in position matcher cache {cache_file_path}")
+        except Exception as e:
+            # A stale or corrupt pickle can fail in many ways (ImportError, TypeError, ValueError, ...); rebuild instead
+            cls.logger.warning(f"Could not load position matcher cache {cache_file_path}: {e}")
+        return None
+
+    @classmethod
+    def _save_to_cache(cls, cache_file_path: Path, matcher: "PositionMatcher") -> None:
+        try:
+            FileUtils.write_bytes_atomic(cache_file_path, pickle.dumps(matcher, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError as e:
+            cls.logger.warning(f"Could not save position matcher cache {cache_file_path}: {e}")
+            # Don't raise - caching failure shouldn't break parsing
+
+    def _build(self) -> None:
+        for alias_index, alias in enumerate(self.aliases):
+            if not alias:
+                continue
+            state = 0
+            for char in alias:
+                next_state = self._transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(self._transitions)
+                    self._transitions.append({})
+                    self._fail.append(0)
+                    self._outputs.append([])
+                    self._transitions[state][char] = next_state
+                state = next_state
+            self._outputs[state].append(alias_index)
+
+        # Breadth-first pass to link each state to its longest proper suffix state
+        queue = list(self._transitions[0].values())
+        for state in queue:
+            for char, next_state in self._transitions[state].items():
+                fail_state = self._fail[state]
+                while fail_state and char not in self._transitions[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._transitions[fail_state].get(char, 0)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+                queue.append(next_state)
+
+    def find_position_lines(self, text: str) -> list[PositionMatch]:
+        transitions = self._transitions
+        fail = self._fail
+        outputs = self._outputs
+        candidates: list[tuple[int, int]] = []
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in transitions[state]:
+                state = fail[state]
+            state = transitions[state].get(char, 0)
+            for alias_index in outputs[state]:
+                candidates.append((index + 1 - len(self.aliases[alias_index]), alias_index))
+
+        matches: list[PositionMatch] = []
+        last_end = 0
+        for start, alias_index in sorted(candidates):
+            if start < last_end:
+                continue
+            alias = self.aliases[alias_index]
+            dates_match = self.DATES_PATTERN.match(text, start + len(alias))
+            if dates_match:
+                matches.append(PositionMatch(position=alias, dates=dates_match.group(1), start=start, end=dates_match.end()))
+                last_end = dates_match.end()
+        return matches
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+
+class ResumeParagraph(NamedTuple):
+    style: Optional[str]
+    text: str
+
+
+class ParagraphReader(ABC):
+    """Format backend that turns a resume file into the (style, text) paragraph stream consumed by ResumeParser."""
+
+    def __init__(self, resume_path: Path):
+        self.resume_path = Path(resume_path)
+
+    @abstractmethod
+    def read_paragraphs(self) -> Iterator[ResumeParagraph]:
+        ...
@@ -0,0 +1,156 @@
+import posixpath
+import zipfile
+from typing import IO, Iterator, Optional
+from xml.etree import ElementTree
+from core.parsing.readers.base_reader import ParagraphReader, ResumeParagraph
+
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+def _w(tag: str) -> str:
+    return f"{{{W_NS}}}{tag}"
+
+
+class DocxParagraphReader(ParagraphReader):
+    """
+    Streams (style, text) pairs for the body paragraphs of a .docx file.
+    Mirrors python-docx `Document.paragraphs` / `Paragraph.style.name` / `Paragraph.text`
+    without building the python-docx object model: styles are read once and
+    word/document.xml is walked with an incremental parser.
+    """
+    PACKAGE_RELS_PART = "_rels/.rels"
+    OFFICE_DOCUMENT_REL_SUFFIX = "/officeDocument"
+    STYLES_REL_SUFFIX = "/styles"
+    DEFAULT_DOCUMENT_PART = "word/document.xml"
+
+    # python-docx reports a few built-in styles by their UI name (BabelFish), e.g. 'heading 1' -> 'Heading 1'
+    UI_STYLE_NAMES = {
+        "caption": "Caption",
+        "footer": "Footer",
+        "header": "Header",
+        **{f"heading {level}": f"Heading {level}" for level in range(1, 10)},
+    }
+
+    BODY = _w("body")
+    PARAGRAPH = _w("p")
+    PARAGRAPH_PROPERTIES = _w("pPr")
+    PARAGRAPH_STYLE = _w("pStyle")
+    RUN = _w("r")
+    HYPERLINK = _w("hyperlink")
+    TEXT = _w("t")
+    TAB = _w("tab")
+    POSITIONAL_TAB = _w("ptab")
+    BREAK = _w("br")
+    CARRIAGE_RETURN = _w("cr")
+    NO_BREAK_HYPHEN = _w("noBreakHyphen")
+    VAL = _w("val")
+    TYPE = _w("type")
+
+    def read_paragraphs(self) -> Iterator[ResumeParagraph]:
+        with zipfile.ZipFile(self.resume_path) as archive:
+            document_part = self._get_document_part_name(archive)
+            style_names, default_style_name = self._read_paragraph_styles(archive, document_part)
+            with archive.open(document_part) as stream:
+                yield from self._iter_body_paragraphs(stream, style_names, default_style_name)
+
+    def _get_document_part_name(self, archive: zipfile.ZipFile) -> str:
+        target = self._find_relationship_target(archive, self.PACKAGE_RELS_PART, self.OFFICE_DOCUMENT_REL_SUFFIX, base_dir="")
+        return target or self.DEFAULT_DOCUMENT_PART
+
+    @staticmethod
+    def _find_relationship_target(archive: zipfile.ZipFile, rels_part: str, rel_type_suffix: str, base_dir: str) -> Optional[str]:
+        try:
+            rels = ElementTree.fromstring(archive.read(rels_part))
+        except KeyError:
+            return None
+        for relationship in rels.iter(f"{{{REL_NS}}}Relationship"):
+            if relationship.get("Type", "").endswith(rel_type_suffix) and relationship.get("TargetMode") != "External":
+                target = relationship.get("Target", "")
+                if target.startswith("/"):
+                    return target.lstrip("/")
+                return posixpath.normpath(posixpath.join(base_dir, target))
+        return None
+
+    def _read_paragraph_styles(self, archive: zipfile.ZipFile, document_part: str) -> tuple[dict[str, Optional[str]], Optional[str]]:
+        """Return paragraph style names by style id and the default paragraph style name."""
+        document_dir, document_file = posixpath.split(document_part)
+        rels_part = posixpath.join(document_dir, "_rels", f"{document_file}.rels")
+        styles_part = self._find_relationship_target(archive, rels_part, self.STYLES_REL_SUFFIX, base_dir=document_dir)
+        style_names: dict[str, Optional[str]] = {}
+        default_style_name: Optional[str] = None
+        if not styles_part:
+            return style_names, default_style_name
+
+        try:
+            styles = ElementTree.fromstring(archive.read(styles_part))
+        except KeyError:
+            return style_names, default_style_name
+
+        for style in styles.iter(_w("style")):
+            if style.get(self.TYPE, "paragraph") != "paragraph":
+                continue
+            name_element = style.find(_w("name"))
+            raw_name = name_element.get(self.VAL) if name_element is not None else None
+            name = self.UI_STYLE_NAMES.get(raw_name, raw_name) if raw_name is not None else None
+            style_id = style.get(_w("styleId"))
+            if style_id is not None:
+                style_names[style_id] = name
+            if style.get(_w("default")) in ("1", "true", "on"):
+                # Spec calls for the last default in document order
+                default_style_name = name
+        return style_names, default_style_name
+
+    def _iter_body_paragraphs(self, stream: IO[bytes], style_names: dict[str, Optional[str]], default_style_name: Optional[str]) -> Iterator[ResumeParagraph]:
+        depth = 0
+        body: Optional[ElementTree.Element] = None
+        body_depth = -1
+        for event, element in ElementTree.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if element.tag == self.BODY and body is None:
+                    body = element
+                    body_depth = depth
+                continue
+
+            if body is not None and depth == body_depth + 1:
+                # Direct body child is complete; paragraphs nested in tables are skipped like python-docx does
+                if element.tag == self.PARAGRAPH:
+                    yield ResumeParagraph(self._get_style_name(element, style_names, default_style_name), self._get_paragraph_text(element))
+                # Drop processed content so memory stays flat regardless of document size
+                body.remove(element)
+            depth -= 1
+
+    def _get_style_name(self, paragraph: ElementTree.Element, style_names: dict[str, Optional[str]], default_style_name: Optional[str]) -> Optional[str]:
+        properties = paragraph.find(self.PARAGRAPH_PROPERTIES)
+        style = properties.find(self.PARAGRAPH_STYLE) if properties is not None else None
+        style_id = style.get(self.VAL) if style is not None else None
+        if style_id is None or style_id not in style_names:
+            return default_style_name
+        return style_names[style_id]
+
+    def _get_paragraph_text(self, paragraph: ElementTree.Element) -> str:
+        parts: list[str] = []
+        for child in paragraph:
+            if child.tag == self.RUN:
+                self._append_run_text(child, parts)
+            elif child.tag == self.HYPERLINK:
+                for run in child.iterfind(self.RUN):
+                    self._append_run_text(run, parts)
+        return "".join(parts)
+
+    def _append_run_text(self, run: ElementTree.Element, parts: list[str]) -> None:
+        for child in run:
+            tag = child.tag
+            if tag == self.TEXT:
+                parts.append(child.text or "")
+            elif tag == self.TAB or tag == self.POSITIONAL_TAB:
+                parts.append("\t")
+            elif tag == self.BREAK:
+                if child.get(self.TYPE, "textWrapping") == "textWrapping":
+                    parts.append("\n")
+            elif tag == self.CARRIAGE_RETURN:
+                parts.append("\n")
+            elif tag == self.NO_BREAK_HYPHEN:
+                parts.append("-")
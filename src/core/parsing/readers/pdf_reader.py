@@ -0,0 +1,31 @@
+from typing import Iterator
+from pypdf import PdfReader
+from core.parsing.readers.base_reader import ParagraphReader, ResumeParagraph
+
+
+class PdfParagraphReader(ParagraphReader):
+    """
+    PDF resumes via pypdf text extraction. PDFs carry no paragraph styles, so each extracted
+    line becomes a paragraph, bullet glyphs are stripped (DOCX list bullets carry none), and
+    lines wrapped from a previous line (starting lowercase) are merged back into it.
+    """
+    BULLET_GLYPHS = "•●▪■◦‣∙–-*"
+
+    def read_paragraphs(self) -> Iterator[ResumeParagraph]:
+        pending: str | None = None
+        for page in PdfReader(str(self.resume_path)).pages:
+            for raw_line in (page.extract_text() or "").splitlines():
+                line = raw_line.strip()
+                if not line:
+                    continue
+                is_bullet = line[0] in self.BULLET_GLYPHS and line[1:2].isspace()
+                if is_bullet:
+                    line = line[1:].strip()
+                elif pending is not None and line[0].islower():
+                    pending = f"{pending} {line}"
+                    continue
+                if pending is not None:
+                    yield ResumeParagraph(None, pending)
+                pending = line
+        if pending is not None:
+            yield ResumeParagraph(None, pending)
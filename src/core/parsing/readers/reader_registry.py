@@ -0,0 +1,45 @@
+import importlib
+from pathlib import Path
+from core.parsing.readers.base_reader import ParagraphReader
+
+
+class ReaderRegistry:
+    """
+    Maps file suffixes to paragraph reader backends. Backends are referenced by module path and
+    imported only when a file of their type is read, so unused format libraries are never loaded.
+    """
+    _backends: dict[str, tuple[str, str]] = {
+        ".docx": ("core.parsing.readers.docx_reader", "DocxParagraphReader"),
+        ".pdf": ("core.parsing.readers.pdf_reader", "PdfParagraphReader"),
+        ".txt": ("core.parsing.readers.text_reader", "TextParagraphReader"),
+    }
+    _loaded: dict[str, type[ParagraphReader]] = {}
+
+    @classmethod
+    def register(cls, suffix: str, module_path: str, class_name: str) -> None:
+        suffix = suffix.lower()
+        cls._backends[suffix] = (module_path, class_name)
+        cls._loaded.pop(suffix, None)
+
+    @classmethod
+    def supported_formats(cls) -> list[str]:
+        return list(cls._backends)
+
+    @classmethod
+    def is_supported(cls, suffix: str) -> bool:
+        return suffix.lower() in cls._backends
+
+    @classmethod
+    def get_reader_class(cls, suffix: str) -> type[ParagraphReader]:
+        suffix = suffix.lower()
+        if suffix not in cls._backends:
+            raise ValueError(f"No paragraph reader registered for '{suffix}'. Supported: {cls.supported_formats()}")
+        if suffix not in cls._loaded:
+            module_path, class_name = cls._backends[suffix]
+            cls._loaded[suffix] = getattr(importlib.import_module(module_path), class_name)
+        return cls._loaded[suffix]
+
+    @classmethod
+    def create_reader(cls, resume_path: Path) -> ParagraphReader:
+        resume_path = Path(resume_path)
+        return cls.get_reader_class(resume_path.suffix)(resume_path)
@@ -0,0 +1,11 @@
+from typing import Iterator
+from core.parsing.readers.base_reader import ParagraphReader, ResumeParagraph
+
+
+class TextParagraphReader(ParagraphReader):
+    """Plain text resumes: every line is a paragraph; there are no styles, so headings are detected by casing."""
+
+    def read_paragraphs(self) -> Iterator[ResumeParagraph]:
+        with self.resume_path.open("r", encoding="utf-8-sig", errors="replace") as f:
+            for line in f:
+                yield ResumeParagraph(None, line.rstrip("\r\n"))
@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+from typing import Optional
+from core.parsing.models.enums import ResumeSectionType
+from core.parsing.models.resume import Resume
+from core.parsing.models.section_hashes import ResumeSectionHashes
+from core.parsing.parsing_utils import ResumeParserUtils
+from core.services.config.config_manager import ConfigManager
+from core.utils.cache_helpers import FileCacheIndex
+from core.utils.helpers import HashUtils
+from core.utils.log_helper import LogHelper
+import core.utils.paths as path_utils
+
+
+class ResumeParseCache:
+    """
+    Parsed resume cache keyed by the content of everything the parser depends on:
+    the source resume file, the parsing settings and positions.json.
+    The latest result is also kept as the parsed resume JSON plus its section hashes,
+    so that edited resumes re-parse only the sections that changed.
+    """
+    # Bump whenever ResumeParser output changes for the same inputs, so old entries are never served
+    CACHE_FORMAT_VERSION = "2"
+    SECTION_HASHES_METADATA_KEY = "section_hashes"
+
+    def __init__(self) -> None:
+        self.config = ConfigManager()
+        self.logger = LogHelper("resume_parse_cache")
+        self.cache_index = FileCacheIndex(
+            path_utils.get_parse_cache_dir_path(),
+            max_entries=self.config.settings.parse_cache.max_entries,
+            logger=self.logger
+        )
+
+    def compute_fingerprint(self) -> str:
+        """Hash of the parser inputs other than the resume itself."""
+        return HashUtils.sha256_text(
+            self.CACHE_FORMAT_VERSION,
+            self.config.settings.parsing.model_dump_json(),
+            HashUtils.sha256_file(path_utils.get_positions_file_path())
+        )
+
+    def compute_key(self, resume_path: Path, fingerprint: str) -> str:
+        return HashUtils.sha256_text(fingerprint, HashUtils.sha256_file(resume_path))
+
+    def get_or_parse(self, resume_path: Path) -> tuple[Resume, set[ResumeSectionType]]:
+        """
+        Return the parsed resume and the sections that changed compared to the previously parsed resume,
+        so downstream stages can skip unchanged work.
+        """
+        resume_path = Path(resume_path)
+        fingerprint = self.compute_fingerprint()
+        key = self.compute_key(resume_path, fingerprint)
+        previous_resume, previous_hashes = self._load_previous_parse()
+
+        cached = self._load_cached(key, resume_path)
+        if cached:
+            resume, section_hashes = cached
+            if previous_resume is None:
+                changed_sections = set(ResumeSectionType)
+            else:
+                changed_sections = section_hashes.get_changed_sections(previous_hashes)
+        else:
+            self.logger.info(f"Parse cache miss for {resume_path.name}")
+            # Imported lazily so that a cache hit never loads a format backend
+            from core.parsing.resume_parser import ResumeParser
+            resume, section_hashes, changed_sections = ResumeParser(resume_path).parse_incremental(previous_resume, previous_hashes, fingerprint)
+            self.cache_index.put(
+                key,
+                f"{key}.json",
+                json.dumps(resume.model_dump(mode="json")),
+                metadata={"source_path": str(resume_path), self.SECTION_HASHES_METADATA_KEY: section_hashes.model_dump(mode="json")}
+            )
+
+        resume.write_to_file()
+        section_hashes.write_to_file()
+        return resume, changed_sections
+
+    def _load_cached(self, key: str, resume_path: Path) -> Optional[tuple[Resume, ResumeSectionHashes]]:
+        entry = self.cache_index.get(key)
+        if not entry:
+            return None
+        try:
+            resume = ResumeParserUtils.parse_resume(self.cache_index.get_entry_path(entry), self.logger)
+            section_hashes = ResumeSectionHashes.model_validate(entry.metadata[self.SECTION_HASHES_METADATA_KEY])
+            self.logger.info(f"Parse cache hit for {resume_path.name}")
+            return resume, section_hashes
+        except (KeyError, ValueError) as e:
+            self.logger.warning(f"Cached resume for {resume_path.name} is corrupted, parsing again: {e}")
+            self.cache_index.remove(key)
+            return None
+
+    def _load_previous_parse(self) -> tuple[Optional[Resume], Optional[ResumeSectionHashes]]:
+        parsed_resume_file_path = path_utils.get_parsed_resume_file_path()
+        section_hashes_file_path = path_utils.get_parsed_resume_sections_file_path()
+        if not parsed_resume_file_path.is_file() or not section_hashes_file_path.is_file():
+            return None, None
+        try:
+            resume = ResumeParserUtils.parse_resume(parsed_resume_file_path, self.logger)
+            with section_hashes_file_path.open("r") as f:
+                section_hashes = ResumeSectionHashes.model_validate_json(f.read())
+            return resume, section_hashes
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Previous parse is unreadable, parsing all sections: {e}")
+            return None, None
@@ -1,20 +1,29 @@
-from docx import Document
 from core.parsing.models.enums import ResumeSectionType, HeaderFields, ProfessionalSummaryFields, ProfessionalExperienceFields, EducationFields, ProfessionalDevelopmentFields, TechnicalSkillsFields
-import re
-from core.utils.helpers import TextUtils, ValidationUtils, EnumUtils
-from core.parsing.parsing_utils import PositionUtils
+from typing import Any, Callable
+from core.utils.helpers import TextUtils, ValidationUtils, EnumUtils, HashUtils
+from core.parsing.position_matcher import PositionMatch, PositionMatcher
+from core.parsing.readers.base_reader import ResumeParagraph
+from core.parsing.readers.reader_registry import ReaderRegistry
 from core.utils.log_helper import LogHelper
 from core.services.config.config_manager import ConfigManager
 from core.parsing.models.resume import Degree, Resume, Header, ProfessionalSummary, ProfessionalExperience, Education 
+from core.parsing.models.section_hashes import ResumeSectionHashes
 from pathlib import Path
 import core.utils.paths as path_utils
 
 class ResumeParser:
     HEADER_REQUIRED_FIELDS = [HeaderFields.NAME, HeaderFields.LOCATION, HeaderFields.PHONE, HeaderFields.EMAIL, HeaderFields.WORK_AUTHORIZED]
     PROFESSIONAL_SUMMARY_REQUIRED_FIELDS = [ProfessionalSummaryFields.SUMMARY, ProfessionalSummaryFields.HIGHLIGHTS]
-    PROFESSIONAL_EXPERIENCE_POSITION_PATTERN = r"({})\s+(\d{{2}}/\d{{4}}.*?)\n"
+    # Resume field populated from each section
+    SECTION_FIELDS = {
+        ResumeSectionType.HEADER: "header",
+        ResumeSectionType.PROFESSIONAL_SUMMARY: "professional_summary",
+        ResumeSectionType.TECHNICAL_SKILLS: "technical_skills",
+        ResumeSectionType.PROFESSIONAL_EXPERIENCE: "professional_experience_list",
+        ResumeSectionType.EDUCATION: "education",
+        ResumeSectionType.PROFESSIONAL_DEVELOPMENT_OR_AFFILIATIONS: "professional_development_list",
+    }
 
-    # TODO: add support for other file formats (pdf, txt, etc.)
     def __init__(self, resume_path: Path):
         self.config = ConfigManager()
         self.logger = LogHelper("resume_parser")
@@ -26,19 +35,24 @@ class ResumeParser:
             self.logger.error(error_message)
             raise FileNotFoundError(error_message)
 
-        if self.resume_path.suffix.lower() != ".docx":
-            error_message = f"Unsupported file format. Expected '.docx', got {self.resume_path.suffix}"
+        supported_formats = [file_format.lower() for file_format in self.config.settings.resume.supported_formats]
+        if self.resume_path.suffix.lower() not in supported_formats or not ReaderRegistry.is_supported(self.resume_path.suffix):
+            error_message = f"Unsupported file format. Expected one of {supported_formats}, got {self.resume_path.suffix}"
             self.logger.error(error_message)
             raise ValueError(error_message)
 
+        self._paragraphs: list[ResumeParagraph] | None = None
+
+    def _read_paragraphs(self) -> list[ResumeParagraph]:
+        """Read (style, text) paragraphs in a single streaming pass, shared by all parse methods."""
+        if self._paragraphs is None:
+            self._paragraphs = list(ReaderRegistry.create_reader(self.resume_path).read_paragraphs())
+        return self._paragraphs
+
     def parse_resume_text(self) -> str:
         try:
             self.logger.info("Starting to parse resume")
-            doc = Document(str(self.resume_path))
-            text = ""
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text += paragraph.text + "\n"
+            text = "".join(f"{paragraph.text}\n" for paragraph in self._read_paragraphs() if paragraph.text.strip())
             self.logger.info("Resume parsing completed successfully")
             return text
         except Exception as e:
@@ -48,14 +62,13 @@ class ResumeParser:
     def _parse_resume_sections(self) -> dict[ResumeSectionType, list[str]]:
         try:
             self.logger.info("Starting to separate resume sections")
-            doc = Document(str(self.resume_path))
             sections: dict[ResumeSectionType, list[str]] = {}
             current_section = ResumeSectionType.HEADER
             sections[current_section] = []
 
-            for paragraph in doc.paragraphs:
+            for paragraph in self._read_paragraphs():
                 if paragraph.text.strip():
-                    if (paragraph.style and paragraph.style.name and paragraph.style.name.startswith("Heading")) or \
+                    if (paragraph.style and paragraph.style.startswith("Heading")) or \
                     (len(paragraph.text.strip()) < 50 and paragraph.text.strip().isupper()):
                         current_section = EnumUtils.get_section_type(paragraph.text)
                         if current_section not in sections:
@@ -81,6 +94,45 @@ class ResumeParser:
             professional_development_list = self._parse_resume_professional_development(sections[ResumeSectionType.PROFESSIONAL_DEVELOPMENT_OR_AFFILIATIONS])
         )
 
+    def parse_incremental(self, previous_resume: Resume | None, previous_hashes: ResumeSectionHashes | None, fingerprint: str) -> tuple[Resume, ResumeSectionHashes, set[ResumeSectionType]]:
+        """
+        Re-parse only the sections whose paragraphs changed since previous_hashes and splice them into previous_resume.
+        fingerprint identifies the parser inputs besides the resume itself (settings, positions); when it differs every section is re-parsed.
+        Returns the resume, its section hashes and the sections that changed.
+        """
+        sections = self._parse_resume_sections()
+        section_hashes = ResumeSectionHashes(
+            fingerprint=fingerprint,
+            sections={section_type: HashUtils.sha256_text(*section_text) for section_type, section_text in sections.items()}
+        )
+        if previous_resume is None or previous_hashes is None:
+            changed_sections = set(self.SECTION_FIELDS)
+        else:
+            changed_sections = section_hashes.get_changed_sections(previous_hashes)
+        if previous_resume is not None and not changed_sections:
+            self.logger.info("No resume sections changed since the previous parse")
+            return previous_resume, section_hashes, changed_sections
+
+        section_parsers = self._get_section_parsers()
+        fields: dict[str, Any] = {}
+        for section_type, field_name in self.SECTION_FIELDS.items():
+            if previous_resume is not None and section_type not in changed_sections:
+                fields[field_name] = getattr(previous_resume, field_name)
+            else:
+                fields[field_name] = section_parsers[section_type](sections[section_type])
+        self.logger.info(f"Re-parsed changed sections: {sorted(section_type.value for section_type in changed_sections)}")
+        return Resume(**fields), section_hashes, changed_sections
+
+    def _get_section_parsers(self) -> dict[ResumeSectionType, Callable[[list[str]], Any]]:
+        return {
+            ResumeSectionType.HEADER: self._parse_resume_header,
+            ResumeSectionType.PROFESSIONAL_SUMMARY: self._parse_resume_professional_summary,
+            ResumeSectionType.TECHNICAL_SKILLS: self._parse_resume_technical_skills,
+            ResumeSectionType.PROFESSIONAL_EXPERIENCE: self._parse_resume_professional_experience,
+            ResumeSectionType.EDUCATION: self._parse_resume_education,
+            ResumeSectionType.PROFESSIONAL_DEVELOPMENT_OR_AFFILIATIONS: self._parse_resume_professional_development,
+        }
+
     def _parse_resume_header(self, header_text: list[str]) -> Header:
         if not header_text or len(header_text) < self.config.settings.parsing.min_header_lines:
             error = f"{ResumeSectionType.HEADER.value} section has insufficient data {header_text}"
@@ -142,24 +194,23 @@ class ResumeParser:
             return []
         
         experience_text = "\n".join(experience_list)
-        positions = PositionUtils.get_supported_positions(path_utils.get_positions_file_path())
+        position_matcher = PositionMatcher.load(path_utils.get_positions_file_path())
         professional_experience_list: list[ProfessionalExperience] = []
 
-        # Regex to find each position and its start line
-        position_pattern =  re.compile(self.PROFESSIONAL_EXPERIENCE_POSITION_PATTERN.format('|'.join(map(re.escape, positions))))
-        matches = list(position_pattern.finditer(experience_text))
+        # Find each position and its start line
+        matches = position_matcher.find_position_lines(experience_text)
         for i, match in enumerate(matches):
             professional_experience_list.append(self._parse_position_details(i, match, matches, experience_text))
         self.logger.info(f"Successfully parsed {ResumeSectionType.PROFESSIONAL_EXPERIENCE.value} section")
         return professional_experience_list
 
-    def _parse_position_details(self, index: int, match: re.Match, matches: list[re.Match], experience_text: str) -> ProfessionalExperience:
-        position = match.group(1).strip()
-        dates = match.group(2).strip()
+    def _parse_position_details(self, index: int, match: PositionMatch, matches: list[PositionMatch], experience_text: str) -> ProfessionalExperience:
+        position = match.position.strip()
+        dates = match.dates.strip()
 
         # Capture block of experience text
-        start_idx = match.end()
-        end_idx = matches[index + 1].start() if index + 1 < len(matches) else len(experience_text)
+        start_idx = match.end
+        end_idx = matches[index + 1].start if index + 1 < len(matches) else len(experience_text)
         block = experience_text[start_idx:end_idx].strip()
         lines = block.splitlines()
 
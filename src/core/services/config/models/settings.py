@@ -2,7 +2,10 @@ from functools import cached_property
 from pydantic import BaseModel
 from typing import List
 from core.utils.log_helper import LogLevelEnum
-from core.utils.normalization_helpers import NormalizationUtils
+from core.jobscan.models.enums import SessionMode
+from core.utils.pacing import PacingProfile
+from core.services.cv.models.enums import TailoringMode
+from core.utils.normalization_helpers import SkillWhitelistIndex
 
 
 class ResumeSettings(BaseModel):
@@ -14,20 +17,32 @@ class ResumeSettings(BaseModel):
     positions_file: str
     whitelisted_hard_skills: List[str]
     whitelisted_soft_skills: List[str]
+    estimator_hard_skills_score_weight: float
+    estimator_soft_skills_score_weight: float
 
     @cached_property
-    def get_normalized_whitelisted_hard_skills(self) -> list[str]:
-        return NormalizationUtils.normalize_values(self.whitelisted_hard_skills)
+    def get_hard_skills_whitelist_index(self) -> SkillWhitelistIndex:
+        return SkillWhitelistIndex(self.whitelisted_hard_skills)
 
     @cached_property
-    def get_normalized_whitelisted_soft_skills(self) -> list[str]:
-        return NormalizationUtils.normalize_values(self.whitelisted_soft_skills)
+    def get_soft_skills_whitelist_index(self) -> SkillWhitelistIndex:
+        return SkillWhitelistIndex(self.whitelisted_soft_skills)
 
 class JobDetails(BaseModel):
     job_details_file: str
 
 class CvTailorSettings(BaseModel):
     prompt_instructions_file: str
+    response_cache_enabled: bool
+    response_cache_path: str
+    response_cache_max_entries: int
+    response_cache_max_age_days: int
+    requests_per_minute: int
+    tokens_per_minute: int
+    max_concurrent_requests: int
+    max_retries: int
+    tailoring_mode: TailoringMode
+    section_max_attempts: int
 
 class LoggingSettings(BaseModel):
     level: LogLevelEnum
@@ -40,10 +55,23 @@ class ParsingSettings(BaseModel):
     professional_experience_company_location_separator: str
     education_university_country_separator: str
 
+class ParseCacheSettings(BaseModel):
+    cache_path: str
+    max_entries: int
+
+class BatchParsingSettings(BaseModel):
+    output_path: str
+    max_workers: int
+
 class JobscanSettings(BaseModel):
     home_url: str
     match_report_url_pattern: str
     storage_state_path: str
+    max_concurrent_scans: int
+    min_seconds_between_scans: float
+    session_mode: SessionMode
+    recordings_path: str
+    recording_name: str
 
 class PlaywrightSettings(BaseModel):
     user_agent_cache_path: str
@@ -54,6 +82,15 @@ class PlaywrightSettings(BaseModel):
     viewport_height: int
     min_delay: float
     max_delay: float
+    pacing_profile: PacingProfile
+    pacing_budget_seconds: float
+    dom_quiet_window_ms: int
+    page_ready_timeout_ms: int
+    max_context_uses: int
+    network_filter_enabled: bool
+    blocked_resource_types: list[str]
+    blocked_url_patterns: list[str]
+    stubbed_url_patterns: list[str]
 
 class SettingsModel(BaseModel):
     resume: ResumeSettings
@@ -61,5 +98,7 @@ class SettingsModel(BaseModel):
     cv_tailor: CvTailorSettings
     logging: LoggingSettings
     parsing: ParsingSettings
+    parse_cache: ParseCacheSettings
+    batch_parsing: BatchParsingSettings
     jobscan: JobscanSettings
     playwright: PlaywrightSettings
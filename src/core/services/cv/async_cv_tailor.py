@@ -0,0 +1,98 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional, Sequence
+from core.parsing.models.job_to_target import JobDetails
+from core.parsing.models.resume import ResumeLite, TailoredResumeLite
+from core.parsing.parsing_utils import PromptParserUtils
+from core.services.config.config_manager import ConfigManager
+from core.services.cv.cv_tailor import TailorAIService
+from core.services.openai.async_openai_client import AsyncOpenAIClient
+from core.services.openai.models.prompt_instructions import KeywordStatistics
+from core.services.openai.rate_limiter import RequestRateLimiter
+from core.utils.log_helper import LogHelper
+import core.utils.paths as path_utils
+
+
+@dataclass
+class TailoringJob:
+    resume: ResumeLite
+    keyword_statistics: KeywordStatistics
+    job_details: JobDetails
+    # Overrides the task instructions, e.g. for a single resume section
+    task_instructions: Optional[str] = None
+
+
+@dataclass
+class TailoringResult:
+    job: TailoringJob
+    tailored_resume: Optional[TailoredResumeLite] = None
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+
+
+class AsyncTailorAIService:
+    """
+    Tailors resumes for many jobs concurrently with one API key. At most max_concurrent_requests are in
+    flight and all of them share the requests/tokens per minute limits, so a large batch finishes in about
+    the time the rate limits allow instead of the sum of the latencies. Prompts and parsing are the ones of
+    TailorAIService, and so is the response cache.
+    """
+
+    def __init__(self, max_concurrent_requests: Optional[int] = None):
+        self.config = ConfigManager()
+        self.logger = LogHelper("async_openai_client")
+        cv_tailor_settings = self.config.settings.cv_tailor
+        api_key = TailorAIService.get_api_key(self.config, self.logger)
+        self.response_cache = TailorAIService.create_response_cache(cv_tailor_settings)
+        self.rate_limiter = RequestRateLimiter(cv_tailor_settings.requests_per_minute, cv_tailor_settings.tokens_per_minute)
+        self.openai_client = AsyncOpenAIClient(api_key, self.rate_limiter, max_retries=cv_tailor_settings.max_retries, response_cache=self.response_cache)
+        self.max_concurrent_requests = max_concurrent_requests or cv_tailor_settings.max_concurrent_requests
+        self.prompt_instructions = PromptParserUtils.parse_prompt_instructions(path_utils.get_prompt_instructions_file_path(), self.logger)
+
+    async def tailor_cv(self, job: TailoringJob, bypass_cache: bool = False) -> TailoredResumeLite:
+        prompt = TailorAIService.build_prompt(self.prompt_instructions, job.job_details, job.resume, job.keyword_statistics, job.task_instructions)
+        # the tailored resume is about as long as the resume that goes in
+        expected_output_tokens = AsyncOpenAIClient.estimate_tokens(json.dumps(job.resume.get_lite_version().model_dump(mode="json")))
+        result = await self.openai_client.request_openai(prompt, expected_output_tokens=expected_output_tokens, bypass_cache=bypass_cache)
+        try:
+            return TailorAIService.parse_tailored_resume(result)
+        except (ValueError, TypeError):
+            # never serve an unusable response again
+            cache_key = self.openai_client.get_cache_key(prompt)
+            if cache_key:
+                self.response_cache.remove(cache_key)
+            raise
+
+    async def tailor_many(self, jobs: Sequence[TailoringJob], bypass_cache: bool = False) -> AsyncIterator[TailoringResult]:
+        """Yield a TailoringResult per job as soon as it completes; failures are results with an error, not exceptions."""
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        started_at = time.perf_counter()
+
+        async def run(job: TailoringJob) -> TailoringResult:
+            async with semaphore:
+                job_started_at = time.perf_counter()
+                try:
+                    tailored_resume = await self.tailor_cv(job, bypass_cache=bypass_cache)
+                    return TailoringResult(job=job, tailored_resume=tailored_resume, duration_seconds=time.perf_counter() - job_started_at)
+                except Exception as e:
+                    self.logger.error(f"Tailoring failed for {job.job_details.company} {job.job_details.title}: {e}")
+                    return TailoringResult(job=job, error=str(e), duration_seconds=time.perf_counter() - job_started_at)
+
+        failures = 0
+        try:
+            for next_result in asyncio.as_completed([run(job) for job in jobs]):
+                result = await next_result
+                failures += bool(result.error)
+                yield result
+        finally:
+            self.logger.info(
+                f"Tailored {len(jobs) - failures}/{len(jobs)} resumes in {time.perf_counter() - started_at:.1f}s "
+                f"(concurrency {self.max_concurrent_requests}, {self.rate_limiter.total_wait_seconds:.1f}s waiting for rate limits, "
+                f"{self.openai_client.retried_requests} retries)"
+            )
+            self.response_cache.log_summary()
+
+    async def close(self) -> None:
+        await self.openai_client.close()
@@ -1,36 +1,68 @@
 from core.services.config.config_manager import ConfigManager
 from core.services.openai.openai_client import OpenAIClient
+from core.services.openai.response_cache import OpenAIResponseCache
+from core.services.cv.models.enums import TailoringMode
+from core.services.cv.resume_patcher import ResumePatcher
+from core.services.cv.streaming_resume_validator import StreamingTailoredResumeValidator
+from core.services.openai.models.tailoring_patch import TailoringPatch
 import core.utils.paths as path_utils
 from core.utils.helpers import KeywordUtils
 from core.parsing.parsing_utils import PromptParserUtils
 from core.utils.log_helper import LogHelper
 from core.parsing.models.resume import Resume, ResumeLite, TailoredResumeLite
-from core.services.openai.models.prompt_instructions import KeywordStatistics
+from core.services.openai.models.prompt_instructions import KeywordStatistics, Prompt
+from core.services.config.models.settings import CvTailorSettings
 from core.parsing.models.job_to_target import JobDetails
+from typing import Optional
 import json
 
 
 class TailorAIService:
+    # Structured output derived from TailoredResumeLite; not strict, since strict mode needs every property required
+    TAILORED_RESUME_TEXT_FORMAT = {
+        "type": "json_schema",
+        "name": "tailored_resume",
+        "schema": TailoredResumeLite.model_json_schema(),
+        "strict": False
+    }
+
     def __init__(self, job_description: JobDetails):
         self.config = ConfigManager()
         self.logger = LogHelper("openai_client")
         self.job_description = job_description
-        api_key = self.config.get_openai_api_key()
+        api_key = self.get_api_key(self.config, self.logger)
+        self.response_cache = self.create_response_cache(self.config.settings.cv_tailor)
+        self.openai_client = OpenAIClient(api_key, response_cache=self.response_cache)
+        self.prompt_instructions = PromptParserUtils.parse_prompt_instructions(path_utils.get_prompt_instructions_file_path(), self.logger)
+
+    @staticmethod
+    def get_api_key(config: ConfigManager, logger: LogHelper) -> str:
+        api_key = config.get_openai_api_key()
         if not api_key:
             error = "OpenAI api key is missing"
-            self.logger.error(error)
+            logger.error(error)
             raise ValueError(error)
-        self.openai_client = OpenAIClient(api_key)
-        self.prompt_instructions = PromptParserUtils.parse_prompt_instructions(path_utils.get_prompt_instructions_file_path(), self.logger)
+        return api_key
 
-    def tailor_cv(self, resume: Resume, keyword_statistics: KeywordStatistics) -> TailoredResumeLite:
-        system: str = self.prompt_instructions.get_system_instructions()
-        task: str = self.prompt_instructions.get_task_instructions()
+    @staticmethod
+    def create_response_cache(cv_tailor_settings: CvTailorSettings) -> OpenAIResponseCache:
+        return OpenAIResponseCache(
+            path_utils.get_openai_response_cache_dir_path(),
+            max_entries=cv_tailor_settings.response_cache_max_entries,
+            max_age_days=cv_tailor_settings.response_cache_max_age_days,
+            enabled=cv_tailor_settings.response_cache_enabled
+        )
+
+    @staticmethod
+    def build_prompt(prompt_instructions: Prompt, job_description: JobDetails, resume: ResumeLite, keyword_statistics: KeywordStatistics, task: Optional[str] = None) -> dict[str, str]:
+        """System and user messages of a tailoring request; shared by the sync and async services. task overrides the task instructions."""
+        system: str = prompt_instructions.get_system_instructions()
+        task = task or prompt_instructions.get_task_instructions()
         resume_lite: ResumeLite = resume.get_lite_version()
 
         user = f"""
         JOB DESCRIPTION:
-        {str(self.job_description)}
+        {str(job_description)}
 
         KEYWORD REQUIREMENTS:
         {KeywordUtils.keywords_to_json(keyword_statistics)}
@@ -42,13 +74,40 @@ class TailorAIService:
         {task}
         """
 
-        result = self.openai_client.request_openai(
-            {
-                "system": system,
-                "user": user
-            }
-        )
+        return {
+            "system": system,
+            "user": user
+        }
+
+    @staticmethod
+    def build_patch_prompt(prompt_instructions: Prompt, job_description: JobDetails, resume: Resume, keyword_statistics: KeywordStatistics) -> dict[str, str]:
+        """Like build_prompt, but the resume elements carry stable ids and only edit operations are asked for."""
+        system: str = prompt_instructions.get_patch_system_instructions()
+        task: str = prompt_instructions.get_patch_task_instructions()
+        identified_resume = ResumePatcher.build_identified_resume(resume.get_lite_version())
+
+        user = f"""
+        JOB DESCRIPTION:
+        {str(job_description)}
+
+        KEYWORD REQUIREMENTS:
+        {KeywordUtils.keywords_to_json(keyword_statistics)}
+
+        CURRENT RESUME (JSON, elements keyed by id):
+        {json.dumps(identified_resume)}
 
+        TASK:
+        {task}
+        """
+
+        return {
+            "system": system,
+            "user": user
+        }
+
+    @staticmethod
+    def parse_tailored_resume(result: str | dict) -> TailoredResumeLite:
+        """Raises ValueError (incl. pydantic ValidationError) or TypeError for unusable responses."""
         if isinstance(result, str):
             data = json.loads(result)
         elif isinstance(result, dict):
@@ -58,6 +117,80 @@ class TailorAIService:
 
         return TailoredResumeLite.model_validate(data)
 
+    def tailor(self, resume: Resume, keyword_statistics: KeywordStatistics, bypass_cache: bool = False) -> TailoredResumeLite:
+        """Tailor with the configured cv_tailor.tailoring_mode; the sections mode is served by SectionTailoringService."""
+        tailoring_mode = self.config.settings.cv_tailor.tailoring_mode
+        if tailoring_mode == TailoringMode.STREAMING:
+            return self.tailor_cv_streaming(resume, keyword_statistics, bypass_cache)
+        if tailoring_mode == TailoringMode.PATCH:
+            return self.tailor_cv_patch(resume, keyword_statistics, bypass_cache)
+        if tailoring_mode == TailoringMode.SECTIONS:
+            raise ValueError("Section-parallel tailoring is done by SectionTailoringService")
+        return self.tailor_cv(resume, keyword_statistics, bypass_cache)
+
+    def tailor_cv(self, resume: Resume, keyword_statistics: KeywordStatistics, bypass_cache: bool = False) -> TailoredResumeLite:
+        """Identical requests (resume, keywords, job description, instructions) are answered from the response cache unless bypass_cache is set."""
+        prompt = self.build_prompt(self.prompt_instructions, self.job_description, resume, keyword_statistics)
+        result = self.openai_client.request_openai(prompt, bypass_cache=bypass_cache)
+
+        try:
+            tailored_resume = self.parse_tailored_resume(result)
+        except (ValueError, TypeError):
+            # never serve an unusable response again
+            cache_key = self.openai_client.get_cache_key(prompt)
+            if cache_key:
+                self.response_cache.remove(cache_key)
+            raise
+        finally:
+            self.response_cache.log_summary()
 
+        return tailored_resume
+
+    def tailor_cv_streaming(self, resume: Resume, keyword_statistics: KeywordStatistics, bypass_cache: bool = False) -> TailoredResumeLite:
+        """
+        Like tailor_cv, but with schema-constrained output that is validated while it streams: each experience and
+        keyword coverage entry is checked as soon as it is complete, and the first violation aborts the generation.
+        """
+        prompt = self.build_prompt(self.prompt_instructions, self.job_description, resume, keyword_statistics)
+        validator = StreamingTailoredResumeValidator()
+        stream = self.openai_client.stream_openai(prompt, self.TAILORED_RESUME_TEXT_FORMAT, bypass_cache=bypass_cache)
+        try:
+            for chunk in stream:
+                validator.feed(chunk)
+            tailored_resume = validator.finish()
+        except ValueError:
+            stream.close()
+            # never serve an unusable response again
+            cache_key = self.openai_client.get_cache_key(prompt, text_format=self.TAILORED_RESUME_TEXT_FORMAT)
+            if cache_key:
+                self.response_cache.remove(cache_key)
+            self.logger.error(f"Streamed tailoring rejected after {len(validator.scanner.buffer)} characters")
+            raise
+        finally:
+            self.logger.info(f"Streamed tailoring: {validator.stats.summary()}")
+            self.response_cache.log_summary()
+
+        return tailored_resume
+
+    def tailor_cv_patch(self, resume: Resume, keyword_statistics: KeywordStatistics, bypass_cache: bool = False) -> TailoredResumeLite:
+        """
+        Patch protocol: the model returns only edit operations on element ids plus keyword_coverage,
+        and the tailored resume is rebuilt locally, so unchanged content is never generated.
+        """
+        prompt = self.build_patch_prompt(self.prompt_instructions, self.job_description, resume, keyword_statistics)
+        result = self.openai_client.request_openai(prompt, bypass_cache=bypass_cache)
 
+        try:
+            patch = TailoringPatch.model_validate_json(result)
+            tailored_resume = ResumePatcher.apply(resume.get_lite_version(), patch)
+        except ValueError:
+            # never serve an unusable response again
+            cache_key = self.openai_client.get_cache_key(prompt)
+            if cache_key:
+                self.response_cache.remove(cache_key)
+            raise
+        finally:
+            self.response_cache.log_summary()
 
+        self.logger.info(f"Applied {len(patch.operations)} patch operations ({len(result)} response characters)")
+        return tailored_resume
@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class TailoringMode(str, Enum):
+    FULL = "full"
+    STREAMING = "streaming"
+    PATCH = "patch"
+    SECTIONS = "sections"
+
+
+class TailoringSectionType(str, Enum):
+    SUMMARY = "summary"
+    SKILLS = "skills"
+    EXPERIENCE = "experience"
@@ -0,0 +1,121 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from core.parsing.models.resume import ProfessionalSummary, ResumeLite, TailoredResumeLite
+from core.services.openai.models.tailoring_patch import PatchOperationType, TailoringPatch
+
+
+class ResumePatchError(ValueError):
+    pass
+
+
+@dataclass
+class _PatchedList:
+    """Items of one editable list, addressed by their original position (1-based); position 0 anchors inserts at the start."""
+    items: list[str]
+    replaced: dict[int, str] = field(default_factory=dict)
+    deleted: set[int] = field(default_factory=set)
+    inserted_after: dict[int, list[str]] = field(default_factory=dict)
+
+    def check_position(self, element_id: str, position: int, allow_start: bool = False) -> None:
+        if not (0 if allow_start else 1) <= position <= len(self.items):
+            raise ResumePatchError(f"Unknown resume element id '{element_id}'")
+
+    def build(self) -> list[str]:
+        result = list(self.inserted_after.get(0, []))
+        for position, item in enumerate(self.items, start=1):
+            if position not in self.deleted:
+                result.append(self.replaced.get(position, item))
+            result.extend(self.inserted_after.get(position, []))
+        return result
+
+
+class ResumePatcher:
+    """
+    Patch protocol for tailoring: every editable element of a ResumeLite gets a stable id
+    (S = summary, H{n} = highlight, K{n} = technical skill, E{i}.B{j} = bullet j of experience i, all 1-based),
+    the model returns only replace/insert/delete operations on those ids, and the patch is applied locally.
+    Ids always refer to the original resume, so operations do not depend on each other's order.
+    """
+    ID_PATTERN = re.compile(r"^(?:(S)|([HK])(\d+)|E(\d+)\.B(\d+))$")
+
+    @staticmethod
+    def build_identified_resume(resume_lite: ResumeLite) -> dict[str, Any]:
+        """The resume as sent to the model: texts keyed by their ids, other experience fields as context."""
+        summary = resume_lite.professional_summary
+        return {
+            "professional_summary": {
+                "S": summary.summary,
+                "highlights": {f"H{n}": highlight for n, highlight in enumerate(summary.highlights, start=1)}
+            },
+            "technical_skills": {f"K{n}": skill for n, skill in enumerate(resume_lite.technical_skills, start=1)},
+            "professional_experience_list": [
+                {
+                    "id": f"E{i}",
+                    **experience.model_dump(mode="json", exclude={"bullets"}, exclude_none=True),
+                    "bullets": {f"E{i}.B{j}": bullet for j, bullet in enumerate(experience.bullets, start=1)}
+                }
+                for i, experience in enumerate(resume_lite.professional_experience_list, start=1)
+            ]
+        }
+
+    @classmethod
+    def apply(cls, resume_lite: ResumeLite, patch: TailoringPatch) -> TailoredResumeLite:
+        """Raises ResumePatchError for unknown ids, conflicting operations or missing texts."""
+        summary_text: Optional[str] = resume_lite.professional_summary.summary
+        highlights = _PatchedList(list(resume_lite.professional_summary.highlights))
+        skills = _PatchedList(list(resume_lite.technical_skills))
+        bullets = [_PatchedList(list(experience.bullets)) for experience in resume_lite.professional_experience_list]
+        # Keyed by the parsed element, so that 'H1' and 'H01' are the same element
+        edited_elements: set[tuple[Any, ...]] = set()
+
+        for operation in patch.operations:
+            match = cls.ID_PATTERN.match(operation.id.strip())
+            if not match:
+                raise ResumePatchError(f"Unknown resume element id '{operation.id}'")
+            if operation.op != PatchOperationType.DELETE and operation.text is None:
+                raise ResumePatchError(f"Operation '{operation.op.value}' on '{operation.id}' has no text")
+            is_summary, list_kind, list_position, experience_number, bullet_position = match.groups()
+
+            if is_summary:
+                if operation.op != PatchOperationType.REPLACE:
+                    raise ResumePatchError("The summary (S) can only be replaced")
+                target, position = None, 0
+                element: tuple[Any, ...] = ("S",)
+            elif list_kind:
+                target, position = (highlights if list_kind == "H" else skills), int(list_position)
+                element = (list_kind, position)
+            else:
+                experience_index = int(experience_number) - 1
+                if not 0 <= experience_index < len(bullets):
+                    raise ResumePatchError(f"Unknown resume element id '{operation.id}'")
+                target, position = bullets[experience_index], int(bullet_position)
+                element = ("E", experience_index, position)
+
+            if operation.op == PatchOperationType.INSERT:
+                target.check_position(operation.id, position, allow_start=True)
+                target.inserted_after.setdefault(position, []).append(operation.text)
+                continue
+            # Replacing or deleting the same element twice is ambiguous
+            if element in edited_elements:
+                raise ResumePatchError(f"Conflicting operations on '{operation.id}'")
+            edited_elements.add(element)
+            if target is None:
+                summary_text = operation.text
+            elif operation.op == PatchOperationType.REPLACE:
+                target.check_position(operation.id, position)
+                target.replaced[position] = operation.text
+            else:
+                target.check_position(operation.id, position)
+                target.deleted.add(position)
+
+        return TailoredResumeLite(
+            professional_summary=ProfessionalSummary(summary=summary_text, highlights=highlights.build()),
+            technical_skills=skills.build(),
+            professional_experience_list=[
+                experience.model_copy(update={"bullets": patched_bullets.build()})
+                for experience, patched_bullets in zip(resume_lite.professional_experience_list, bullets)
+            ],
+            adjustment_notes=patch.adjustment_notes,
+            keyword_coverage=patch.keyword_coverage
+        )
@@ -0,0 +1,263 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from core.jobscan.ats_estimator import AtsKeywordEstimator
+from core.jobscan.models.enums import SkillType
+from core.parsing.models.job_to_target import JobDetails
+from core.parsing.models.resume import KeywordCoverage, ProfessionalSummary, ResumeLite, TailoredResumeLite
+from core.services.config.config_manager import ConfigManager
+from core.services.cv.async_cv_tailor import AsyncTailorAIService, TailoringJob
+from core.services.cv.models.enums import TailoringSectionType
+from core.services.openai.models.prompt_instructions import Keyword, KeywordStatistics, KeywordStatus
+from core.utils.log_helper import LogHelper
+
+
+@dataclass
+class ResumeSection:
+    name: str
+    section_type: TailoringSectionType
+    # The section alone as a ResumeLite (other parts empty), so the regular prompt and schema apply
+    resume_lite: ResumeLite
+    experience_index: Optional[int] = None
+    keyword_statistics: Optional[KeywordStatistics] = None
+    tailored_resume: Optional[TailoredResumeLite] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+    @property
+    def has_keyword_work(self) -> bool:
+        """Only additions need a request; occurrences to keep are kept by leaving the section as it is."""
+        return self.keyword_statistics is not None and any(
+            keyword.quantity_to_add > 0 for keywords in self.keyword_statistics.keywords.values() for keyword in keywords
+        )
+
+
+@dataclass
+class KeywordAllocation:
+    keep: Dict[str, int] = field(default_factory=dict)
+    add: Dict[str, int] = field(default_factory=dict)
+
+
+class SectionTailoringService:
+    """
+    Tailors the summary, the skills and every professional experience as separate concurrent requests,
+    so wall-clock time is set by the slowest section rather than by the length of the resume, and a bad
+    section is retried alone. The keyword contract is split per section first: the occurrences a keyword
+    must keep stay with the sections that have them; of quantity_to_add, a hard skill missing from the skills
+    gets one occurrence there and the rest is spread over the summary and the experiences in turn, continuing
+    from where the previous keyword stopped so that additions are spread over all sections. Only sections that get
+    additions are sent; the merged keyword_coverage is recounted on the merged resume, which also checks
+    the occurrences to keep. Sections that still fail after section_max_attempts keep their original content.
+    """
+
+    def __init__(self, job_description: JobDetails, max_concurrent_requests: Optional[int] = None):
+        self.config = ConfigManager()
+        self.logger = LogHelper("section_tailoring")
+        self.job_description = job_description
+        self.max_attempts = self.config.settings.cv_tailor.section_max_attempts
+        self.estimator = AtsKeywordEstimator(self.config.settings.resume)
+        self.max_concurrent_requests = max_concurrent_requests
+
+    @staticmethod
+    def split(resume_lite: ResumeLite) -> List[ResumeSection]:
+        sections = [
+            ResumeSection(
+                name="summary",
+                section_type=TailoringSectionType.SUMMARY,
+                resume_lite=ResumeLite(professional_summary=resume_lite.professional_summary)
+            ),
+            ResumeSection(
+                name="skills",
+                section_type=TailoringSectionType.SKILLS,
+                resume_lite=ResumeLite(professional_summary=ProfessionalSummary(), technical_skills=resume_lite.technical_skills)
+            )
+        ]
+        for i, experience in enumerate(resume_lite.professional_experience_list):
+            sections.append(ResumeSection(
+                name=f"experience {i + 1} ({experience.company or experience.position or 'unnamed'})",
+                section_type=TailoringSectionType.EXPERIENCE,
+                resume_lite=ResumeLite(professional_summary=ProfessionalSummary(), professional_experience_list=[experience]),
+                experience_index=i
+            ))
+        return sections
+
+    def allocate_keywords(self, sections: List[ResumeSection], keyword_statistics: KeywordStatistics) -> None:
+        """Set the per-section keyword contract of every section."""
+        keywords = [(skill_type, keyword) for skill_type, keywords_for_type in keyword_statistics.keywords.items() for keyword in keywords_for_type]
+        names = {keyword.name for _, keyword in keywords}
+        section_counts = [self.estimator.count_occurrences(self.estimator.get_resume_text(section.resume_lite), names) for section in sections]
+        section_keywords: List[Dict[SkillType, List[Keyword]]] = [{skill_type: [] for skill_type in keyword_statistics.keywords} for _ in sections]
+
+        next_section_index = 0
+        for skill_type, keyword in keywords:
+            allocation, next_section_index = self._allocate_keyword(sections, [counts[keyword.name] for counts in section_counts], keyword, skill_type, next_section_index)
+            for i, section in enumerate(sections):
+                keep, add, count = allocation.keep.get(section.name, 0), allocation.add.get(section.name, 0), section_counts[i][keyword.name]
+                if not keep and not add and not (keyword.status == KeywordStatus.DO_NOT_ADD and count):
+                    continue
+                if add:
+                    status = keyword.status
+                elif keyword.status == KeywordStatus.DO_NOT_ADD:
+                    status = KeywordStatus.DO_NOT_ADD
+                else:
+                    status = KeywordStatus.MUST_KEEP
+                section_keywords[i][skill_type].append(Keyword(
+                    name=keyword.name,
+                    status=status,
+                    actual_quantity=count,
+                    required_quantity=count + add,
+                    min_final_quantity=keep,
+                    quantity_to_add=add
+                ))
+
+        for section, keywords_for_section in zip(sections, section_keywords):
+            section.keyword_statistics = KeywordStatistics(keywords=keywords_for_section)
+
+    @staticmethod
+    def _allocate_keyword(sections: List[ResumeSection], counts: List[int], keyword: Keyword, skill_type: SkillType, start_index: int = 0) -> tuple[KeywordAllocation, int]:
+        """Return the allocation of keyword and the section index the next keyword's additions start from."""
+        allocation = KeywordAllocation()
+        remaining_keep = keyword.min_final_quantity
+        for section, count in zip(sections, counts):
+            keep = min(count, remaining_keep)
+            if keep:
+                allocation.keep[section.name] = keep
+                remaining_keep -= keep
+
+        remaining_add = keyword.quantity_to_add if keyword.status in (KeywordStatus.NEEDS_INTEGRATION, KeywordStatus.KEEP_AND_INCREASE) else 0
+        # A hard skill missing from the skill list goes there first, once; all other sections take additions in turn
+        rotation: List[int] = []
+        for i, (section, count) in enumerate(zip(sections, counts)):
+            if section.section_type != TailoringSectionType.SKILLS:
+                rotation.append(i)
+            elif skill_type == SkillType.HARD_SKILL and count == 0 and remaining_add > 0:
+                allocation.add[section.name] = 1
+                remaining_add -= 1
+        section_index = start_index % len(sections) if sections else 0
+        while remaining_add > 0 and rotation:
+            if section_index in rotation:
+                name = sections[section_index].name
+                allocation.add[name] = allocation.add.get(name, 0) + 1
+                remaining_add -= 1
+            section_index = (section_index + 1) % len(sections)
+        return allocation, section_index
+
+    async def _tailor_pending(self, tailor_ai_service: AsyncTailorAIService, sections: List[ResumeSection], task_instructions: str, bypass_cache: bool) -> None:
+        jobs = [
+            TailoringJob(resume=section.resume_lite, keyword_statistics=section.keyword_statistics, job_details=self.job_description, task_instructions=task_instructions)
+            for section in sections
+        ]
+        section_by_job = {id(job): section for job, section in zip(jobs, sections)}
+        async for result in tailor_ai_service.tailor_many(jobs, bypass_cache=bypass_cache):
+            section = section_by_job[id(result.job)]
+            section.attempts += 1
+            section.tailored_resume, section.error = result.tailored_resume, result.error
+            if section.tailored_resume is not None:
+                section.error = self._check_section_shape(section)
+            if section.error:
+                self.logger.warning(f"Section '{section.name}' failed (attempt {section.attempts}/{self.max_attempts}): {section.error}")
+            else:
+                self.logger.info(f"Section '{section.name}' tailored in {result.duration_seconds:.1f}s")
+
+    @staticmethod
+    def _check_section_shape(section: ResumeSection) -> Optional[str]:
+        if section.section_type == TailoringSectionType.EXPERIENCE and len(section.tailored_resume.professional_experience_list) != 1:
+            return f"expected exactly one experience, got {len(section.tailored_resume.professional_experience_list)}"
+        return None
+
+    async def tailor_sections(self, resume_lite: ResumeLite, keyword_statistics: KeywordStatistics, bypass_cache: bool = False) -> TailoredResumeLite:
+        started_at = time.perf_counter()
+        sections = self.split(resume_lite)
+        self.allocate_keywords(sections, keyword_statistics)
+        # Sections without additions keep their content and cost no request
+        pending = [section for section in sections if section.has_keyword_work]
+        if pending:
+            tailor_ai_service = AsyncTailorAIService(max_concurrent_requests=self.max_concurrent_requests)
+            task_instructions = tailor_ai_service.prompt_instructions.get_section_task_instructions()
+            try:
+                retrying = False
+                while pending:
+                    # a retried section must not get the same (cached) answer again
+                    await self._tailor_pending(tailor_ai_service, pending, task_instructions, bypass_cache=bypass_cache or retrying)
+                    pending = [section for section in pending if section.error and section.attempts < self.max_attempts]
+                    retrying = True
+            finally:
+                await tailor_ai_service.close()
+
+        tailored_resume = self.merge(resume_lite, sections, keyword_statistics)
+        self.logger.info(
+            f"Tailored {sum(1 for section in sections if section.tailored_resume and not section.error)} of {len(sections)} sections "
+            f"in {time.perf_counter() - started_at:.1f}s"
+        )
+        return tailored_resume
+
+    def tailor_cv(self, resume: ResumeLite, keyword_statistics: KeywordStatistics, bypass_cache: bool = False) -> TailoredResumeLite:
+        return asyncio.run(self.tailor_sections(resume.get_lite_version(), keyword_statistics, bypass_cache))
+
+    def merge(self, resume_lite: ResumeLite, sections: List[ResumeSection], keyword_statistics: KeywordStatistics) -> TailoredResumeLite:
+        """Put the tailored sections back together (failed ones keep the original content) and combine keyword_coverage."""
+        professional_summary = resume_lite.professional_summary
+        technical_skills = list(resume_lite.technical_skills)
+        experiences = list(resume_lite.professional_experience_list)
+        adjustment_notes: List[str] = []
+        failed_sections: List[str] = []
+        section_reasons: Dict[str, List[str]] = {}
+
+        for section in sections:
+            if section.error:
+                failed_sections.append(section.name)
+                continue
+            if section.tailored_resume is None:
+                continue
+            tailored = section.tailored_resume
+            if section.section_type == TailoringSectionType.SUMMARY:
+                professional_summary = tailored.professional_summary
+            elif section.section_type == TailoringSectionType.SKILLS:
+                technical_skills = tailored.technical_skills
+            else:
+                experiences[section.experience_index] = tailored.professional_experience_list[0]
+            adjustment_notes.extend(f"[{section.name}] {note}" for note in tailored.adjustment_notes)
+            for name, coverage in tailored.keyword_coverage.items():
+                if coverage.status != "met":
+                    section_reasons.setdefault(name.lower(), []).append(f"{section.name}: {coverage.reason}")
+
+        if failed_sections:
+            adjustment_notes.append(f"Sections kept unchanged after failed tailoring: {', '.join(failed_sections)}")
+
+        merged_resume = TailoredResumeLite(
+            professional_summary=professional_summary,
+            technical_skills=technical_skills,
+            professional_experience_list=experiences,
+            adjustment_notes=adjustment_notes
+        )
+        merged_resume.keyword_coverage = self._combine_keyword_coverage(resume_lite, merged_resume, keyword_statistics, section_reasons)
+        return merged_resume
+
+    def _combine_keyword_coverage(self, resume_lite: ResumeLite, merged_resume: TailoredResumeLite, keyword_statistics: KeywordStatistics, section_reasons: Dict[str, List[str]]) -> Dict[str, KeywordCoverage]:
+        keywords = [keyword for keywords_for_type in keyword_statistics.keywords.values() for keyword in keywords_for_type]
+        names = {keyword.name for keyword in keywords}
+        counts_before = self.estimator.count_occurrences(self.estimator.get_resume_text(resume_lite), names)
+        counts_after = self.estimator.count_occurrences(self.estimator.get_resume_text(merged_resume), names)
+        keyword_coverage: Dict[str, KeywordCoverage] = {}
+        for keyword in keywords:
+            # Jobscan counts the whole resume; shift its count by what changed in the tailored parts
+            after = max(keyword.actual_quantity + counts_after[keyword.name] - counts_before[keyword.name], 0)
+            added = max(after - keyword.actual_quantity, 0)
+            if keyword.status == KeywordStatus.DO_NOT_ADD:
+                status, reason = "unsupported", "Keyword is marked DO_NOT_ADD by contract."
+            elif after >= keyword.min_final_quantity and added >= keyword.quantity_to_add:
+                status, reason = "met", "Combined across sections."
+            else:
+                status = "not met"
+                reason = "; ".join(section_reasons.get(keyword.name.lower(), [])) or f"{added} of {keyword.quantity_to_add} occurrences added across sections."
+            keyword_coverage[keyword.name] = KeywordCoverage(
+                required=keyword.required_quantity,
+                before_adjustment=keyword.actual_quantity,
+                after_adjustment=after,
+                min_final_quantity=keyword.min_final_quantity,
+                added=added,
+                status=status,
+                reason=reason
+            )
+        return keyword_coverage
@@ -0,0 +1,83 @@
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+from pydantic import TypeAdapter, ValidationError
+from core.parsing.models.resume import KeywordCoverage, ProfessionalExperience, TailoredResumeLite
+from core.services.openai.streaming_json import IncrementalJsonScanner, JsonPath
+
+
+class StreamingSchemaViolation(ValueError):
+    def __init__(self, path: JsonPath, error: ValidationError):
+        self.path = path
+        self.error = error
+        super().__init__(f"Streamed tailored resume violates the schema at {'.'.join(str(part) for part in path)}: {error}")
+
+
+@dataclass
+class StreamingTailoringStats:
+    started_at: float = field(default_factory=time.perf_counter)
+    time_to_first_token: Optional[float] = None
+    time_to_first_section: Optional[float] = None
+    first_section: Optional[str] = None
+    total_seconds: Optional[float] = None
+    validated_experiences: int = 0
+    validated_keyword_coverages: int = 0
+
+    def summary(self) -> str:
+        def seconds(value: Optional[float]) -> str:
+            return f"{value:.2f}s" if value is not None else "n/a"
+        return (
+            f"first token {seconds(self.time_to_first_token)}, first section ({self.first_section or 'none'}) "
+            f"{seconds(self.time_to_first_section)}, total {seconds(self.total_seconds)}; "
+            f"{self.validated_experiences} experiences and {self.validated_keyword_coverages} keyword coverages validated while streaming"
+        )
+
+
+class StreamingTailoredResumeValidator:
+    """
+    Validates a TailoredResumeLite while it streams in. Every professional_experience_list entry and every
+    keyword_coverage entry is validated the moment it is complete, other top-level sections once they are,
+    and the first violation raises StreamingSchemaViolation so the caller can abort the generation.
+    """
+    ITEM_MODELS = {
+        "professional_experience_list": ProfessionalExperience,
+        "keyword_coverage": KeywordCoverage
+    }
+    SECTION_ADAPTERS = {
+        name: TypeAdapter(field_info.annotation)
+        for name, field_info in TailoredResumeLite.model_fields.items()
+        if name not in ("professional_experience_list", "keyword_coverage")
+    }
+
+    def __init__(self):
+        self.scanner = IncrementalJsonScanner()
+        self.stats = StreamingTailoringStats()
+
+    def feed(self, chunk: str) -> None:
+        if not chunk:
+            return
+        if self.stats.time_to_first_token is None:
+            self.stats.time_to_first_token = time.perf_counter() - self.stats.started_at
+        for path, raw_json in self.scanner.feed(chunk):
+            self._validate(path, raw_json)
+
+    def _validate(self, path: JsonPath, raw_json: str) -> None:
+        if len(path) == 1 and self.stats.time_to_first_section is None:
+            self.stats.time_to_first_section = time.perf_counter() - self.stats.started_at
+            self.stats.first_section = str(path[0])
+        try:
+            if len(path) == 2 and path[0] in self.ITEM_MODELS:
+                self.ITEM_MODELS[path[0]].model_validate_json(raw_json)
+                if path[0] == "keyword_coverage":
+                    self.stats.validated_keyword_coverages += 1
+                else:
+                    self.stats.validated_experiences += 1
+            elif len(path) == 1 and path[0] in self.SECTION_ADAPTERS:
+                self.SECTION_ADAPTERS[path[0]].validate_json(raw_json)
+        except ValidationError as e:
+            raise StreamingSchemaViolation(path, e) from e
+
+    def finish(self) -> TailoredResumeLite:
+        """Validate the whole streamed document."""
+        self.stats.total_seconds = time.perf_counter() - self.stats.started_at
+        return TailoredResumeLite.model_validate_json(self.scanner.buffer)
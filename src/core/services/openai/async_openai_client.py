@@ -0,0 +1,104 @@
+import asyncio
+import json
+import random
+from typing import Optional
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError, APITimeoutError, RateLimitError
+from core.services.openai.openai_client import OpenAIClient
+from core.services.openai.rate_limiter import RequestRateLimiter
+from core.services.openai.response_cache import OpenAIResponseCache
+from core.utils.log_helper import LogHelper
+
+
+class AsyncOpenAIClient:
+    """
+    asyncio counterpart of OpenAIClient for many concurrent requests. Requests go through a shared
+    RequestRateLimiter and are retried with exponential backoff (honouring Retry-After) on 429, 5xx,
+    timeouts and connection errors; other errors are raised at once.
+    """
+    CHARS_PER_TOKEN = 4
+    BACKOFF_BASE_SECONDS = 1.0
+    BACKOFF_MAX_SECONDS = 60.0
+
+    def __init__(self, api_key: str, rate_limiter: RequestRateLimiter, max_retries: int = 5, response_cache: Optional[OpenAIResponseCache] = None):
+        # Retries are ours, so that every attempt goes through the rate limiter
+        self.client = AsyncOpenAI(api_key=api_key, max_retries=0)
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.response_cache = response_cache
+        self.logger = LogHelper("async_openai_client")
+        self.retried_requests = 0
+
+    @classmethod
+    def estimate_tokens(cls, text: str) -> int:
+        return len(text) // cls.CHARS_PER_TOKEN + 1
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        if isinstance(error, (RateLimitError, APITimeoutError, APIConnectionError)):
+            return True
+        return isinstance(error, APIStatusError) and error.status_code >= 500
+
+    def get_backoff_seconds(self, error: Exception, attempt: int) -> float:
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        try:
+            if retry_after is not None:
+                return min(float(retry_after), self.BACKOFF_MAX_SECONDS)
+        except ValueError:
+            pass
+        # Full jitter keeps requests that failed together from retrying together
+        return random.uniform(0, min(self.BACKOFF_BASE_SECONDS * 2 ** attempt, self.BACKOFF_MAX_SECONDS))
+
+    def get_cache_key(self, prompt: str | dict, model: str = OpenAIClient.DEFAULT_MODEL, temperature: float = OpenAIClient.DEFAULT_TEMPERATURE) -> Optional[str]:
+        if not self.response_cache:
+            return None
+        system_msg, user_msg = OpenAIClient.split_prompt(prompt)
+        return self.response_cache.compute_key(model, temperature, system_msg, user_msg)
+
+    async def request_openai(
+        self,
+        prompt: str | dict,
+        model: str = OpenAIClient.DEFAULT_MODEL,
+        temperature: float = OpenAIClient.DEFAULT_TEMPERATURE,
+        expected_output_tokens: int = 0,
+        bypass_cache: bool = False,
+    ) -> str:
+        """See OpenAIClient.request_openai; expected_output_tokens sizes the tokens-per-minute reservation."""
+        input_messages = OpenAIClient.build_input_messages(prompt)
+
+        cache_key = self.get_cache_key(prompt, model, temperature)
+        if cache_key:
+            cached_response = self.response_cache.get(cache_key, bypass=bypass_cache)
+            if cached_response is not None:
+                return cached_response
+
+        request_input = json.dumps(input_messages)
+        estimated_tokens = self.estimate_tokens(request_input) + expected_output_tokens
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire(estimated_tokens)
+            try:
+                result = await self.client.responses.create(
+                    model=model,
+                    input=request_input,
+                    temperature=temperature,
+                )
+            except Exception as e:
+                # a failed request consumed its request slot but (almost) no tokens
+                self.rate_limiter.settle(estimated_tokens, 0)
+                if not self.is_retryable(e) or attempt == self.max_retries:
+                    raise
+                backoff_seconds = self.get_backoff_seconds(e, attempt)
+                self.retried_requests += 1
+                self.logger.warning(f"OpenAI request failed ({type(e).__name__}), retrying in {backoff_seconds:.1f}s (attempt {attempt + 1}/{self.max_retries})")
+                await asyncio.sleep(backoff_seconds)
+                continue
+
+            usage = getattr(result, "usage", None)
+            self.rate_limiter.settle(estimated_tokens, getattr(usage, "total_tokens", None))
+            if cache_key:
+                self.response_cache.put(cache_key, result.output_text, model, temperature, usage=usage)
+            return result.output_text
+        raise RuntimeError("Exhausted retries while requesting OpenAI")
+
+    async def close(self) -> None:
+        await self.client.close()
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
-from typing import List, Dict
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Any, List, Dict, Optional
 from enum import Enum
+import json
 from core.jobscan.models.enums import SkillType
 
 
@@ -13,15 +14,31 @@ class KeywordStatus(str, Enum):
 class Prompt(BaseModel):
     system_instructions: List[str] = Field(default_factory=list)
     task_instructions: List[str] = Field(default_factory=list)
+    # What to return: the full tailored resume, or only edit operations (patch protocol)
+    output_instructions: List[str] = Field(default_factory=list)
+    task_output_instructions: List[str] = Field(default_factory=list)
+    patch_output_instructions: List[str] = Field(default_factory=list)
+    patch_task_output_instructions: List[str] = Field(default_factory=list)
+    # Added to the task when a single section of the resume is tailored on its own
+    section_task_instructions: List[str] = Field(default_factory=list)
 
     class Config:
         model_config = {"validate_assignment": True} #validate on assignment
 
     def get_system_instructions(self) -> str:
-        return self._concatenate_instructions(self.system_instructions)
+        return self._concatenate_instructions(self.system_instructions + self.output_instructions)
 
     def get_task_instructions(self) -> str:
-        return self._concatenate_instructions(self.task_instructions)
+        return self._concatenate_instructions(self.task_instructions + self.task_output_instructions)
+
+    def get_section_task_instructions(self) -> str:
+        return self._concatenate_instructions(self.task_instructions + self.task_output_instructions + self.section_task_instructions)
+
+    def get_patch_system_instructions(self) -> str:
+        return self._concatenate_instructions(self.system_instructions + self.patch_output_instructions)
+
+    def get_patch_task_instructions(self) -> str:
+        return self._concatenate_instructions(self.task_instructions + self.patch_task_output_instructions)
 
     def _concatenate_instructions(self, instructions: list[str]) -> str:
         return "\n".join(instructions)
@@ -33,30 +50,87 @@ class Keyword(BaseModel):
     required_quantity: int
     min_final_quantity: int
     quantity_to_add: int
-    
+
     class Config:
-        model_config = {"validate_assignment": True} #validate on assignment
+        # Keywords are shared by the cached KeywordIndex buckets and prompt JSON, so they must not change in place
+        frozen = True
+
+class KeywordIndex:
+    """Keywords bucketed by status and skill type, looked up by name, with aggregate counts precomputed."""
+
+    def __init__(self, keywords: Dict[SkillType, List[Keyword]]):
+        self.buckets: Dict[KeywordStatus, Dict[SkillType, List[Keyword]]] = {
+            status: {skill_type: [] for skill_type in SkillType} for status in KeywordStatus
+        }
+        self.by_name: Dict[str, Keyword] = {}
+        self.status_counts: Dict[KeywordStatus, int] = {status: 0 for status in KeywordStatus}
+        self.total_quantity_to_add = 0
+        for skill_type, keywords_for_type in keywords.items():
+            for keyword in keywords_for_type:
+                self.buckets[keyword.status].setdefault(skill_type, []).append(keyword)
+                self.by_name.setdefault(keyword.name.lower(), keyword)
+                self.status_counts[keyword.status] += 1
+                self.total_quantity_to_add += keyword.quantity_to_add
+        self.prompt_json = json.dumps(
+            {skill_type.value: [keyword.model_dump(mode="json") for keyword in keywords_for_type] for skill_type, keywords_for_type in keywords.items()}
+        )
 
 class KeywordStatistics(BaseModel):
     keywords: Dict[SkillType, List[Keyword]]
+    _index: Optional[KeywordIndex] = PrivateAttr(default=None)
     
     class Config:
         model_config = {"validate_assignment": True} #validate on assignment
 
-    def get_keywords_to_integrate(self) -> List[Keyword]:
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "keywords":
+            self.invalidate_index()
+
+    def invalidate_index(self) -> None:
+        """Drop the precomputed index; needed only after mutating the keyword lists in place."""
+        self._index = None
+
+    def copy_with_index(self) -> "KeywordStatistics":
+        """Copy with its own keyword lists that shares the (immutable) precomputed index."""
+        statistics = KeywordStatistics(keywords={skill_type: list(keywords) for skill_type, keywords in self.keywords.items()})
+        statistics._index = self.index
+        return statistics
+
+    @property
+    def index(self) -> KeywordIndex:
+        if self._index is None:
+            self._index = KeywordIndex(self.keywords)
+        return self._index
+
+    def get_keywords_to_integrate(self) -> Dict[SkillType, List[Keyword]]:
         return self._filter_keywords(KeywordStatus.NEEDS_INTEGRATION)
 
-    def get_keywords_to_keep(self) -> List[Keyword]:
+    def get_keywords_to_keep(self) -> Dict[SkillType, List[Keyword]]:
         return self._filter_keywords(KeywordStatus.MUST_KEEP)
 
-    def get_keywords_to_ignore(self) -> List[Keyword]:
+    def get_keywords_to_increase(self) -> Dict[SkillType, List[Keyword]]:
+        return self._filter_keywords(KeywordStatus.KEEP_AND_INCREASE)
+
+    def get_keywords_to_ignore(self) -> Dict[SkillType, List[Keyword]]:
         return self._filter_keywords(KeywordStatus.DO_NOT_ADD)
 
-    def _filter_keywords(self, target_status: KeywordStatus) -> List[Keyword]:
+    def get_keyword(self, name: str) -> Optional[Keyword]:
+        return self.index.by_name.get(name.lower())
+
+    def get_status_counts(self) -> Dict[KeywordStatus, int]:
+        return dict(self.index.status_counts)
+
+    def get_total_quantity_to_add(self) -> int:
+        return self.index.total_quantity_to_add
+
+    def get_prompt_json(self) -> str:
+        return self.index.prompt_json
+
+    def _filter_keywords(self, target_status: KeywordStatus) -> Dict[SkillType, List[Keyword]]:
+        bucket = self.index.buckets[target_status]
+        # Copies, so that callers cannot change the cached buckets
         return {
-            skill_type: [
-                keyword for keyword in self.keywords.get(skill_type, []) 
-                if keyword.status == target_status
-            ]
+            skill_type: list(bucket.get(skill_type, []))
             for skill_type in (SkillType.HARD_SKILL, SkillType.SOFT_SKILL)
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,27 @@
+from enum import Enum
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+from core.parsing.models.resume import KeywordCoverage
+
+
+class PatchOperationType(str, Enum):
+    REPLACE = "replace"
+    INSERT = "insert"
+    DELETE = "delete"
+
+class PatchOperation(BaseModel):
+    op: PatchOperationType
+    # Element the operation targets; for inserts, the element to insert after (H0, K0, E1.B0 = start of the list)
+    id: str
+    text: Optional[str] = None
+
+    class Config:
+        model_config = {"validate_assignment": True} #validate on assignment
+
+class TailoringPatch(BaseModel):
+    operations: List[PatchOperation] = Field(default_factory=list)
+    adjustment_notes: List[str] = Field(default_factory=list)
+    keyword_coverage: Dict[str, KeywordCoverage] = Field(default_factory=dict)
+
+    class Config:
+        model_config = {"validate_assignment": True} #validate on assignment
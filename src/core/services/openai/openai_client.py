@@ -1,38 +1,66 @@
+from typing import Iterator, Optional
 from openai import OpenAI
 from core.services.config.config_manager import ConfigManager
+from core.services.openai.response_cache import OpenAIResponseCache
 import json
 
 
 class OpenAIClient:
-    def __init__(self, api_key: str):
+    DEFAULT_MODEL = "gpt-4o-mini"
+    DEFAULT_TEMPERATURE = 0.2
+
+    def __init__(self, api_key: str, response_cache: Optional[OpenAIResponseCache] = None):
         self.api_key = api_key
         self.client = OpenAI(api_key=api_key)
         self.config = ConfigManager()
+        self.response_cache = response_cache
+
+    @staticmethod
+    def split_prompt(prompt: str | dict) -> tuple[str, str]:
+        """Return (system, user) messages of a prompt."""
+        if isinstance(prompt, str):
+            # simple text prompt → only user role
+            return "", prompt
+        if isinstance(prompt, dict):
+            return prompt.get("system", ""), prompt.get("user", "")
+        raise TypeError("prompt must be str or dict with 'system' and 'user'")
+
+    @staticmethod
+    def build_input_messages(prompt: str | dict) -> list[dict[str, str]]:
+        system_msg, user_msg = OpenAIClient.split_prompt(prompt)
+        input_messages = []
+        if system_msg:
+            input_messages.append({"role": "system", "content": system_msg})
+        if user_msg:
+            input_messages.append({"role": "user", "content": user_msg})
+        return input_messages
+
+    def get_cache_key(self, prompt: str | dict, model: str = DEFAULT_MODEL, temperature: float = DEFAULT_TEMPERATURE, text_format: Optional[dict] = None) -> Optional[str]:
+        if not self.response_cache:
+            return None
+        system_msg, user_msg = self.split_prompt(prompt)
+        return self.response_cache.compute_key(model, temperature, system_msg, user_msg, text_format)
 
     def request_openai(
         self,
         prompt: str | dict,
-        model: str = "gpt-4o-mini",
-        temperature: float = 0.2,
+        model: str = DEFAULT_MODEL,
+        temperature: float = DEFAULT_TEMPERATURE,
+        bypass_cache: bool = False,
     ) -> str:
         """
         Send a request to OpenAI.
         - If `prompt` is a str → passed as user-only message (system role is empty).
         - If `prompt` is a dict → expects {"system": "...", "user": "..."}.
+        Responses are served from the response cache when one is configured, unless `bypass_cache` is set.
         """
-        if isinstance(prompt, str):
-            # simple text prompt → only user role
-            input_messages = [{"role": "user", "content": prompt}]
-        elif isinstance(prompt, dict):
-            system_msg = prompt.get("system", "")
-            user_msg = prompt.get("user", "")
-            input_messages = []
-            if system_msg:
-                input_messages.append({"role": "system", "content": system_msg})
-            if user_msg:
-                input_messages.append({"role": "user", "content": user_msg})
-        else:
-            raise TypeError("prompt must be str or dict with 'system' and 'user'")
+        input_messages = self.build_input_messages(prompt)
+
+        cache_key = self.get_cache_key(prompt, model, temperature)
+        if cache_key:
+            cached_response = self.response_cache.get(cache_key, bypass=bypass_cache)
+            if cached_response is not None:
+                return cached_response
 
         result = self.client.responses.create(
             model=model,
@@ -40,4 +68,42 @@ class OpenAIClient:
             temperature=temperature,
         )
 
-        return result.output_text
\ No newline at end of file
+        if cache_key:
+            self.response_cache.put(cache_key, result.output_text, model, temperature, usage=getattr(result, "usage", None))
+        return result.output_text
+
+    def stream_openai(
+        self,
+        prompt: str | dict,
+        text_format: dict,
+        model: str = DEFAULT_MODEL,
+        temperature: float = DEFAULT_TEMPERATURE,
+        bypass_cache: bool = False,
+    ) -> Iterator[str]:
+        """
+        Stream the output text of a structured-output request (text_format is the Responses API text.format)
+        as it is generated. Closing the iterator early aborts the generation; only complete responses are cached,
+        and a cached response is yielded as a single chunk.
+        """
+        cache_key = self.get_cache_key(prompt, model, temperature, text_format)
+        if cache_key:
+            cached_response = self.response_cache.get(cache_key, bypass=bypass_cache)
+            if cached_response is not None:
+                yield cached_response
+                return
+
+        chunks: list[str] = []
+        with self.client.responses.stream(
+            model=model,
+            input=json.dumps(self.build_input_messages(prompt)),
+            temperature=temperature,
+            text={"format": text_format},
+        ) as stream:
+            for event in stream:
+                if event.type == "response.output_text.delta":
+                    chunks.append(event.delta)
+                    yield event.delta
+            result = stream.get_final_response()
+
+        if cache_key:
+            self.response_cache.put(cache_key, "".join(chunks), model, temperature, usage=getattr(result, "usage", None))
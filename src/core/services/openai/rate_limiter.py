@@ -0,0 +1,42 @@
+import asyncio
+from typing import Optional
+
+
+class RequestRateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limits for concurrent requests of one API key.
+    Every request reserves the next free slot of both limits under a lock and sleeps outside of it, so
+    requests start in order and sustained throughput is the tighter of the two limits. Token use is
+    reserved from an estimate and settled with the actual usage once the response arrives.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.seconds_per_request = 60.0 / requests_per_minute
+        self.seconds_per_token = 60.0 / tokens_per_minute
+        self.total_wait_seconds = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._next_request_slot = 0.0
+        self._next_token_slot = 0.0
+
+    async def acquire(self, estimated_tokens: int) -> float:
+        """Wait until a request of estimated_tokens fits into both limits and return the seconds waited."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            slot = max(now, self._next_request_slot, self._next_token_slot)
+            self._next_request_slot = slot + self.seconds_per_request
+            self._next_token_slot = slot + estimated_tokens * self.seconds_per_token
+        wait_seconds = slot - now
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+        self.total_wait_seconds += wait_seconds
+        return wait_seconds
+
+    def settle(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """Correct a reservation once the real token usage is known (returned credit never reaches into the past)."""
+        if actual_tokens is None:
+            return
+        now = asyncio.get_running_loop().time()
+        self._next_token_slot = max(self._next_token_slot + (actual_tokens - estimated_tokens) * self.seconds_per_token, now)
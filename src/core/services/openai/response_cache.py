@@ -0,0 +1,91 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+from core.utils.cache_helpers import FileCacheIndex
+from core.utils.helpers import HashUtils
+from core.utils.log_helper import LogHelper
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    saved_input_tokens: int = 0
+    saved_output_tokens: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.hits} hits, {self.misses} misses, {self.bypassed} bypassed, "
+            f"{self.saved_input_tokens} input / {self.saved_output_tokens} output tokens saved"
+        )
+
+
+class OpenAIResponseCache:
+    """
+    On-disk cache of OpenAI responses keyed by everything that determines them: model, temperature and
+    the system and user messages. Entries expire after max_age_days and the least recently used ones are
+    evicted beyond max_entries. Token usage of the original request is kept with each entry, so hits
+    report the API spend they saved.
+    """
+    # Bump whenever the way requests are sent changes for the same messages, so old entries are never served
+    CACHE_FORMAT_VERSION = "1"
+    INPUT_TOKENS_METADATA_KEY = "input_tokens"
+    OUTPUT_TOKENS_METADATA_KEY = "output_tokens"
+
+    def __init__(self, cache_dir: Path, max_entries: int, max_age_days: Optional[int] = None, enabled: bool = True):
+        self.logger = LogHelper("openai_response_cache")
+        self.enabled = enabled
+        self.cache_index = FileCacheIndex(cache_dir, max_entries=max_entries, max_age_days=max_age_days, logger=self.logger)
+        self.stats = ResponseCacheStats()
+
+    def compute_key(self, model: str, temperature: float, system: str, user: str, text_format: Optional[dict] = None) -> str:
+        """text_format (structured output) is part of the key only when set, so plain requests keep their keys."""
+        parts = [self.CACHE_FORMAT_VERSION, model, repr(temperature), system, user]
+        if text_format:
+            parts.append(json.dumps(text_format, sort_keys=True))
+        return HashUtils.sha256_text(*parts)
+
+    def get(self, key: str, bypass: bool = False) -> Optional[str]:
+        """Cached response text for key; with bypass (or a disabled cache) the lookup is skipped and counted."""
+        if not self.enabled or bypass:
+            self.stats.bypassed += 1
+            return None
+        entry = self.cache_index.get(key)
+        if entry:
+            try:
+                response_text = self.cache_index.get_entry_path(entry).read_text(encoding="utf-8")
+            except OSError as e:
+                self.logger.warning(f"Cached response {entry.file_name} is unreadable, requesting again: {e}")
+                self.cache_index.remove(key)
+            else:
+                self.stats.hits += 1
+                self.stats.saved_input_tokens += entry.metadata.get(self.INPUT_TOKENS_METADATA_KEY) or 0
+                self.stats.saved_output_tokens += entry.metadata.get(self.OUTPUT_TOKENS_METADATA_KEY) or 0
+                self.logger.info(f"OpenAI response cache hit {key[:12]}")
+                return response_text
+        self.stats.misses += 1
+        return None
+
+    def put(self, key: str, response_text: str, model: str, temperature: float, usage: Any = None) -> None:
+        """Store a response (also after a bypassed lookup, so the entry is refreshed)."""
+        if not self.enabled:
+            return
+        metadata = {
+            "model": model,
+            "temperature": temperature,
+            self.INPUT_TOKENS_METADATA_KEY: getattr(usage, "input_tokens", None),
+            self.OUTPUT_TOKENS_METADATA_KEY: getattr(usage, "output_tokens", None)
+        }
+        try:
+            self.cache_index.put(key, f"{key}.txt", response_text, metadata=metadata)
+        except OSError as e:
+            self.logger.warning(f"Could not cache OpenAI response: {e}")
+
+    def remove(self, key: str) -> None:
+        """Drop an entry whose response turned out to be unusable, so it is not served again."""
+        self.cache_index.remove(key)
+
+    def log_summary(self) -> None:
+        self.logger.info(f"OpenAI response cache: {self.stats.summary()}")
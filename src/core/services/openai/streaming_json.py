@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+import json
+
+
+JsonPath = tuple[Union[str, int], ...]
+
+
+@dataclass
+class _Container:
+    path: JsonPath
+    start: int
+    is_object: bool
+    key: Optional[str] = None
+    index: int = 0
+    expects_key: bool = True
+
+
+class IncrementalJsonScanner:
+    """
+    Scans a JSON document that arrives in chunks and reports every object or array as soon as it is
+    complete, as (path, raw JSON text); path is the tuple of keys and array indexes leading to it,
+    e.g. ("professional_experience_list", 0). Scalars are not reported on their own, they are part of the
+    container that holds them. Only structure is tracked; malformed JSON is left to the final parse.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self._position = 0
+        self._stack: list[_Container] = []
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._string_is_key = False
+
+    def _child_path(self) -> JsonPath:
+        if not self._stack:
+            return ()
+        parent = self._stack[-1]
+        return parent.path + ((parent.key,) if parent.is_object else (parent.index,))
+
+    def feed(self, chunk: str) -> list[tuple[JsonPath, str]]:
+        """Consume chunk and return the containers completed by it, innermost first."""
+        self.buffer += chunk
+        completed: list[tuple[JsonPath, str]] = []
+        buffer = self.buffer
+        for i in range(self._position, len(buffer)):
+            char = buffer[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._string_is_key:
+                        self._stack[-1].key = json.loads(buffer[self._string_start:i + 1])
+                continue
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+                self._string_is_key = bool(self._stack) and self._stack[-1].is_object and self._stack[-1].expects_key
+            elif char in "{[":
+                self._stack.append(_Container(path=self._child_path(), start=i, is_object=char == "{"))
+            elif char in "}]" and self._stack:
+                container = self._stack.pop()
+                completed.append((container.path, buffer[container.start:i + 1]))
+            elif char == ":" and self._stack:
+                self._stack[-1].expects_key = False
+            elif char == "," and self._stack:
+                if self._stack[-1].is_object:
+                    self._stack[-1].expects_key = True
+                else:
+                    self._stack[-1].index += 1
+        self._position = len(buffer)
+        return completed
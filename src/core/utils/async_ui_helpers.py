@@ -0,0 +1,148 @@
+from playwright.async_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
+import asyncio
+import itertools
+import random
+from typing import Optional, Sequence
+from core.jobscan.models.enums import SessionMode
+from core.services.config.models.settings import PlaywrightSettings
+from core.utils.log_helper import LogHelper
+from core.utils.pacing import PacingAction, PacingPolicy
+from core.utils.ui_helpers import PlaywrightHelper
+
+
+class AsyncPlaywrightHelper:
+    """asyncio counterpart of PlaywrightHelper; delays yield to the event loop so other pages keep working."""
+    logger = LogHelper(__name__)
+    _dom_quiet_wait_ids = itertools.count(1)
+
+    def __init__(self, playwright_settings: PlaywrightSettings, session_mode: Optional[SessionMode] = None):
+        self.pacing_policy = PacingPolicy.from_settings(
+            playwright_settings.pacing_profile,
+            playwright_settings.min_delay,
+            playwright_settings.max_delay,
+            playwright_settings.pacing_budget_seconds,
+            session_mode
+        )
+        self.dom_quiet_window_ms = playwright_settings.dom_quiet_window_ms
+        self.page_ready_timeout_ms = playwright_settings.page_ready_timeout_ms
+
+    async def wait_for_dom_quiet(self, page: Page, required_selectors: Sequence[str] = (), absent_selectors: Sequence[str] = (), quiet_window_ms: Optional[int] = None, timeout_ms: Optional[int] = None) -> None:
+        """See PlaywrightHelper.wait_for_dom_quiet."""
+        key = f"async-wait-{next(self._dom_quiet_wait_ids)}"
+        try:
+            await page.wait_for_function(
+                PlaywrightHelper.DOM_QUIET_PREDICATE,
+                arg={
+                    "key": key,
+                    "required": list(required_selectors),
+                    "absent": list(absent_selectors),
+                    "quietWindowMs": quiet_window_ms if quiet_window_ms is not None else self.dom_quiet_window_ms
+                },
+                timeout=timeout_ms if timeout_ms is not None else self.page_ready_timeout_ms
+            )
+        except PlaywrightTimeoutError:
+            try:
+                await page.evaluate(PlaywrightHelper.DOM_QUIET_CLEANUP_SCRIPT, key)
+            except Exception as e:
+                AsyncPlaywrightHelper.logger.warning(f"Could not clean up DOM quiet wait {key}: {e}")
+            raise
+
+    async def delayed_click(self, element: Locator, max_retries: int = 2, action: PacingAction = PacingAction.CLICK) -> None:
+        """Click element with basic retry logic."""
+        for attempt in range(max_retries):
+            try:
+                await element.click()
+                await self.pacing_policy.pause_async(action)
+                return
+            except (PlaywrightTimeoutError, Exception) as e:
+                AsyncPlaywrightHelper.logger.warning(f"Click attempt {attempt + 1} failed")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(0.2)
+        else:
+            AsyncPlaywrightHelper.logger.error("Failed to click element after all retries")
+
+    async def delayed_hover(self, element: Locator, max_retries: int = 2, action: PacingAction = PacingAction.HOVER) -> None:
+        """Hover over element with basic retry logic."""
+        for attempt in range(max_retries):
+            try:
+                await element.hover()
+                await self.pacing_policy.pause_async(action)
+                return
+            except (PlaywrightTimeoutError, Exception) as e:
+                AsyncPlaywrightHelper.logger.warning(f"Hover attempt {attempt + 1} failed")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(0.2)
+        else:
+            AsyncPlaywrightHelper.logger.error("Failed to hover over element after all retries")
+
+    async def delayed_hover_and_click(self, element: Locator, max_retries: int = 2, passive: bool = False) -> None:
+        """Hover over element and click on it with basic retry logic; passive reads are not paced."""
+        await self.delayed_hover(element, max_retries, action=PacingAction.READ if passive else PacingAction.HOVER)
+        await self.delayed_click(element, max_retries, action=PacingAction.READ if passive else PacingAction.CLICK)
+
+    async def human_like_mouse_move(self, page: Page, passive: bool = False) -> None:
+        mouse = page.mouse
+        start_x, start_y = random.randint(0, 100), random.randint(0, 100)
+
+        await mouse.move(start_x, start_y)
+        await self.pacing_policy.pause_async(PacingAction.READ if passive else PacingAction.MOUSE_MOVE)
+
+        for _ in range(random.randint(2, 4)):
+            offset_x = random.randint(-30, 30)
+            offset_y = random.randint(-30, 30)
+
+            await mouse.move(start_x + offset_x, start_y + offset_y, steps=random.randint(4, 7))
+            await self.pacing_policy.pause_async(PacingAction.READ if passive else PacingAction.MOUSE_STEP)
+
+    async def human_like_mouse_move_to_selector(self, page: Page, target_x: float, target_y: float, passive: bool = False) -> None:
+        await self.human_like_mouse_move(page, passive)
+        await page.mouse.move(target_x, target_y, steps=random.randint(8, 12))
+        await self.pacing_policy.pause_async(PacingAction.READ if passive else PacingAction.MOUSE_STEP)
+
+    async def human_like_mouse_move_and_click(self, page: Page, element: Locator, max_retries: int = 3, passive: bool = False) -> None:
+        """Perform human-like mouse movement and click with basic error handling and retry; passive clicks are not paced."""
+        for attempt in range(max_retries):
+            try:
+                bounding_box = await element.bounding_box()
+                if not bounding_box:
+                    AsyncPlaywrightHelper.logger.warning(f"No bounding box (attempt {attempt + 1}/{max_retries})")
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(0.2)
+                    continue
+
+                x = bounding_box["x"] + bounding_box["width"] / 2
+                y = bounding_box["y"] + bounding_box["height"] / 2
+
+                await self.human_like_mouse_move_to_selector(page, x, y, passive)
+                await self.delayed_hover_and_click(element, passive=passive)
+                return
+            except (PlaywrightTimeoutError, Exception) as e:
+                AsyncPlaywrightHelper.logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(0.2)
+        else:
+            AsyncPlaywrightHelper.logger.error("Failed to perform mouse move and click after all retries")
+
+    async def human_like_fill_data(self, page: Page, element: Locator, data: str, max_retries: int = 2) -> None:
+        for attempt in range(max_retries):
+            try:
+                await self.human_like_mouse_move_and_click(page, element)
+                await element.fill(data)
+                await self.pacing_policy.pause_async(PacingAction.FILL)
+                return
+            except Exception as e:
+                AsyncPlaywrightHelper.logger.warning(f"Fill attempt {attempt + 1} failed: {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(0.2)
+        else:
+            AsyncPlaywrightHelper.logger.error("Failed to fill data after all retries")
+
+    async def exists(self, element: Locator) -> bool:
+        """Check if element exists with basic timeout handling."""
+        try:
+            return await element.count() > 0 and await element.is_enabled()
+        except (PlaywrightTimeoutError, Exception):
+            return False
+
+    async def get_class_attr(self, element: Locator) -> str:
+        return await element.get_attribute("class") or ""
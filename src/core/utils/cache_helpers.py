@@ -0,0 +1,118 @@
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+from core.utils.log_helper import LogHelper
+
+
+class FileUtils:
+    @staticmethod
+    def write_text_atomic(path_to_file: Path, text: str) -> None:
+        FileUtils.write_bytes_atomic(path_to_file, text.encode("utf-8"))
+
+    @staticmethod
+    def write_bytes_atomic(path_to_file: Path, data: bytes) -> None:
+        """Write to a temp file next to the target and move it into place, so readers never see a partial file."""
+        path_to_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path_to_file.parent, prefix=f".{path_to_file.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path_to_file)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+class CacheEntry(BaseModel):
+    key: str
+    file_name: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    last_used_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+class CacheIndex(BaseModel):
+    entries: Dict[str, CacheEntry] = Field(default_factory=dict)
+
+class FileCacheIndex:
+    """
+    Directory of cached payload files tracked by an index.json file.
+    Entries are evicted least-recently-used first once max_entries is exceeded,
+    and expire after max_age_days when it is set.
+    """
+    INDEX_FILE_NAME = "index.json"
+
+    def __init__(self, cache_dir: Path, max_entries: int, max_age_days: Optional[int] = None, logger: LogHelper | None = None):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.logger = logger or LogHelper(__name__)
+        self.index_path = self.cache_dir / self.INDEX_FILE_NAME
+        self._index = self._load_index()
+
+    def _load_index(self) -> CacheIndex:
+        if not self.index_path.is_file():
+            return CacheIndex()
+        try:
+            with self.index_path.open("r") as f:
+                return CacheIndex.model_validate_json(f.read())
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Cache index {self.index_path} is unreadable, starting with an empty one: {e}")
+            return CacheIndex()
+
+    def _save_index(self) -> None:
+        FileUtils.write_text_atomic(self.index_path, self._index.model_dump_json(indent=2))
+
+    def get_entry_path(self, entry: CacheEntry) -> Path:
+        return self.cache_dir / entry.file_name
+
+    def _is_expired(self, entry: CacheEntry) -> bool:
+        if self.max_age_days is None:
+            return False
+        return datetime.now(timezone.utc) - entry.created_at > timedelta(days=self.max_age_days)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for key if its payload is still on disk and not expired, refreshing its last use time."""
+        entry = self._index.entries.get(key)
+        if not entry:
+            return None
+        if self._is_expired(entry) or not self.get_entry_path(entry).is_file():
+            self.remove(key)
+            return None
+        entry.last_used_at = datetime.now(timezone.utc)
+        self._save_index()
+        return entry
+
+    def put(self, key: str, file_name: str, payload: str, metadata: Dict[str, Any] | None = None) -> CacheEntry:
+        FileUtils.write_text_atomic(self.cache_dir / file_name, payload)
+        entry = CacheEntry(key=key, file_name=file_name, metadata=metadata or {})
+        self._index.entries[key] = entry
+        self._evict()
+        self._save_index()
+        return entry
+
+    def remove(self, key: str) -> None:
+        entry = self._index.entries.pop(key, None)
+        if entry:
+            self._delete_payload(entry)
+            self._save_index()
+
+    def _delete_payload(self, entry: CacheEntry) -> None:
+        try:
+            self.get_entry_path(entry).unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Could not delete cache file {entry.file_name}: {e}")
+
+    def _evict(self) -> None:
+        for key in [key for key, entry in self._index.entries.items() if self._is_expired(entry)]:
+            self._delete_payload(self._index.entries.pop(key))
+
+        overflow = len(self._index.entries) - self.max_entries
+        if overflow <= 0:
+            return
+        least_recently_used = sorted(self._index.entries.values(), key=lambda entry: entry.last_used_at)[:overflow]
+        for entry in least_recently_used:
+            self.logger.info(f"Evicting cache entry {entry.key}")
+            self._delete_payload(self._index.entries.pop(entry.key))
@@ -1,7 +1,8 @@
 from core.services.openai.models.prompt_instructions import KeywordStatistics
 from core.parsing.models.enums import ResumeSectionType, HeaderFields, ProfessionalSummaryFields, ProfessionalExperienceFields, EducationFields, ProfessionalDevelopmentFields, TechnicalSkillsFields
 from typing import Sequence
-import json
+from pathlib import Path
+import hashlib
 from core.utils.log_helper import LogHelper
 
 class TextUtils:
@@ -62,6 +63,23 @@ class EnumUtils:
 class KeywordUtils:
     @staticmethod
     def keywords_to_json(keyword_statistics: KeywordStatistics) -> str:
-        return json.dumps(
-            {k.value: [kw.model_dump(mode="json") for kw in v] for k, v in keyword_statistics.keywords.items()}
-        )
\ No newline at end of file
+        return keyword_statistics.get_prompt_json()
+
+class HashUtils:
+    CHUNK_SIZE = 1024 * 1024
+
+    @staticmethod
+    def sha256_file(path_to_file: Path) -> str:
+        digest = hashlib.sha256()
+        with Path(path_to_file).open("rb") as f:
+            for chunk in iter(lambda: f.read(HashUtils.CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def sha256_text(*parts: str) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
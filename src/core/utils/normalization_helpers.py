@@ -1,4 +1,67 @@
+import re
+from typing import Iterable, Iterator, Optional
+
+
 class NormalizationUtils:
+    # '+' and '#' are kept so that e.g. C, C++ and C# stay distinct
+    TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+    POSSESSIVE_PATTERN = re.compile(r"['’]s\b")
+
     @staticmethod
     def normalize_values(values: list[str]) -> list[str]:
-        return [value.lower() for value in values]
\ No newline at end of file
+        return [value.lower() for value in values]
+
+    @staticmethod
+    def normalize_skill_name(name: str) -> str:
+        """Case-, punctuation-, plural- and possessive-insensitive key, e.g. 'Unit-Tests' and "unit test's" -> 'unit test'."""
+        name = NormalizationUtils.POSSESSIVE_PATTERN.sub("", name.lower())
+        return " ".join(NormalizationUtils.stem_token(token) for token in NormalizationUtils.TOKEN_PATTERN.findall(name))
+
+    @staticmethod
+    def stem_token(token: str) -> str:
+        """
+        Reduce a plural to its singular (s/es/ies). Other suffixes are left alone on purpose: stripping
+        -ing/-ed would merge different skills such as 'Marketing' and 'Markets'.
+        """
+        if not token.isalpha() or len(token) <= 3:
+            return token
+        if token.endswith("ies") and len(token) > 4:
+            return token[:-3] + "y"
+        if token.endswith(("sses", "xes", "ches", "shes")):
+            return token[:-2]
+        if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+            return token[:-1]
+        return token
+
+
+class SkillWhitelistIndex:
+    """
+    Whitelisted skill lookup: an exact lowercase frozenset plus a map of normalized keys
+    (see NormalizationUtils.normalize_skill_name) to the configured skill, so near-miss
+    spellings like 'Continuous-Integrations' still resolve to 'continuous integration'.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills: tuple[str, ...] = tuple(skills)
+        self.exact: frozenset[str] = frozenset(skill.strip().lower() for skill in self.skills)
+        self.aliases: dict[str, str] = {}
+        for skill in self.skills:
+            key = NormalizationUtils.normalize_skill_name(skill)
+            if key:
+                self.aliases.setdefault(key, skill)
+
+    def match(self, name: str) -> Optional[str]:
+        """Return the whitelisted skill that name refers to, if any."""
+        lowered = name.strip().lower()
+        if lowered in self.exact:
+            return lowered
+        return self.aliases.get(NormalizationUtils.normalize_skill_name(name))
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.match(name) is not None
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.skills)
@@ -0,0 +1,108 @@
+import asyncio
+import random
+from collections import Counter
+from enum import Enum
+from time import sleep
+from typing import Optional
+from core.jobscan.models.enums import SessionMode
+from core.utils.log_helper import LogHelper
+
+
+class PacingProfile(str, Enum):
+    HUMAN = "human"
+    FAST = "fast"
+    OFFLINE = "offline"
+
+
+class PacingAction(str, Enum):
+    CLICK = "click"
+    FILL = "fill"
+    HOVER = "hover"
+    MOUSE_MOVE = "mouse move"
+    MOUSE_STEP = "mouse step"
+    READ = "read"
+
+
+class PacingPolicy:
+    """
+    Decides the synthetic delay after each UI action and keeps count of the time spent on it.
+    HUMAN draws delays from [min_delay, max_delay] weighted by action and budgets them per session:
+    delays shrink as the budget is used up and never exceed what is left of it, so a long session costs at
+    most budget_seconds of waiting instead of a fixed amount per action.
+    FAST keeps short delays without a budget, OFFLINE (used for replayed sessions) none at all.
+    READ actions (opening and closing evidence, expanding lists) are never paced.
+    """
+    ACTION_WEIGHTS = {
+        PacingAction.CLICK: 1.0,
+        PacingAction.FILL: 1.0,
+        PacingAction.HOVER: 0.25,
+        PacingAction.MOUSE_MOVE: 0.5,
+        PacingAction.MOUSE_STEP: 0.1,
+        PacingAction.READ: 0.0
+    }
+    FAST_DELAY_RANGE = (0.05, 0.25)
+
+    logger = LogHelper(__name__)
+
+    def __init__(self, profile: PacingProfile, min_delay: float, max_delay: float, budget_seconds: Optional[float] = None, rng: Optional[random.Random] = None):
+        self.profile = profile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget_seconds = budget_seconds
+        self.rng = rng or random.Random()
+        self.total_delay_seconds = 0.0
+        self.delay_by_action: Counter = Counter()
+        self.action_counts: Counter = Counter()
+        self.start_session()
+
+    @classmethod
+    def from_settings(cls, profile: PacingProfile, min_delay: float, max_delay: float, budget_seconds: Optional[float], session_mode: Optional[SessionMode] = None) -> "PacingPolicy":
+        """A replayed session talks to no server, so it is never paced whatever the configured profile."""
+        if session_mode == SessionMode.REPLAY:
+            profile = PacingProfile.OFFLINE
+        return cls(profile, min_delay, max_delay, budget_seconds)
+
+    def start_session(self) -> None:
+        """Restore the full delay budget; totals keep accumulating across sessions."""
+        self.session_delay_seconds = 0.0
+
+    @property
+    def remaining_budget_seconds(self) -> Optional[float]:
+        if self.profile != PacingProfile.HUMAN or self.budget_seconds is None:
+            return None
+        return max(self.budget_seconds - self.session_delay_seconds, 0.0)
+
+    def next_delay(self, action: PacingAction) -> float:
+        """Delay in seconds to wait after action, already counted in the totals."""
+        self.action_counts[action] += 1
+        weight = self.ACTION_WEIGHTS[action]
+        if self.profile == PacingProfile.OFFLINE or weight == 0:
+            return 0.0
+        if self.profile == PacingProfile.FAST:
+            delay = weight * self.rng.uniform(*self.FAST_DELAY_RANGE)
+        else:
+            delay = weight * self.rng.uniform(self.min_delay, self.max_delay)
+            remaining = self.remaining_budget_seconds
+            if remaining is not None:
+                delay = min(delay * remaining / self.budget_seconds if self.budget_seconds else 0.0, remaining)
+        self.session_delay_seconds += delay
+        self.total_delay_seconds += delay
+        self.delay_by_action[action] += delay
+        return delay
+
+    def pause(self, action: PacingAction) -> None:
+        delay = self.next_delay(action)
+        if delay > 0:
+            sleep(delay)
+
+    async def pause_async(self, action: PacingAction) -> None:
+        delay = self.next_delay(action)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def summary(self) -> str:
+        by_action = ", ".join(f"{action.value}: {self.action_counts[action]} ({seconds:.1f}s)" for action, seconds in self.delay_by_action.most_common())
+        return f"{self.total_delay_seconds:.1f}s of synthetic delay ({self.profile.value} profile; {by_action or 'no paced actions'})"
+
+    def log_summary(self) -> None:
+        PacingPolicy.logger.info(f"Pacing: {self.summary()}")
@@ -38,6 +38,14 @@ def get_jobscan_match_report_path(company: str, job_title: str, iteration: int =
         / f"match_report_{iteration}.json"
     )
 
+def get_workflow_journal_file_path(company: str, job_title: str) -> Path:
+    """Return the workflow journal file path of a (company, job title) output folder."""
+    return (
+        Path(get_output_dir_path())
+        / Path(f"{company}_{job_title}")
+        / "workflow_journal.json"
+    )
+
 def get_job_to_target_file_path() -> Path:
     """Return the job to target file path."""
     return (
@@ -75,6 +83,50 @@ def get_parsed_resume_file_path() -> Path:
         / f"{CONFIG.settings.resume.file_name}.json"
     )
 
+def get_parsed_resume_sections_file_path() -> Path:
+    """Return the per-section hashes file stored next to the parsed resume JSON."""
+    return (
+        Path(get_data_dir_path())
+        / Path(CONFIG.settings.resume.output_path)
+        / f"{CONFIG.settings.resume.file_name}.sections.json"
+    )
+
+def get_batch_parsing_output_dir_path() -> Path:
+    """Return the batch parsing output directory."""
+    return (
+        Path(get_data_dir_path())
+        / Path(CONFIG.settings.batch_parsing.output_path)
+    )
+
+def get_parse_cache_dir_path() -> Path:
+    """Return the parsed resume cache directory."""
+    return (
+        Path(get_data_dir_path())
+        / Path(CONFIG.settings.parse_cache.cache_path)
+    )
+
+def get_position_matcher_cache_file_path(positions_hash: str) -> Path:
+    """Return the compiled position matcher cache file path for the given positions file hash."""
+    return (
+        get_parse_cache_dir_path()
+        / f"position_matcher_{positions_hash}.pickle"
+    )
+
+def get_openai_response_cache_dir_path() -> Path:
+    """Return the OpenAI response cache directory."""
+    return (
+        Path(get_data_dir_path())
+        / Path(CONFIG.settings.cv_tailor.response_cache_path)
+    )
+
+def get_jobscan_recording_dir_path(recording_name: str) -> Path:
+    """Return the directory holding a recorded Jobscan session (HAR and DOM snapshots)."""
+    return (
+        Path(get_data_dir_path())
+        / Path(CONFIG.settings.jobscan.recordings_path)
+        / recording_name
+    )
+
 def get_resume_template_file_path() -> Path:
     """Return the template resume file path."""
     return (
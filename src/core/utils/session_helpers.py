@@ -1,6 +1,11 @@
+from __future__ import annotations
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
 from playwright.sync_api import Playwright, Browser, BrowserContext, Page
 
+if TYPE_CHECKING:
+    from core.jobscan.session_pool import BrowserSessionPool
+
 
 @dataclass
 class Session:
@@ -8,8 +13,13 @@ class Session:
     browser: Browser
     context: BrowserContext
     page: Page
+    pool: Optional[BrowserSessionPool] = None
 
-    def close(self) -> None:
+    def close(self, failed: bool = False) -> None:
+        """Return pooled sessions to their pool (recycled when failed); otherwise close everything."""
+        if self.pool:
+            self.pool.release(self, failed=failed)
+            return
         try:
             self.page.close()
         except Exception:
@@ -25,4 +35,4 @@ class Session:
         try:
             self.pw.stop()
         except Exception:
-            pass
\ No newline at end of file
+            pass
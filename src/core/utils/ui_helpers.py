@@ -1,23 +1,107 @@
 from playwright.sync_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
 from time import sleep
 import random
+from typing import Optional, Sequence
+from core.jobscan.models.enums import SessionMode
 from core.services.config.models.settings import PlaywrightSettings
 from core.utils.log_helper import LogHelper
+from core.utils.pacing import PacingAction, PacingPolicy
 
 
 class PlaywrightHelper:
     logger = LogHelper(__name__)
 
-    def __init__(self, playwright_settings: PlaywrightSettings):
-        self.min_delay = playwright_settings.min_delay
-        self.max_delay = playwright_settings.max_delay
+    # Predicate polled by wait_for_function. A MutationObserver (installed once per wait under a unique key) records
+    # the last time anything inside a watched element changed; the page is ready once every required selector has a
+    # visible match, no absent selector has one, and the watched elements have been quiet for the whole window.
+    DOM_QUIET_PREDICATE = """
+        ({ key, required, absent, quietWindowMs }) => {
+            const isVisible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+            const anyVisible = selector => Array.from(document.querySelectorAll(selector)).some(isVisible);
+            const states = window.__domQuietStates = window.__domQuietStates || {};
+            let state = states[key];
+            if (!state) {
+                state = states[key] = { lastChange: performance.now(), watchedCount: -1 };
+                const watched = required.join(",");
+                state.observer = new MutationObserver(records => {
+                    if (!watched || records.some(record => {
+                        const el = record.target.nodeType === Node.ELEMENT_NODE ? record.target : record.target.parentElement;
+                        return el && el.closest(watched);
+                    })) {
+                        state.lastChange = performance.now();
+                    }
+                });
+                state.observer.observe(document.documentElement, { subtree: true, childList: true, characterData: true, attributes: true });
+            }
+            const watchedCount = required.reduce((count, selector) => count + document.querySelectorAll(selector).length, 0);
+            if (watchedCount !== state.watchedCount) {
+                state.watchedCount = watchedCount;
+                state.lastChange = performance.now();
+            }
+            const ready = required.every(anyVisible) && !absent.some(anyVisible) && performance.now() - state.lastChange >= quietWindowMs;
+            if (ready) {
+                state.observer.disconnect();
+                delete states[key];
+            }
+            return ready;
+        }
+    """
+    # Removes what DOM_QUIET_PREDICATE left behind when the wait timed out before the page was ready
+    DOM_QUIET_CLEANUP_SCRIPT = """
+        key => {
+            const states = window.__domQuietStates;
+            if (states && states[key]) {
+                states[key].observer.disconnect();
+                delete states[key];
+            }
+        }
+    """
 
-    def delayed_click(self, element: Locator, max_retries: int = 2) -> None:
+    def __init__(self, playwright_settings: PlaywrightSettings, session_mode: Optional[SessionMode] = None):
+        self.pacing_policy = PacingPolicy.from_settings(
+            playwright_settings.pacing_profile,
+            playwright_settings.min_delay,
+            playwright_settings.max_delay,
+            playwright_settings.pacing_budget_seconds,
+            session_mode
+        )
+        self.dom_quiet_window_ms = playwright_settings.dom_quiet_window_ms
+        self.page_ready_timeout_ms = playwright_settings.page_ready_timeout_ms
+        self._dom_quiet_wait_count = 0
+
+    def wait_for_dom_quiet(self, page: Page, required_selectors: Sequence[str] = (), absent_selectors: Sequence[str] = (), quiet_window_ms: Optional[int] = None, timeout_ms: Optional[int] = None) -> None:
+        """
+        Wait until all required_selectors (CSS) are visible, none of absent_selectors are visible and nothing inside
+        the required elements has changed for quiet_window_ms. Without required selectors, the quiet window applies
+        to the whole document. Raises PlaywrightTimeoutError after timeout_ms.
+        """
+        self._dom_quiet_wait_count += 1
+        key = f"wait-{id(self)}-{self._dom_quiet_wait_count}"
+        try:
+            page.wait_for_function(
+                self.DOM_QUIET_PREDICATE,
+                arg={
+                    "key": key,
+                    "required": list(required_selectors),
+                    "absent": list(absent_selectors),
+                    "quietWindowMs": quiet_window_ms if quiet_window_ms is not None else self.dom_quiet_window_ms
+                },
+                timeout=timeout_ms if timeout_ms is not None else self.page_ready_timeout_ms
+            )
+        except PlaywrightTimeoutError:
+            # Don't leave the MutationObserver running on the page
+            try:
+                page.evaluate(self.DOM_QUIET_CLEANUP_SCRIPT, key)
+            except Exception as e:
+                PlaywrightHelper.logger.warning(f"Could not clean up DOM quiet wait {key}: {e}")
+            raise
+
+    def delayed_click(self, element: Locator, max_retries: int = 2, action: PacingAction = PacingAction.CLICK) -> None:
         """Click element with basic retry logic."""
         for attempt in range(max_retries):
             try:
                 element.click()
-                sleep(random.uniform(self.min_delay, self.max_delay))
+                self.pacing_policy.pause(action)
                 return
             except (PlaywrightTimeoutError, Exception) as e:
                 PlaywrightHelper.logger.warning(f"Click attempt {attempt + 1} failed")
@@ -26,12 +110,12 @@ class PlaywrightHelper:
         else:
             PlaywrightHelper.logger.error("Failed to click element after all retries")
 
-    def delayed_hover(self, element: Locator, max_retries: int = 2) -> None:
+    def delayed_hover(self, element: Locator, max_retries: int = 2, action: PacingAction = PacingAction.HOVER) -> None:
         """Hover over element with basic retry logic."""
         for attempt in range(max_retries):
             try:
                 element.hover()
-                sleep(random.uniform(self.min_delay, self.max_delay))
+                self.pacing_policy.pause(action)
                 return
             except (PlaywrightTimeoutError, Exception) as e:
                 PlaywrightHelper.logger.warning(f"Hover attempt {attempt + 1} failed")
@@ -40,31 +124,31 @@ class PlaywrightHelper:
         else:
             PlaywrightHelper.logger.error("Failed to hover over element after all retries")
 
-    def delayed_hover_and_click(self, element: Locator, max_retries: int = 2) -> None:
-        """Hover over element and click on it with basic retry logic."""
-        self.delayed_hover(element, max_retries)
-        self.delayed_click(element, max_retries)
+    def delayed_hover_and_click(self, element: Locator, max_retries: int = 2, passive: bool = False) -> None:
+        """Hover over element and click on it with basic retry logic; passive reads are not paced."""
+        self.delayed_hover(element, max_retries, action=PacingAction.READ if passive else PacingAction.HOVER)
+        self.delayed_click(element, max_retries, action=PacingAction.READ if passive else PacingAction.CLICK)
 
-    def human_like_mouse_move(self, page: Page):
+    def human_like_mouse_move(self, page: Page, passive: bool = False):
         mouse = page.mouse
         start_x, start_y = random.randint(0, 100), random.randint(0, 100)
 
         mouse.move(start_x, start_y)
-        sleep(random.uniform(self.min_delay, self.max_delay))
+        self.pacing_policy.pause(PacingAction.READ if passive else PacingAction.MOUSE_MOVE)
 
         for _ in range(random.randint(2, 4)):
             offset_x = random.randint(-30, 30)
             offset_y = random.randint(-30, 30)
 
             mouse.move(start_x + offset_x, start_y + offset_y, steps=random.randint(4, 7))
-            sleep(random.uniform(0.1, 0.3))
+            self.pacing_policy.pause(PacingAction.READ if passive else PacingAction.MOUSE_STEP)
 
-    def human_like_mouse_move_to_selector(self, page: Page, target_x: float, target_y: float):
-        self.human_like_mouse_move(page)
+    def human_like_mouse_move_to_selector(self, page: Page, target_x: float, target_y: float, passive: bool = False):
+        self.human_like_mouse_move(page, passive)
         page.mouse.move(target_x, target_y, steps=random.randint(8, 12))
-        sleep(random.uniform(0.2, 0.4))
+        self.pacing_policy.pause(PacingAction.READ if passive else PacingAction.MOUSE_STEP)
 
-    def human_like_mouse_move_and_click(self, page: Page, element: Locator, max_retries: int = 3) -> None:
+    def human_like_mouse_move_and_click(self, page: Page, element: Locator, max_retries: int = 3, passive: bool = False) -> None:
         """
         Perform human-like mouse movement and click with basic error handling and retry.
         
@@ -72,6 +156,7 @@ class PlaywrightHelper:
             page: Playwright page object
             element: Element to click
             max_retries: Maximum number of retry attempts
+            passive: The click only reveals content to read (evidence, show more), so it is not paced
             
         Returns:
             None - Method completes successfully or logs error after retries
@@ -90,8 +175,8 @@ class PlaywrightHelper:
                 x = bounding_box["x"] + bounding_box["width"] / 2
                 y = bounding_box["y"] + bounding_box["height"] / 2
                 
-                self.human_like_mouse_move_to_selector(page, x, y)
-                self.delayed_hover_and_click(element)
+                self.human_like_mouse_move_to_selector(page, x, y, passive)
+                self.delayed_hover_and_click(element, passive=passive)
                 return
             except (PlaywrightTimeoutError, Exception) as e:
                 PlaywrightHelper.logger.warning(f"Attempt {attempt + 1} failed: {e}")
@@ -105,7 +190,7 @@ class PlaywrightHelper:
             try:
                 self.human_like_mouse_move_and_click(page, element)
                 element.fill(data)
-                sleep(random.uniform(self.min_delay, self.max_delay))
+                self.pacing_policy.pause(PacingAction.FILL)
                 return
             except Exception as e:
                 PlaywrightHelper.logger.warning(f"Fill attempt {attempt + 1} failed: {e}")
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class WorkflowStage(str, Enum):
+    SCAN = "scan"
+    TAILOR = "tailor"
+    EXPORT_DOCX = "export_docx"
+    EXPORT_PDF = "export_pdf"
+    RESCAN = "rescan"
+
+
+class StageRecord(BaseModel):
+    stage: WorkflowStage
+    completed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Artifact path (relative to the journal folder when inside it) -> sha256 of its content
+    artifacts: Dict[str, str] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class WorkflowJournalModel(BaseModel):
+    company: str
+    job_title: str
+    inputs_fingerprint: Optional[str] = None
+    stages: Dict[WorkflowStage, StageRecord] = Field(default_factory=dict)
@@ -0,0 +1,85 @@
+from pathlib import Path
+from typing import Any, Optional
+from pydantic import ValidationError
+from core.utils.cache_helpers import FileUtils
+from core.utils.helpers import HashUtils
+from core.utils.log_helper import LogHelper
+from core.workflow.models.workflow_journal import StageRecord, WorkflowJournalModel, WorkflowStage
+import core.utils.paths as path_utils
+
+
+class WorkflowJournal:
+    """
+    Journal of completed workflow stages for one (company, job title) output folder.
+    Every completed stage stores the sha256 of its artifacts; a stage counts as completed only while all
+    of them still exist unchanged, so a restarted run skips finished work and resumes at the first stage
+    that is missing, edited or was interrupted. Completing a stage invalidates the stages after it, and a
+    change of the inputs (original resume, job details) resets the whole journal.
+    """
+    STAGE_ORDER = list(WorkflowStage)
+
+    logger = LogHelper(__name__)
+
+    def __init__(self, company: str, job_title: str, inputs_fingerprint: Optional[str] = None):
+        self.journal_path = path_utils.get_workflow_journal_file_path(company, job_title)
+        self.journal = self._load(company, job_title)
+        if inputs_fingerprint and self.journal.inputs_fingerprint != inputs_fingerprint:
+            if self.journal.stages:
+                WorkflowJournal.logger.info(f"Workflow inputs changed for {company} {job_title}, starting over")
+            self.journal = WorkflowJournalModel(company=company, job_title=job_title, inputs_fingerprint=inputs_fingerprint)
+            self._save()
+
+    def _load(self, company: str, job_title: str) -> WorkflowJournalModel:
+        if self.journal_path.is_file():
+            try:
+                return WorkflowJournalModel.model_validate_json(self.journal_path.read_text())
+            except (OSError, ValidationError) as e:
+                WorkflowJournal.logger.warning(f"Workflow journal is unreadable, starting a new one: {e}")
+        return WorkflowJournalModel(company=company, job_title=job_title)
+
+    def _save(self) -> None:
+        FileUtils.write_text_atomic(self.journal_path, self.journal.model_dump_json(indent=2))
+
+    def _to_journal_path(self, path_to_file: Path) -> str:
+        """Artifacts inside the output folder are stored relative to it, so the folder can be moved."""
+        path_to_file = Path(path_to_file).resolve()
+        try:
+            return str(path_to_file.relative_to(self.journal_path.parent.resolve()))
+        except ValueError:
+            return str(path_to_file)
+
+    def _from_journal_path(self, stored_path: str) -> Path:
+        path_to_file = Path(stored_path)
+        return path_to_file if path_to_file.is_absolute() else self.journal_path.parent / path_to_file
+
+    def get_record(self, stage: WorkflowStage) -> Optional[StageRecord]:
+        return self.journal.stages.get(stage)
+
+    def get_artifact_paths(self, stage: WorkflowStage) -> list[Path]:
+        record = self.get_record(stage)
+        return [self._from_journal_path(stored_path) for stored_path in record.artifacts] if record else []
+
+    def is_completed(self, stage: WorkflowStage) -> bool:
+        record = self.get_record(stage)
+        if not record:
+            return False
+        for stored_path, expected_hash in record.artifacts.items():
+            path_to_file = self._from_journal_path(stored_path)
+            if not path_to_file.is_file() or HashUtils.sha256_file(path_to_file) != expected_hash:
+                WorkflowJournal.logger.info(f"Stage '{stage.value}' has to be redone: {path_to_file} is missing or changed")
+                return False
+        return True
+
+    def complete(self, stage: WorkflowStage, artifacts: list[Path], **metadata: Any) -> StageRecord:
+        """Record stage as completed with its artifacts, and drop the records of every later stage."""
+        record = StageRecord(
+            stage=stage,
+            artifacts={self._to_journal_path(path_to_file): HashUtils.sha256_file(path_to_file) for path_to_file in artifacts},
+            metadata=metadata
+        )
+        later_stages = self.STAGE_ORDER[self.STAGE_ORDER.index(stage) + 1:]
+        self.journal.stages = {s: r for s, r in self.journal.stages.items() if s not in later_stages}
+        self.journal.stages[stage] = record
+        self._save()
+        WorkflowJournal.logger.info(f"Stage '{stage.value}' completed")
+        return record
@@ -1,34 +1,80 @@
-from core.parsing.resume_parser import ResumeParser
+from core.parsing.resume_parse_cache import ResumeParseCache
 from core.services.config.config_manager import ConfigManager
 from core.jobscan.scraper import JobscanScraper
 from core.utils.log_helper import LogHelper
-from core.parsing.parsing_utils import JobParserUtils, ResumeParserUtils
+from core.parsing.parsing_utils import JobParserUtils
 import core.utils.paths as path_utils
 from core.services.cv.cv_tailor import TailorAIService
+from core.services.cv.models.enums import TailoringMode
+from core.services.cv.section_tailoring import SectionTailoringService
 from core.exporting.resume_exporter import ResumeExporter
+from core.jobscan.ats_estimator import AtsKeywordEstimator
+from core.parsing.models.resume import TailoredResumeLite
+from core.utils.helpers import HashUtils
+from core.workflow.models.workflow_journal import WorkflowStage
+from core.workflow.workflow_journal import WorkflowJournal
 
 
 logger = LogHelper(__name__)
 config = ConfigManager()
-if not path_utils.get_parsed_resume_file_path().is_file():
-    resume_parser = ResumeParser(path_utils.get_original_resume_file_path())
-    resume = resume_parser.parse()
-    resume.write_to_file()
-else:
-    resume = ResumeParserUtils.parse_resume(path_utils.get_parsed_resume_file_path())
+resume_parse_cache = ResumeParseCache()
+resume, changed_sections = resume_parse_cache.get_or_parse(path_utils.get_original_resume_file_path())
+logger.info(f"Resume sections changed since the previous parse: {sorted(section.value for section in changed_sections) or 'none'}")
 job_details = JobParserUtils.parse_job_details(path_utils.get_job_to_target_file_path())
 jobscan_scraper = JobscanScraper(config.settings.jobscan, config.settings.playwright, config.settings.resume, job_details)
-match_report, session, match_report_page = jobscan_scraper.run_tailoring(keep_session_open=True) #"Delart_HW Test Automation Engineer/match_report_1.json"
-
-tailor_ai_service = TailorAIService(job_details)
-tailored_resume = tailor_ai_service.tailor_cv(resume, match_report.get_keywords_to_prompt())
-tailored_resume_json_path = tailored_resume.write_to_json_file(job_details.company, job_details.title)
-exporter = ResumeExporter()
-tailored_resume_docx_path = exporter.export(tailored_resume, job_details.company, job_details.title)
-exporter.docx_to_pdf(tailored_resume_docx_path)
-
-if not match_report.iteration:
-    error = "Match reports is missing iteration info"
-    logger.error(error)
-    raise ValueError(error)
-match_report, match_report_page = jobscan_scraper.rescan_resume(session, str(tailored_resume_docx_path), job_details, match_report_page, match_report.iteration + 1)
+
+# Stages already completed for this job (with unchanged artifacts) are skipped on restart
+inputs_fingerprint = HashUtils.sha256_text(HashUtils.sha256_file(path_utils.get_original_resume_file_path()), job_details.model_dump_json())
+journal = WorkflowJournal(job_details.company, job_details.title, inputs_fingerprint)
+
+session = None
+try:
+    if journal.is_completed(WorkflowStage.SCAN):
+        match_report_path = journal.get_artifact_paths(WorkflowStage.SCAN)[0]
+        logger.info(f"Reusing match report {match_report_path}")
+        keep_session_open = not journal.is_completed(WorkflowStage.RESCAN)
+        match_report, session, match_report_page = jobscan_scraper.run_tailoring(existing_match_report_path=str(match_report_path.resolve()), keep_session_open=keep_session_open)
+    else:
+        match_report, session, match_report_page = jobscan_scraper.run_tailoring(keep_session_open=True)
+        journal.complete(WorkflowStage.SCAN, [path_utils.get_jobscan_match_report_path(job_details.company, job_details.title, match_report.iteration)], iteration=match_report.iteration)
+
+    if journal.is_completed(WorkflowStage.TAILOR):
+        tailored_resume_json_path = journal.get_artifact_paths(WorkflowStage.TAILOR)[0]
+        tailored_resume = TailoredResumeLite.model_validate_json(tailored_resume_json_path.read_text())
+    else:
+        if config.settings.cv_tailor.tailoring_mode == TailoringMode.SECTIONS:
+            tailored_resume = SectionTailoringService(job_details).tailor_cv(resume, match_report.get_keywords_to_prompt())
+        else:
+            tailored_resume = TailorAIService(job_details).tailor(resume, match_report.get_keywords_to_prompt())
+        tailored_resume_json_path = tailored_resume.write_to_json_file(job_details.company, job_details.title)
+        journal.complete(WorkflowStage.TAILOR, [tailored_resume_json_path])
+
+    exporter = ResumeExporter()
+    if journal.is_completed(WorkflowStage.EXPORT_DOCX):
+        tailored_resume_docx_path = journal.get_artifact_paths(WorkflowStage.EXPORT_DOCX)[0]
+    else:
+        tailored_resume_docx_path = exporter.export(tailored_resume, job_details.company, job_details.title)
+        journal.complete(WorkflowStage.EXPORT_DOCX, [tailored_resume_docx_path])
+
+    if not journal.is_completed(WorkflowStage.EXPORT_PDF):
+        tailored_resume_pdf_path = exporter.docx_to_pdf(tailored_resume_docx_path)
+        journal.complete(WorkflowStage.EXPORT_PDF, [tailored_resume_pdf_path])
+
+    if not journal.is_completed(WorkflowStage.RESCAN):
+        if not match_report.iteration:
+            error = "Match reports is missing iteration info"
+            logger.error(error)
+            raise ValueError(error)
+        ats_estimator = AtsKeywordEstimator(config.settings.resume)
+        # Jobscan rescans the exported docx, which has the education and professional development of the original
+        tailored_full_resume = tailored_resume.to_full_resume(resume.header, resume.education, resume.professional_development_list)
+        predicted_match_report = ats_estimator.estimate(tailored_full_resume, match_report, iteration=match_report.iteration + 1, baseline_resume=resume)
+        logger.info(f"Heuristic match rate estimate before rescan (keyword coverage only, not a Jobscan score): {predicted_match_report.score}")
+        match_report, match_report_page = jobscan_scraper.rescan_resume(session, str(tailored_resume_docx_path), job_details, match_report_page, match_report.iteration + 1)
+        journal.complete(WorkflowStage.RESCAN, [path_utils.get_jobscan_match_report_path(job_details.company, job_details.title, match_report.iteration)], iteration=match_report.iteration)
+    else:
+        logger.info(f"All workflow stages are completed for {job_details.company} {job_details.title}")
+finally:
+    # Returns the context to the pool; a recorded session's HAR is written when its context closes
+    if session:
+        session.close()
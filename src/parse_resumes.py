@@ -0,0 +1,17 @@
+import argparse
+from pathlib import Path
+from core.parsing.batch_resume_parser import BatchResumeParser
+
+
+# Everything stays under the main guard: worker processes may re-import this module
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Parse a directory or glob of resumes in parallel.")
+    arg_parser.add_argument("source", help="Directory of resumes or a glob pattern, e.g. 'data/resumes/original/*.docx'")
+    arg_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (defaults to batch_parsing.max_workers)")
+    arg_parser.add_argument("--output-dir", type=Path, default=None, help="Directory for per-resume JSON and the batch summary")
+    args = arg_parser.parse_args()
+
+    batch_resume_parser = BatchResumeParser(max_workers=args.workers, output_dir=args.output_dir)
+    summary = batch_resume_parser.parse(args.source)
+    if summary.failures:
+        raise SystemExit(1)
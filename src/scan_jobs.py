@@ -0,0 +1,21 @@
+import argparse
+import asyncio
+from pathlib import Path
+from core.jobscan.aio.scraper import AsyncJobscanScraper
+from core.parsing.parsing_utils import JobParserUtils
+from core.services.config.config_manager import ConfigManager
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Scan one resume against several jobs concurrently.")
+    arg_parser.add_argument("jobs", nargs="+", type=Path, help="Job details JSON files, in the same format as the job to target")
+    arg_parser.add_argument("--resume", default=None, help="Resume to scan (defaults to the original resume)")
+    arg_parser.add_argument("--concurrency", type=int, default=None, help="Jobs scanned at once (defaults to jobscan.max_concurrent_scans)")
+    args = arg_parser.parse_args()
+
+    config = ConfigManager()
+    jobs = [JobParserUtils.parse_job_details(path) for path in args.jobs]
+    scraper = AsyncJobscanScraper(config.settings.jobscan, config.settings.playwright, config.settings.resume, max_concurrent_scans=args.concurrency)
+    results = asyncio.run(scraper.scan_jobs(jobs, args.resume))
+    if any(result.error for result in results):
+        raise SystemExit(1)
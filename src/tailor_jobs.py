@@ -0,0 +1,45 @@
+import argparse
+import asyncio
+from pathlib import Path
+from core.parsing.parsing_utils import JobParserUtils, MatchReportParserUtils
+from core.parsing.resume_parse_cache import ResumeParseCache
+from core.services.cv.async_cv_tailor import AsyncTailorAIService, TailoringJob
+from core.utils.log_helper import LogHelper
+import core.utils.paths as path_utils
+
+
+logger = LogHelper(__name__)
+
+
+async def tailor_jobs(jobs: list[TailoringJob], concurrency: int | None, bypass_cache: bool) -> int:
+    tailor_ai_service = AsyncTailorAIService(max_concurrent_requests=concurrency)
+    failures = 0
+    try:
+        async for result in tailor_ai_service.tailor_many(jobs, bypass_cache=bypass_cache):
+            job_details = result.job.job_details
+            if result.error:
+                failures += 1
+                continue
+            tailored_resume_json_path = result.tailored_resume.write_to_json_file(job_details.company, job_details.title)
+            logger.info(f"Tailored resume for {job_details.company} {job_details.title} in {result.duration_seconds:.1f}s: {tailored_resume_json_path}")
+    finally:
+        await tailor_ai_service.close()
+    return failures
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Tailor the original resume for several scanned jobs concurrently.")
+    arg_parser.add_argument("jobs", nargs="+", type=Path, help="Job details JSON files, already scanned (e.g. with scan_jobs.py)")
+    arg_parser.add_argument("--iteration", type=int, default=1, help="Match report iteration to take the keywords from")
+    arg_parser.add_argument("--concurrency", type=int, default=None, help="Requests in flight at once (defaults to cv_tailor.max_concurrent_requests)")
+    arg_parser.add_argument("--bypass-cache", action="store_true", help="Always request OpenAI, refreshing cached responses")
+    args = arg_parser.parse_args()
+
+    resume, _ = ResumeParseCache().get_or_parse(path_utils.get_original_resume_file_path())
+    jobs = []
+    for path in args.jobs:
+        job_details = JobParserUtils.parse_job_details(path)
+        match_report = MatchReportParserUtils.parse_match_report(path_utils.get_jobscan_match_report_path(job_details.company, job_details.title, args.iteration))
+        jobs.append(TailoringJob(resume=resume, keyword_statistics=match_report.get_keywords_to_prompt(), job_details=job_details))
+    if asyncio.run(tailor_jobs(jobs, args.concurrency, args.bypass_cache)):
+        raise SystemExit(1)
@@ -0,0 +1,64 @@
+import pytest
+from core.jobscan.ats_estimator import AtsKeywordEstimator
+from core.jobscan.models.enums import SkillApplianceType, SkillType
+from core.jobscan.models.jobscan_match_report import JobscanMatchReport, Skill
+from core.parsing.models.resume import Degree, Education, Header, ProfessionalExperience, ProfessionalSummary, Resume, TailoredResumeLite
+from core.services.config.config_manager import ConfigManager
+
+
+@pytest.fixture
+def estimator() -> AtsKeywordEstimator:
+    return AtsKeywordEstimator(ConfigManager().settings.resume)
+
+
+@pytest.fixture
+def resume() -> Resume:
+    # 'Computer Science' and 'Leadership' only appear in the sections a lite resume does not have
+    return Resume(
+        header=Header(name="Jane Doe"),
+        professional_summary=ProfessionalSummary(summary="SDET with Python experience."),
+        technical_skills=["Python", "SQL"],
+        professional_experience_list=[ProfessionalExperience(position="SDET", company="Acme", bullets=["Wrote Python tests"])],
+        education=Education(university="State University", degree_list=[Degree(degree="BSc", field_of_study="Computer Science")]),
+        professional_development_list=["Leadership course"]
+    )
+
+
+@pytest.fixture
+def previous_report() -> JobscanMatchReport:
+    skills = [
+        Skill(name="Python", type=SkillType.HARD_SKILL, required_quantity=3, actual_quantity=3),
+        Skill(name="Computer Science", type=SkillType.HARD_SKILL, required_quantity=1, actual_quantity=1),
+        Skill(name="Kubernetes", type=SkillType.HARD_SKILL, required_quantity=2, actual_quantity=0),
+    ]
+    return JobscanMatchReport(
+        job_title="SDET", company="Globex", iteration=1, score=60,
+        hard_skills={SkillApplianceType.APPLIED: skills[:2], SkillApplianceType.MISSING: skills[2:]},
+        soft_skills={SkillApplianceType.APPLIED: [Skill(name="Leadership", type=SkillType.SOFT_SKILL, required_quantity=1, actual_quantity=1)], SkillApplianceType.MISSING: []}
+    )
+
+
+def unchanged_tailored_resume(resume: Resume) -> TailoredResumeLite:
+    return TailoredResumeLite(**resume.get_lite_version().model_dump())
+
+
+def test_unchanged_resume_keeps_the_previous_score(estimator, resume, previous_report):
+    tailored_resume = unchanged_tailored_resume(resume)
+    full_tailored_resume = tailored_resume.to_full_resume(resume.header, resume.education, resume.professional_development_list)
+
+    assert estimator.estimate(full_tailored_resume, previous_report, baseline_resume=resume).score == 60
+    # A lite resume against a full baseline is compared on the same sections
+    assert estimator.estimate(tailored_resume, previous_report, baseline_resume=resume).score == 60
+
+
+def test_added_skill_occurrences_raise_the_score(estimator, resume, previous_report):
+    tailored_resume = unchanged_tailored_resume(resume)
+    tailored_resume.technical_skills = tailored_resume.technical_skills + ["Kubernetes"]
+    tailored_resume.professional_experience_list[0].bullets.append("Deployed to Kubernetes")
+    full_tailored_resume = tailored_resume.to_full_resume(resume.header, resume.education, resume.professional_development_list)
+
+    estimated_report = estimator.estimate(full_tailored_resume, previous_report, iteration=2, baseline_resume=resume)
+
+    assert estimated_report.score > 60
+    assert estimated_report.iteration == 2
+    assert [skill.name for skill in estimated_report.hard_skills[SkillApplianceType.MISSING]] == []
@@ -0,0 +1,38 @@
+import pytest
+from pydantic import ValidationError
+from core.jobscan.models.enums import SkillType
+from core.services.openai.models.prompt_instructions import Keyword, KeywordStatistics, KeywordStatus
+
+
+def keyword(name: str, status: KeywordStatus) -> Keyword:
+    return Keyword(name=name, status=status, actual_quantity=0, required_quantity=1, min_final_quantity=0, quantity_to_add=1)
+
+
+@pytest.fixture
+def keyword_statistics() -> KeywordStatistics:
+    return KeywordStatistics(keywords={
+        SkillType.HARD_SKILL: [keyword("Python", KeywordStatus.NEEDS_INTEGRATION)],
+        SkillType.SOFT_SKILL: [keyword("Teamwork", KeywordStatus.NEEDS_INTEGRATION)]
+    })
+
+
+def test_returned_buckets_are_copies_of_the_cached_ones(keyword_statistics):
+    prompt_json = keyword_statistics.get_prompt_json()
+
+    keyword_statistics.get_keywords_to_integrate()[SkillType.HARD_SKILL].append(keyword("Java", KeywordStatus.NEEDS_INTEGRATION))
+
+    assert [k.name for k in keyword_statistics.get_keywords_to_integrate()[SkillType.HARD_SKILL]] == ["Python"]
+    assert keyword_statistics.get_prompt_json() == prompt_json
+
+
+def test_keywords_cannot_be_changed_in_place(keyword_statistics):
+    with pytest.raises(ValidationError):
+        keyword_statistics.get_keyword("python").quantity_to_add = 5
+
+
+def test_copy_shares_the_index_but_not_the_keyword_lists(keyword_statistics):
+    statistics_copy = keyword_statistics.copy_with_index()
+    statistics_copy.keywords[SkillType.HARD_SKILL].append(keyword("Java", KeywordStatus.NEEDS_INTEGRATION))
+
+    assert statistics_copy.index is keyword_statistics.index
+    assert [k.name for k in keyword_statistics.keywords[SkillType.HARD_SKILL]] == ["Python"]
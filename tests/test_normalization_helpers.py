@@ -0,0 +1,33 @@
+import pytest
+from core.utils.normalization_helpers import NormalizationUtils, SkillWhitelistIndex
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Unit-Tests", "unit test"),
+    ("unit test's", "unit test"),
+    ("Technologies", "technology"),
+    ("Processes", "process"),
+    ("Batches", "batch"),
+    ("Spring", "spring"),
+    ("Springs", "spring"),
+    ("Marketing", "marketing"),
+    ("Markets", "market"),
+    ("C#", "c#"),
+])
+def test_normalize_skill_name_only_folds_plurals_and_possessives(name, expected):
+    assert NormalizationUtils.normalize_skill_name(name) == expected
+
+
+@pytest.mark.parametrize("name", ["Markets", "Accounts", "Market", "Account"])
+def test_whitelist_does_not_merge_different_skills(name):
+    assert name not in SkillWhitelistIndex(["Marketing", "Accounting"])
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("continuous integration", "continuous integration"),
+    ("Continuous-Integrations", "Continuous Integration"),
+    ("accounting", "accounting"),
+])
+def test_whitelist_matches_exact_and_plural_spellings(name, expected):
+    whitelist = SkillWhitelistIndex(["Continuous Integration", "Accounting"])
+    assert whitelist.match(name) == expected
@@ -0,0 +1,108 @@
+import pytest
+from core.parsing.models.resume import ProfessionalExperience, ProfessionalSummary, ResumeLite
+from core.services.cv.resume_patcher import ResumePatchError, ResumePatcher
+from core.services.openai.models.tailoring_patch import PatchOperation, PatchOperationType, TailoringPatch
+
+
+REPLACE, INSERT, DELETE = PatchOperationType.REPLACE, PatchOperationType.INSERT, PatchOperationType.DELETE
+
+
+@pytest.fixture
+def resume_lite() -> ResumeLite:
+    return ResumeLite(
+        professional_summary=ProfessionalSummary(summary="QA engineer", highlights=["h1", "h2"]),
+        technical_skills=["Python", "SQL"],
+        professional_experience_list=[
+            ProfessionalExperience(position="SDET", company="Acme", bullets=["a1", "a2", "a3"]),
+            ProfessionalExperience(position="QA", company="Globex", bullets=["b1"])
+        ]
+    )
+
+
+def apply(resume_lite: ResumeLite, *operations: tuple) -> ResumeLite:
+    patch = TailoringPatch(operations=[PatchOperation(op=op, id=element_id, text=text) for op, element_id, text in operations])
+    return ResumePatcher.apply(resume_lite, patch)
+
+
+def test_identified_resume_addresses_every_editable_element(resume_lite):
+    identified_resume = ResumePatcher.build_identified_resume(resume_lite)
+
+    assert identified_resume["professional_summary"] == {"S": "QA engineer", "highlights": {"H1": "h1", "H2": "h2"}}
+    assert identified_resume["technical_skills"] == {"K1": "Python", "K2": "SQL"}
+    assert identified_resume["professional_experience_list"][1] == {"id": "E2", "position": "QA", "company": "Globex", "bullets": {"E2.B1": "b1"}}
+
+
+def test_empty_patch_returns_the_original_content(resume_lite):
+    tailored_resume = ResumePatcher.apply(resume_lite, TailoringPatch())
+
+    assert tailored_resume.model_dump(include={"professional_summary", "technical_skills", "professional_experience_list"}) == resume_lite.model_dump()
+
+
+def test_operations_refer_to_original_positions_in_any_order(resume_lite):
+    tailored_resume = apply(
+        resume_lite,
+        (DELETE, "E1.B1", None),
+        (INSERT, "E1.B0", "a0"),
+        (REPLACE, "E1.B3", "a3'"),
+        (INSERT, "E1.B1", "after a1"),
+        (INSERT, "K2", "Playwright"),
+        (REPLACE, "S", "SDET with CI"),
+        (DELETE, "H2", None)
+    )
+
+    assert tailored_resume.professional_experience_list[0].bullets == ["a0", "after a1", "a2", "a3'"]
+    assert tailored_resume.professional_experience_list[0].company == "Acme"
+    assert tailored_resume.professional_experience_list[1].bullets == ["b1"]
+    assert tailored_resume.technical_skills == ["Python", "SQL", "Playwright"]
+    assert tailored_resume.professional_summary.summary == "SDET with CI"
+    assert tailored_resume.professional_summary.highlights == ["h1"]
+
+
+def test_several_inserts_after_the_same_element_keep_their_order(resume_lite):
+    tailored_resume = apply(resume_lite, (INSERT, "H1", "x"), (INSERT, "H1", "y"))
+
+    assert tailored_resume.professional_summary.highlights == ["h1", "x", "y", "h2"]
+
+
+def test_patch_notes_and_coverage_are_carried_over(resume_lite):
+    patch = TailoringPatch(adjustment_notes=["note"], keyword_coverage={
+        "Python": {"required": 1, "before": 1, "after": 1, "min_final": 1, "added": 0, "status": "met"}
+    })
+
+    tailored_resume = ResumePatcher.apply(resume_lite, patch)
+
+    assert tailored_resume.adjustment_notes == ["note"]
+    assert tailored_resume.keyword_coverage["Python"].status == "met"
+
+
+@pytest.mark.parametrize("operations", [
+    [(REPLACE, "H3", "x")],
+    [(DELETE, "K0", None)],
+    [(REPLACE, "E3.B1", "x")],
+    [(INSERT, "E1.B4", "x")],
+    [(REPLACE, "X1", "x")],
+])
+def test_unknown_ids_are_rejected(resume_lite, operations):
+    with pytest.raises(ResumePatchError, match="Unknown resume element id"):
+        apply(resume_lite, *operations)
+
+
+@pytest.mark.parametrize("operations", [
+    [(DELETE, "H1", None), (REPLACE, "H1", "x")],
+    [(DELETE, "H1", None), (REPLACE, "H01", "x")],
+    [(REPLACE, "E1.B2", "x"), (REPLACE, "E01.B002", "y")],
+    [(REPLACE, "S", "x"), (REPLACE, "S", "y")],
+])
+def test_conflicting_edits_of_the_same_element_are_rejected(resume_lite, operations):
+    with pytest.raises(ResumePatchError, match="Conflicting operations"):
+        apply(resume_lite, *operations)
+
+
+def test_summary_can_only_be_replaced(resume_lite):
+    with pytest.raises(ResumePatchError, match="can only be replaced"):
+        apply(resume_lite, (DELETE, "S", None))
+
+
+def test_operations_other_than_delete_need_a_text(resume_lite):
+    with pytest.raises(ResumePatchError, match="has no text"):
+        apply(resume_lite, (REPLACE, "K1", None))
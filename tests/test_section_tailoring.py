@@ -0,0 +1,189 @@
+import asyncio
+from collections import Counter
+import pytest
+from core.jobscan.models.enums import SkillType
+from core.parsing.models.job_to_target import JobDetails
+from core.parsing.models.resume import ProfessionalExperience, ProfessionalSummary, ResumeLite, TailoredResumeLite
+from core.services.cv import section_tailoring
+from core.services.cv.async_cv_tailor import TailoringResult
+from core.services.cv.models.enums import TailoringSectionType
+from core.services.cv.section_tailoring import SectionTailoringService
+from core.services.openai.models.prompt_instructions import Keyword, KeywordStatistics, KeywordStatus
+
+
+SOFT_SKILLS = ["teamwork", "mentoring", "ownership", "curiosity", "empathy", "initiative"]
+
+
+@pytest.fixture
+def resume_lite() -> ResumeLite:
+    return ResumeLite(
+        professional_summary=ProfessionalSummary(summary="Test engineer.", highlights=["Shipped releases"]),
+        technical_skills=["Python", "SQL"],
+        professional_experience_list=[
+            ProfessionalExperience(position="SDET", company=f"Company {i}", bullets=["Wrote Python tests" if i == 1 else "Wrote tests"])
+            for i in range(1, 5)
+        ]
+    )
+
+
+@pytest.fixture
+def service() -> SectionTailoringService:
+    return SectionTailoringService(JobDetails(url="", title="SDET", company="Acme", description_details=[]))
+
+
+def keyword(name: str, status: KeywordStatus, actual: int = 0, min_final: int = 0, to_add: int = 0) -> Keyword:
+    return Keyword(name=name, status=status, actual_quantity=actual, required_quantity=min_final + to_add, min_final_quantity=min_final, quantity_to_add=to_add)
+
+
+@pytest.fixture
+def keyword_statistics() -> KeywordStatistics:
+    return KeywordStatistics(keywords={
+        SkillType.HARD_SKILL: [keyword("Python", KeywordStatus.MUST_KEEP, actual=2, min_final=2)],
+        SkillType.SOFT_SKILL: [keyword(name, KeywordStatus.NEEDS_INTEGRATION, to_add=1) for name in SOFT_SKILLS]
+    })
+
+
+def get_section_keyword(section, name: str):
+    return next((keyword for keywords in section.keyword_statistics.keywords.values() for keyword in keywords if keyword.name == name), None)
+
+
+def get_additions(sections) -> Counter:
+    return Counter({
+        section.name: sum(keyword.quantity_to_add for keywords in section.keyword_statistics.keywords.values() for keyword in keywords)
+        for section in sections
+    })
+
+
+def test_single_additions_rotate_over_sections_instead_of_piling_on_the_summary(service, resume_lite, keyword_statistics):
+    sections = service.split(resume_lite)
+    service.allocate_keywords(sections, keyword_statistics)
+
+    additions = get_additions(sections)
+    assert additions["skills"] == 0
+    non_skill_sections = [section.name for section in sections if section.section_type != TailoringSectionType.SKILLS]
+    # 6 additions over the summary and 4 experiences: everyone gets one, nobody more than two
+    assert all(1 <= additions[name] <= 2 for name in non_skill_sections)
+    assert sum(additions.values()) == len(SOFT_SKILLS)
+
+
+def test_rotation_continues_across_keywords_with_several_additions(service, resume_lite):
+    sections = service.split(resume_lite)
+    service.allocate_keywords(sections, KeywordStatistics(keywords={
+        SkillType.HARD_SKILL: [keyword("Playwright", KeywordStatus.NEEDS_INTEGRATION, to_add=3), keyword("Docker", KeywordStatus.NEEDS_INTEGRATION, to_add=3)],
+        SkillType.SOFT_SKILL: []
+    }))
+
+    # A missing hard skill goes to the skill list once; the rest is spread over the other sections
+    assert get_section_keyword(sections[1], "Playwright").quantity_to_add == 1
+    assert get_section_keyword(sections[1], "Docker").quantity_to_add == 1
+    additions = get_additions(sections)
+    assert additions.pop("skills") == 2
+    # Docker's remaining additions continue after the sections Playwright's went to
+    assert sorted(additions.values()) == [0, 1, 1, 1, 1]
+
+
+def test_occurrences_to_keep_stay_with_the_sections_that_have_them(service, resume_lite, keyword_statistics):
+    sections = service.split(resume_lite)
+    service.allocate_keywords(sections, keyword_statistics)
+
+    kept = {section.name: get_section_keyword(section, "Python").min_final_quantity for section in sections if get_section_keyword(section, "Python")}
+    assert kept == {"skills": 1, "experience 1 (Company 1)": 1}
+
+
+def test_sections_with_only_occurrences_to_keep_have_no_keyword_work(service, resume_lite):
+    sections = service.split(resume_lite)
+    service.allocate_keywords(sections, KeywordStatistics(keywords={
+        SkillType.HARD_SKILL: [keyword("Python", KeywordStatus.MUST_KEEP, actual=2, min_final=2)],
+        SkillType.SOFT_SKILL: [keyword("SQL", KeywordStatus.DO_NOT_ADD, actual=1)]
+    }))
+
+    assert not any(section.has_keyword_work for section in sections)
+
+
+class FakeAsyncTailorAIService:
+    """Adds every keyword a section has to add once, and fails the sections in fail_first_attempt once."""
+    fail_first_attempt: set[str] = set()
+    instances: list["FakeAsyncTailorAIService"] = []
+
+    def __init__(self, max_concurrent_requests=None):
+        self.max_concurrent_requests = max_concurrent_requests
+        self.prompt_instructions = type("Prompt", (), {"get_section_task_instructions": lambda self: "section task"})()
+        self.requests: list[tuple[str, bool]] = []
+        FakeAsyncTailorAIService.instances.append(self)
+
+    async def tailor_many(self, jobs, bypass_cache=False):
+        for job in jobs:
+            resume = job.resume
+            name = resume.professional_experience_list[0].company if resume.professional_experience_list else "skills" if resume.technical_skills else "summary"
+            self.requests.append((name, bypass_cache))
+            if name in self.fail_first_attempt and not bypass_cache:
+                yield TailoringResult(job=job, error="invalid JSON")
+                continue
+            additions = [keyword.name for keywords in job.keyword_statistics.keywords.values() for keyword in keywords for _ in range(keyword.quantity_to_add)]
+            tailored = TailoredResumeLite(**resume.model_dump(), adjustment_notes=[f"added {', '.join(additions)}"])
+            if tailored.professional_experience_list:
+                tailored.professional_experience_list[0].bullets.append(" and ".join(additions))
+            elif name == "skills":
+                tailored.technical_skills.extend(additions)
+            else:
+                tailored.professional_summary.summary += " " + " and ".join(additions)
+            yield TailoringResult(job=job, tailored_resume=tailored)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_tailor_ai_service(monkeypatch):
+    FakeAsyncTailorAIService.instances = []
+    FakeAsyncTailorAIService.fail_first_attempt = set()
+    monkeypatch.setattr(section_tailoring, "AsyncTailorAIService", FakeAsyncTailorAIService)
+    return FakeAsyncTailorAIService
+
+
+def test_only_sections_with_additions_are_requested_and_failed_ones_retried_alone(service, resume_lite, keyword_statistics, fake_tailor_ai_service):
+    fake_tailor_ai_service.fail_first_attempt = {"Company 2"}
+
+    tailored_resume = asyncio.run(service.tailor_sections(resume_lite, keyword_statistics))
+
+    requests = fake_tailor_ai_service.instances[0].requests
+    assert "skills" not in [name for name, _ in requests]
+    assert Counter(name for name, _ in requests)["Company 2"] == 2
+    assert [name for name, bypass_cache in requests if bypass_cache] == ["Company 2"]
+    # The configured concurrency applies unless the caller overrides it
+    assert fake_tailor_ai_service.instances[0].max_concurrent_requests is None
+
+    assert tailored_resume.technical_skills == resume_lite.technical_skills
+    for name in SOFT_SKILLS:
+        assert tailored_resume.keyword_coverage[name].status == "met"
+        assert tailored_resume.keyword_coverage[name].added == 1
+    # Occurrences to keep are checked on the merged resume
+    python_coverage = tailored_resume.keyword_coverage["Python"]
+    assert (python_coverage.status, python_coverage.after_adjustment, python_coverage.added) == ("met", 2, 0)
+
+
+def test_keep_only_keywords_need_no_request(service, resume_lite, fake_tailor_ai_service):
+    keyword_statistics = KeywordStatistics(keywords={
+        SkillType.HARD_SKILL: [keyword("Python", KeywordStatus.MUST_KEEP, actual=2, min_final=2)],
+        SkillType.SOFT_SKILL: []
+    })
+
+    tailored_resume = asyncio.run(service.tailor_sections(resume_lite, keyword_statistics))
+
+    assert fake_tailor_ai_service.instances == []
+    assert tailored_resume.keyword_coverage["Python"].status == "met"
+
+
+def test_sections_that_keep_failing_keep_their_original_content(service, resume_lite, fake_tailor_ai_service, monkeypatch):
+    monkeypatch.setattr(service, "max_attempts", 1)
+    fake_tailor_ai_service.fail_first_attempt = {"summary"}
+    keyword_statistics = KeywordStatistics(keywords={
+        SkillType.HARD_SKILL: [],
+        SkillType.SOFT_SKILL: [keyword("teamwork", KeywordStatus.NEEDS_INTEGRATION, to_add=1)]
+    })
+
+    tailored_resume = asyncio.run(service.tailor_sections(resume_lite, keyword_statistics))
+
+    assert tailored_resume.professional_summary == resume_lite.professional_summary
+    assert tailored_resume.keyword_coverage["teamwork"].status == "not met"
+    assert "Sections kept unchanged after failed tailoring: summary" in tailored_resume.adjustment_notes
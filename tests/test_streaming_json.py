@@ -0,0 +1,84 @@
+import json
+import pytest
+from core.services.openai.streaming_json import IncrementalJsonScanner
+from core.services.cv.streaming_resume_validator import StreamingSchemaViolation, StreamingTailoredResumeValidator
+
+
+TAILORED_RESUME = {
+    "professional_summary": {"summary": "QA engineer {not a brace}", "highlights": ["Built \"CI\" [pipelines]"]},
+    "technical_skills": ["Python", "Playwright"],
+    "professional_experience_list": [
+        {"position": "SDET", "company": "Acme", "bullets": ["Automated tests\\n", "Cut flakiness"]},
+        {"position": "QA", "company": "Globex", "bullets": []}
+    ],
+    "adjustment_notes": [],
+    "keyword_coverage": {
+        "Python": {"required": 2, "before": 1, "after": 2, "min_final": 1, "added": 1, "status": "met"}
+    }
+}
+
+
+def feed_in_chunks(feed, text: str, chunk_size: int) -> list:
+    completed = []
+    for start in range(0, len(text), chunk_size):
+        completed.extend(feed(text[start:start + chunk_size]))
+    return completed
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 10_000])
+def test_scanner_reports_every_container_with_its_path_regardless_of_chunking(chunk_size):
+    document = json.dumps(TAILORED_RESUME)
+    completed = feed_in_chunks(IncrementalJsonScanner().feed, document, chunk_size)
+
+    by_path = {path: json.loads(raw) for path, raw in completed}
+    assert by_path[("professional_experience_list", 0)] == TAILORED_RESUME["professional_experience_list"][0]
+    assert by_path[("professional_experience_list", 1, "bullets")] == []
+    assert by_path[("keyword_coverage", "Python")] == TAILORED_RESUME["keyword_coverage"]["Python"]
+    assert by_path[("professional_summary", "highlights")] == ['Built "CI" [pipelines]']
+    assert by_path[()] == TAILORED_RESUME
+    # Innermost containers complete first, the document itself last
+    paths = [path for path, _ in completed]
+    assert paths[-1] == ()
+    assert paths.index(("professional_experience_list", 0, "bullets")) < paths.index(("professional_experience_list", 0))
+
+
+def test_scanner_reports_nothing_until_a_container_closes():
+    scanner = IncrementalJsonScanner()
+    assert scanner.feed('{"technical_skills": ["Python", "Play') == []
+    assert scanner.feed('wright"]') == [(("technical_skills",), '["Python", "Playwright"]')]
+
+
+def test_validator_accepts_a_valid_stream():
+    validator = StreamingTailoredResumeValidator()
+    document = json.dumps(TAILORED_RESUME)
+    for start in range(0, len(document), 5):
+        validator.feed(document[start:start + 5])
+
+    tailored_resume = validator.finish()
+    assert tailored_resume.professional_experience_list[1].company == "Globex"
+    assert validator.stats.validated_experiences == 2
+    assert validator.stats.validated_keyword_coverages == 1
+    assert validator.stats.first_section == "professional_summary"
+
+
+def test_validator_fails_on_the_first_invalid_experience_before_the_document_ends():
+    validator = StreamingTailoredResumeValidator()
+    validator.feed('{"professional_summary": {"summary": "x"}, "professional_experience_list": [')
+    with pytest.raises(StreamingSchemaViolation) as error:
+        validator.feed('{"position": "SDET", "bullets": "not a list"}, ')
+    assert error.value.path == ("professional_experience_list", 0)
+
+
+def test_validator_fails_on_an_invalid_keyword_coverage_status():
+    validator = StreamingTailoredResumeValidator()
+    validator.feed('{"keyword_coverage": {"Python": ')
+    with pytest.raises(StreamingSchemaViolation) as error:
+        validator.feed('{"required": 1, "before": 0, "after": 1, "min_final": 0, "added": 1, "status": "almost"}')
+    assert error.value.path == ("keyword_coverage", "Python")
+
+
+def test_validator_fails_on_an_invalid_top_level_section():
+    validator = StreamingTailoredResumeValidator()
+    with pytest.raises(StreamingSchemaViolation) as error:
+        validator.feed('{"technical_skills": [["nested"]]')
+    assert error.value.path == ("technical_skills",)